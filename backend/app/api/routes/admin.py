@@ -1,11 +1,24 @@
-from fastapi import APIRouter, Depends, status
+import tempfile
+from datetime import date, datetime
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 
 from app.core.decorators import timed
-from app.core.deps import require_admin
-from app.db.session import get_db
-from app.services.tickets import update_status_service
+from app.core.hashing import hashing_pool
+from app.core.response_cache import ticket_list_cache
+from app.core.deps import get_read_db, require_admin
+from app.db.session import engine, get_db, pool_metrics
+from app.domain.enums import TicketPriority, TicketStatus
+from app.schemas.ticket import TicketStatsOut
+from app.services.stats import ticket_stats_service
+from app.services.ticket_export import MEDIA_TYPES, export_tickets_service
+from app.services.ticket_import import import_binary
+from app.services.tickets_list_service import TicketFilters
+from app.services.tickets import bulk_update_status_service, update_status_service
 
 STATUS_PATTERN = "^(OPEN|IN_PROGRESS|RESOLVED|CLOSED)$"
 
@@ -14,6 +27,41 @@ class StatusUpdate(BaseModel):
     status: str = Field(pattern=STATUS_PATTERN)
 
 
+class BulkStatusUpdate(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=5000)
+    status: str = Field(pattern=STATUS_PATTERN)
+
+
+class BulkStatusResult(BaseModel):
+    id: int
+    ok: bool
+    status: str | None = None
+    error: str | None = None
+
+
+class BulkStatusOut(BaseModel):
+    status: str
+    succeeded: int
+    results: list[BulkStatusResult]
+
+
+class ImportRowError(BaseModel):
+    line: int
+    message: str
+
+
+class ImportOut(BaseModel):
+    processed: int
+    tickets: int
+    replies: int
+    failed: int
+    # capped at the first 1000 failures; `failed` has the full count
+    errors: list[ImportRowError]
+
+
+# request bodies above this spill from memory to a temp file
+IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
 router = APIRouter()
 
 
@@ -32,3 +80,93 @@ def update_status_api(
         new_status=payload.status,
     )
     return {"id": updated.id, "status": updated.status}
+
+
+@router.post("/tickets/status:bulk", response_model=BulkStatusOut)
+@timed(logger_name="app.api", threshold_ms=250)
+def bulk_update_status_api(
+    payload: BulkStatusUpdate,
+    db: Session = Depends(get_db),
+    current_user=Depends(require_admin),
+):
+    results = bulk_update_status_service(
+        db=db,
+        ticket_ids=payload.ids,
+        current_user=current_user,
+        new_status=payload.status,
+    )
+    return BulkStatusOut(
+        status=payload.status,
+        succeeded=sum(1 for r in results if r["ok"]),
+        results=results,
+    )
+
+
+@router.post("/tickets/import", response_model=ImportOut)
+async def import_tickets_api(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    batch_size: int | None = Query(None, ge=1, le=10_000),
+    db: Session = Depends(get_db),
+    current_user=Depends(require_admin),
+):
+    # Stream the body to a spooled file as it arrives instead of reading it
+    # whole, then parse and insert batch by batch off the event loop.
+    with tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        report = await run_in_threadpool(import_binary, db, spool, format, batch_size)
+    return report
+
+
+@router.get("/tickets/export")
+def export_tickets_api(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    status_filter: TicketStatus | None = Query(None, alias="status"),
+    priority: TicketPriority | None = Query(None),
+    created_from: datetime | None = Query(None),
+    created_to: datetime | None = Query(None),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(require_admin),
+):
+    filters = TicketFilters(
+        status=status_filter,
+        priority=priority,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    chunks = export_tickets_service(db=db, current_user=current_user, filters=filters, fmt=format)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="tickets.{format}"'},
+    )
+
+
+@router.get("/stats", response_model=TicketStatsOut)
+@timed(logger_name="app.api", threshold_ms=80)
+def ticket_stats_api(
+    created_from: date | None = Query(None),
+    created_to: date | None = Query(None),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(require_admin),
+):
+    return ticket_stats_service(
+        db=db, current_user=current_user, day_from=created_from, day_to=created_to
+    )
+
+
+@router.get("/hashing/stats")
+def hashing_stats_api(current_user=Depends(require_admin)):
+    return hashing_pool.stats()
+
+
+@router.get("/cache/stats")
+def cache_stats_api(current_user=Depends(require_admin)):
+    return {ticket_list_cache.name: ticket_list_cache.stats()}
+
+
+@router.get("/db/pool")
+def pool_stats_api(current_user=Depends(require_admin)):
+    return pool_metrics.snapshot(engine)
@@ -0,0 +1,234 @@
+"""
+async def twins of the ticket, reply and admin-status routes, mounted ahead of
+the sync routers when settings.db_async is on. Same paths, schemas and
+status codes; only the session type differs.
+"""
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.admin import StatusUpdate
+from app.core.decorators import timed
+from app.core.deps import get_current_user_async, require_admin_async
+from app.core.response_cache import ticket_list_cache, ticket_list_scope
+from app.db.session import get_async_db
+from app.domain.enums import IncludeTotal, TicketPriority, TicketSort, TicketStatus
+from app.schemas.reply import ReplyCreate, ReplyListOut, ReplyOut
+from app.schemas.ticket import (
+    TicketBatchIn,
+    TicketBatchOut,
+    TicketCreate,
+    TicketListOut,
+    TicketOut,
+    TicketSearchHit,
+    TicketSearchOut,
+)
+from app.services.async_tickets import (
+    create_reply_service_async,
+    create_ticket_service_async,
+    get_ticket_if_modified_service_async,
+    get_tickets_batch_service_async,
+    list_replies_service_async,
+    list_tickets_service_async,
+    search_tickets_service_async,
+    update_status_service_async,
+)
+from app.services.tickets_list_service import TicketFilters, parse_ticket_ids
+from app.utils.etag import validator_headers
+from app.utils.pagination import normalize_pagination
+
+tickets_router = APIRouter()
+replies_router = APIRouter()
+admin_router = APIRouter()
+
+
+@tickets_router.post("", response_model=TicketOut, status_code=status.HTTP_201_CREATED)
+@timed(logger_name="app.api", threshold_ms=80)
+async def create_ticket_api(
+    payload: TicketCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    return await create_ticket_service_async(
+        db=db,
+        current_user=current_user,
+        subject=payload.subject,
+        description=payload.description,
+        priority=payload.priority,
+    )
+
+
+@tickets_router.get("", response_model=TicketListOut)
+@timed(logger_name="app.api", threshold_ms=120)
+async def list_tickets_api(
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=50),
+    status_filter: TicketStatus | None = Query(None, alias="status"),
+    priority: TicketPriority | None = Query(None),
+    created_from: datetime | None = Query(None),
+    created_to: datetime | None = Query(None),
+    cursor: str | None = Query(None, max_length=200),
+    include_total: IncludeTotal = Query(IncludeTotal.EXACT),
+    # validated against TicketSort by TicketFilters (unknown values are a 400)
+    sort: str = Query(TicketSort.NEWEST, max_length=20),
+):
+    pg = normalize_pagination(page, page_size)
+    filters = TicketFilters(
+        status=status_filter,
+        priority=priority,
+        created_from=created_from,
+        created_to=created_to,
+        sort=sort,
+    )
+
+    params = (pg.page, pg.page_size, filters, cursor, include_total)
+    key, cached = ticket_list_cache.lookup(ticket_list_scope(current_user), params)
+    if cached is not None:
+        return cached
+
+    items, total, next_cursor = await list_tickets_service_async(
+        db=db,
+        current_user=current_user,
+        page=pg,
+        filters=filters,
+        cursor=cursor,
+        include_total=include_total,
+    )
+    body = TicketListOut(
+        items=items,
+        page=pg.page,
+        page_size=pg.page_size,
+        total=total,
+        next_cursor=next_cursor,
+    ).model_dump(mode="json")
+    ticket_list_cache.store(key, body)
+    return body
+
+
+@tickets_router.get("/search", response_model=TicketSearchOut)
+@timed(logger_name="app.api", threshold_ms=150)
+async def search_tickets_api(
+    q: str = Query(..., min_length=1, max_length=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=50),
+):
+    pg = normalize_pagination(page, page_size)
+    hits, total = await search_tickets_service_async(db=db, current_user=current_user, q=q, page=pg)
+    return TicketSearchOut(
+        items=[TicketSearchHit.from_hit(ticket, score) for ticket, score in hits],
+        page=pg.page,
+        page_size=pg.page_size,
+        total=total,
+    )
+
+
+@tickets_router.get(":batch", response_model=TicketBatchOut)
+@timed(logger_name="app.api", threshold_ms=120)
+async def get_tickets_batch_api(
+    ids: str = Query(..., max_length=1000, description="comma-separated ticket ids"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    found, forbidden, missing = await get_tickets_batch_service_async(
+        db=db, ticket_ids=parse_ticket_ids(ids), current_user=current_user
+    )
+    return TicketBatchOut(found=found, forbidden=forbidden, missing=missing)
+
+
+@tickets_router.post(":batch", response_model=TicketBatchOut)
+@timed(logger_name="app.api", threshold_ms=120)
+async def post_tickets_batch_api(
+    payload: TicketBatchIn,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    # same lookup as the GET form, for id lists too long for a URL
+    found, forbidden, missing = await get_tickets_batch_service_async(
+        db=db, ticket_ids=payload.ids, current_user=current_user
+    )
+    return TicketBatchOut(found=found, forbidden=forbidden, missing=missing)
+
+
+@tickets_router.get("/{ticket_id}", response_model=TicketOut)
+@timed(logger_name="app.api", threshold_ms=80)
+async def get_ticket_api(
+    ticket_id: int,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+    if_none_match: str | None = Header(None),
+):
+    ticket, etag = await get_ticket_if_modified_service_async(
+        db=db, ticket_id=ticket_id, current_user=current_user, if_none_match=if_none_match
+    )
+    if ticket is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag))
+    response.headers.update(validator_headers(etag))
+    return ticket
+
+
+@replies_router.get("/tickets/{ticket_id}/replies", response_model=ReplyListOut)
+@timed(logger_name="app.api", threshold_ms=120)
+async def list_replies_api(
+    ticket_id: int,
+    response: Response,
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+    include_total: IncludeTotal = Query(IncludeTotal.EXACT),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+    if_none_match: str | None = Header(None),
+):
+    items, total, etag = await list_replies_service_async(
+        db=db,
+        ticket_id=ticket_id,
+        current_user=current_user,
+        page=page,
+        page_size=page_size,
+        include_total=include_total,
+        if_none_match=if_none_match,
+    )
+    if items is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag))
+    response.headers.update(validator_headers(etag))
+    return {"items": items, "total": total, "page": page, "page_size": page_size}
+
+
+@replies_router.post(
+    "/tickets/{ticket_id}/replies",
+    response_model=ReplyOut,
+    status_code=status.HTTP_201_CREATED,
+)
+@timed(logger_name="app.api", threshold_ms=120)
+async def create_reply_api(
+    ticket_id: int,
+    payload: ReplyCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    return await create_reply_service_async(
+        db=db, ticket_id=ticket_id, current_user=current_user, message=payload.message
+    )
+
+
+@admin_router.put("/tickets/{ticket_id}/status", status_code=status.HTTP_200_OK)
+@timed(logger_name="app.api", threshold_ms=120)
+async def update_status_api(
+    ticket_id: int,
+    payload: StatusUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(require_admin_async),
+):
+    updated = await update_status_service_async(
+        db=db,
+        ticket_id=ticket_id,
+        current_user=current_user,
+        new_status=payload.status,
+    )
+    return {"id": updated.id, "status": updated.status}
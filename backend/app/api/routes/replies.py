@@ -1,15 +1,13 @@
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.decorators import timed
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
 from app.db.session import get_db
 from app.schemas.reply import ReplyCreate, ReplyOut, ReplyListOut
-from app.services.tickets import create_reply_service
-from app.crud.tickets import get_ticket
-from app.policies.tickets import can_view_ticket
-from app.crud.replies import list_replies
-from app.domain.errors import NotFoundError
+from app.domain.enums import IncludeTotal
+from app.services.tickets import create_reply_service, list_replies_service
+from app.utils.etag import validator_headers
 
 router = APIRouter()
 
@@ -18,17 +16,26 @@ router = APIRouter()
 @timed(logger_name="app.api", threshold_ms=120)
 def list_replies_api(
     ticket_id: int,
+    response: Response,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
-    db: Session = Depends(get_db),
+    include_total: IncludeTotal = Query(IncludeTotal.EXACT),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user),
+    if_none_match: str | None = Header(None),
 ):
-    t = get_ticket(db, ticket_id)
-    if not t:
-        raise NotFoundError("Ticket not found")
-
-    can_view_ticket(current_user, t)
-    items, total = list_replies(db, ticket_id=ticket_id, page=page, page_size=page_size)
+    items, total, etag = list_replies_service(
+        db=db,
+        ticket_id=ticket_id,
+        current_user=current_user,
+        page=page,
+        page_size=page_size,
+        include_total=include_total,
+        if_none_match=if_none_match,
+    )
+    if items is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag))
+    response.headers.update(validator_headers(etag))
     return {"items": items, "total": total, "page": page, "page_size": page_size}
 
 
@@ -1,19 +1,36 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.decorators import timed
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_read_db
+from app.core.events import ticket_event_stream
+from app.core.response_cache import ticket_list_cache, ticket_list_scope
 from app.db.session import get_db
-from app.schemas.ticket import TicketCreate, TicketListOut, TicketOut
-from app.domain.enums import TicketStatus, TicketPriority
+from app.schemas.ticket import (
+    TicketBatchIn,
+    TicketBatchOut,
+    TicketCreate,
+    TicketListOut,
+    TicketOut,
+    TicketSearchHit,
+    TicketSearchOut,
+)
+from app.domain.enums import IncludeTotal, TicketStatus, TicketPriority, TicketSort
+from app.utils.etag import validator_headers
 from app.utils.pagination import normalize_pagination
 from app.services.tickets_list_service import (
     TicketFilters,
     create_ticket_service,
+    get_ticket_if_modified_service,
     get_ticket_service,
+    get_tickets_batch_service,
     list_tickets_service,
+    parse_ticket_ids,
+    search_tickets_service,
 )
 
 router = APIRouter()
@@ -38,7 +55,7 @@ def create_ticket_api(
 @router.get("", response_model=TicketListOut)
 @timed(logger_name="app.api", threshold_ms=120)
 def list_tickets_api(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=50),
@@ -46,6 +63,10 @@ def list_tickets_api(
     priority: TicketPriority | None = Query(None),
     created_from: datetime | None = Query(None),
     created_to: datetime | None = Query(None),
+    cursor: str | None = Query(None, max_length=200),
+    include_total: IncludeTotal = Query(IncludeTotal.EXACT),
+    # validated against TicketSort by TicketFilters (unknown values are a 400)
+    sort: str = Query(TicketSort.NEWEST, max_length=20),
 ):
     pg = normalize_pagination(page, page_size)
     filters = TicketFilters(
@@ -53,22 +74,113 @@ def list_tickets_api(
         priority=priority,
         created_from=created_from,
         created_to=created_to,
+        sort=sort,
     )
 
-    items, total = list_tickets_service(
-        db=db,
-        current_user=current_user,
-        page=pg,
-        filters=filters,
+    def produce() -> dict:
+        items, total, next_cursor = list_tickets_service(
+            db=db,
+            current_user=current_user,
+            page=pg,
+            filters=filters,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        return TicketListOut(
+            items=items,
+            page=pg.page,
+            page_size=pg.page_size,
+            total=total,
+            next_cursor=next_cursor,
+        ).model_dump(mode="json")
+
+    params = (pg.page, pg.page_size, filters, cursor, include_total)
+    return ticket_list_cache.get_or_set(ticket_list_scope(current_user), params, produce)
+
+
+# declared before /{ticket_id} so "search" is not parsed as an id
+@router.get("/search", response_model=TicketSearchOut)
+@timed(logger_name="app.api", threshold_ms=150)
+def search_tickets_api(
+    q: str = Query(..., min_length=1, max_length=200),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(10, ge=1, le=50),
+):
+    pg = normalize_pagination(page, page_size)
+    hits, total = search_tickets_service(db=db, current_user=current_user, q=q, page=pg)
+    return TicketSearchOut(
+        items=[TicketSearchHit.from_hit(ticket, score) for ticket, score in hits],
+        page=pg.page,
+        page_size=pg.page_size,
+        total=total,
+    )
+
+
+# ":batch" is not a path segment, so it cannot clash with /{ticket_id}
+@router.get(":batch", response_model=TicketBatchOut)
+@timed(logger_name="app.api", threshold_ms=120)
+def get_tickets_batch_api(
+    ids: str = Query(..., max_length=1000, description="comma-separated ticket ids"),
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+):
+    found, forbidden, missing = get_tickets_batch_service(
+        db=db, ticket_ids=parse_ticket_ids(ids), current_user=current_user
     )
-    return TicketListOut(items=items, page=pg.page, page_size=pg.page_size, total=total)
+    return TicketBatchOut(found=found, forbidden=forbidden, missing=missing)
+
+
+@router.post(":batch", response_model=TicketBatchOut)
+@timed(logger_name="app.api", threshold_ms=120)
+def post_tickets_batch_api(
+    payload: TicketBatchIn,
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+):
+    # same lookup as the GET form, for id lists too long for a URL
+    found, forbidden, missing = get_tickets_batch_service(
+        db=db, ticket_ids=payload.ids, current_user=current_user
+    )
+    return TicketBatchOut(found=found, forbidden=forbidden, missing=missing)
 
 
 @router.get("/{ticket_id}", response_model=TicketOut)
 @timed(logger_name="app.api", threshold_ms=80)
 def get_ticket_api(
     ticket_id: int,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: Session = Depends(get_read_db),
     current_user=Depends(get_current_user),
+    if_none_match: str | None = Header(None),
 ):
-    return get_ticket_service(db=db, ticket_id=ticket_id, current_user=current_user)
+    ticket, etag = get_ticket_if_modified_service(
+        db=db, ticket_id=ticket_id, current_user=current_user, if_none_match=if_none_match
+    )
+    if ticket is None:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag))
+    response.headers.update(validator_headers(etag))
+    return ticket
+
+
+@router.get("/{ticket_id}/events")
+async def ticket_events_api(
+    ticket_id: int,
+    db: Session = Depends(get_read_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Server-sent events for one ticket: `reply_created` and `status_changed`.
+    """
+    await run_in_threadpool(
+        get_ticket_service, db=db, ticket_id=ticket_id, current_user=current_user
+    )
+    # the stream may stay open for minutes; give the connection back now
+    await run_in_threadpool(db.close)
+
+    return StreamingResponse(
+        ticket_event_stream(ticket_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
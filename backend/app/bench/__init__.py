@@ -0,0 +1,5 @@
+"""
+Load-test and benchmark harness for the API hot paths.
+
+    python -m app.cli.bench --help
+"""
@@ -0,0 +1,369 @@
+"""
+Deterministic synthetic helpdesk data, loaded with bulk inserts.
+
+Built to reproduce production-sized databases (tens of millions of rows):
+
+- Every value derives from the spec, so a spec always produces the same rows
+  (timestamps count back from spec.end_date, today by default).
+- All users share one precomputed bcrypt hash.
+- Rows are generated lazily and written as Core insert() executemany batches
+  on one connection, committed every spec.commit_every rows. Ids are
+  assigned here, so nothing is read back.
+- Secondary indexes (and SQLite's FTS index) are built once after the load
+  instead of being maintained row by row.
+- Nothing proportional to the row count is held in memory: a ticket's owner
+  and creation time are recomputed from its id when its replies are made.
+
+The data is skewed like real traffic: ticket owners and reply targets follow
+a Zipf-like distribution (weight 1 / rank**skew), so a few customers own most
+tickets and a few tickets collect most replies.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta
+from itertools import accumulate
+from typing import Callable, Iterator
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.core.security import hash_password
+from app.crud.replies import reconcile_reply_counters
+from app.crud.stats import rebuild_ticket_stats
+from app.db.fulltext import deferred_fts
+from app.db.migrations import index_applies_to
+from app.db.timestamps import utcnow
+from app.domain.enums import Role, TicketPriority, TicketStatus
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.models.user import User
+
+STATUS_WEIGHTS = {
+    TicketStatus.OPEN: 30,
+    TicketStatus.IN_PROGRESS: 20,
+    TicketStatus.RESOLVED: 20,
+    TicketStatus.CLOSED: 30,
+}
+PRIORITY_WEIGHTS = {TicketPriority.LOW: 30, TicketPriority.MEDIUM: 50, TicketPriority.HIGH: 20}
+WORDS = (
+    "login error payment invoice refund password reset email slow timeout crash "
+    "upload export report dashboard mobile app sync account locked billing "
+    "shipping order missing duplicate charge api webhook integration"
+).split()
+
+# hash stream for ticket owners, recomputed from the ticket id
+_OWNER = 1
+_MASK64 = (1 << 64) - 1
+
+
+@dataclass
+class DatasetSpec:
+    users: int = 200
+    tickets: int = 20_000
+    replies: int = 100_000
+    admins: int = 2
+    skew: float = 1.1
+    days: int = 365
+    # last day of the generated history; None means today (UTC)
+    end_date: date | None = None
+    seed: int = 42
+    password: str = "bench-password"
+    batch_size: int = 5000
+    commit_every: int = 200_000
+    # drop the ticket/reply secondary indexes during the load, rebuild after
+    defer_indexes: bool = True
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("password")
+        data["end_date"] = str(self.end_date) if self.end_date else None
+        return data
+
+
+@dataclass
+class TableLoad:
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class SeedReport:
+    tables: dict[str, TableLoad] = field(default_factory=dict)
+    # index builds, stats rollup and reply counters after the inserts
+    finalize_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        out: dict = {
+            name: {
+                "rows": load.rows,
+                "seconds": round(load.seconds, 3),
+                "rows_per_sec": round(load.rows_per_sec, 1),
+            }
+            for name, load in self.tables.items()
+        }
+        out["finalize_seconds"] = round(self.finalize_seconds, 3)
+        return out
+
+
+# (table name, progress so far, rows that table will get)
+ProgressFn = Callable[[str, TableLoad, int], None]
+
+
+def _unit(seed: int, stream: int, i: int) -> float:
+    """
+    Uniform [0, 1) from (seed, stream, i) via splitmix64, so a per-row value
+    can be recomputed later from the row id alone.
+    """
+    z = (seed * 0x9E3779B97F4A7C15 + stream * 0xD1B54A32D192ED03 + i) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    z ^= z >> 31
+    return (z >> 11) / (1 << 53)
+
+
+def _zipf_rank(u: float, n: int, skew: float) -> int:
+    """
+    Rank in 1..n for uniform u, by inverting the continuous approximation of
+    the Zipf CDF: O(1) per draw, no n-sized weight table.
+    """
+    if abs(skew - 1.0) < 1e-9:
+        rank = n**u
+    else:
+        a = 1.0 - skew
+        rank = (1.0 + u * (n**a - 1.0)) ** (1.0 / a)
+    return min(n, max(1, int(rank)))
+
+
+def _spread(n: int) -> Callable[[int], int]:
+    """
+    Bijection on 1..n (multiplication by a step coprime with n), so the hot
+    ranks land on tickets scattered over the whole id and time range.
+    """
+    step = 2654435761 % n or 1
+    while math.gcd(step, n) != 1:
+        step += 1
+    return lambda rank: (rank - 1) * step % n + 1
+
+
+def _batches(rows: Iterator[dict], size: int) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@contextmanager
+def _bulk_load_settings(conn: Connection) -> Iterator[None]:
+    """
+    Per-connection settings that trade durability and per-row checks for load
+    speed, restored afterwards. Generated ids and references are valid by
+    construction.
+    """
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        conn.exec_driver_sql("PRAGMA synchronous = OFF")
+    elif dialect in ("mysql", "mariadb"):
+        conn.exec_driver_sql("SET SESSION unique_checks = 0, foreign_key_checks = 0")
+    try:
+        yield
+    finally:
+        conn.rollback()
+        if dialect == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous = FULL")
+        elif dialect in ("mysql", "mariadb"):
+            conn.exec_driver_sql("SET SESSION unique_checks = 1, foreign_key_checks = 1")
+
+
+@contextmanager
+def _deferred_indexes(conn: Connection, tables: list) -> Iterator[None]:
+    """
+    Drop the non-unique indexes of `tables` for the duration and build each
+    once at the end: one sorted build is far cheaper than millions of random
+    B-tree inserts.
+    """
+    indexes = [
+        ix
+        for table in tables
+        for ix in table.indexes
+        if not ix.unique and index_applies_to(ix, conn.dialect.name)
+    ]
+    for ix in indexes:
+        ix.drop(conn)
+    conn.commit()
+    try:
+        yield
+    finally:
+        conn.rollback()
+        for ix in indexes:
+            ix.create(conn)
+        conn.commit()
+
+
+def _load(
+    conn: Connection,
+    table,
+    rows: Iterator[dict],
+    total: int,
+    spec: DatasetSpec,
+    on_progress: ProgressFn | None,
+) -> TableLoad:
+    load = TableLoad()
+    started = time.perf_counter()
+    uncommitted = 0
+    for batch in _batches(rows, spec.batch_size):
+        conn.execute(table.insert(), batch)
+        load.rows += len(batch)
+        uncommitted += len(batch)
+        if uncommitted >= spec.commit_every:
+            conn.commit()
+            uncommitted = 0
+            load.seconds = time.perf_counter() - started
+            if on_progress:
+                on_progress(table.name, load, total)
+    if uncommitted or not load.rows:
+        conn.commit()
+        load.seconds = time.perf_counter() - started
+        if on_progress:
+            on_progress(table.name, load, total)
+    return load
+
+
+class _Generator:
+    def __init__(self, spec: DatasetSpec, first_ids: dict[str, int], now: datetime):
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.now = now
+        self.start = now - timedelta(days=spec.days)
+        self.first_user = first_ids[User.__tablename__]
+        self.first_admin = self.first_user + spec.users
+        self.first_ticket = first_ids[Ticket.__tablename__]
+        self.first_reply = first_ids[TicketReply.__tablename__]
+        # tickets arrive evenly over spec.days, in id order
+        self.ticket_spacing = spec.days * 86400 / max(spec.tickets, 1)
+        self.hot_ticket = _spread(spec.tickets) if spec.tickets else None
+        self.subjects = [t.capitalize() for t in self._pool(5)]
+        self.descriptions = self._pool(30)
+        self.messages = self._pool(20)
+
+    def _pool(self, n_words: int, size: int = 4096) -> list[str]:
+        # drawing from pre-built texts keeps generation off the load's critical path
+        return [" ".join(self.rng.choices(WORDS, k=n_words)) for _ in range(size)]
+
+    def owner(self, k: int) -> int:
+        """User id owning the k-th generated ticket (1-based)."""
+        u = _unit(self.spec.seed, _OWNER, k)
+        return self.first_user + _zipf_rank(u, self.spec.users, self.spec.skew) - 1
+
+    def ticket_created(self, k: int) -> datetime:
+        return self.start + timedelta(seconds=int((k - 1) * self.ticket_spacing))
+
+    def users(self, password_hash: str) -> Iterator[dict]:
+        spec = self.spec
+        for i in range(spec.users + spec.admins):
+            is_admin = i >= spec.users
+            yield {
+                "id": self.first_user + i,
+                "email": f"{'admin' if is_admin else 'user'}{i}@bench.example.com",
+                "password_hash": password_hash,
+                "role": Role.ADMIN if is_admin else Role.USER,
+                "token_version": 0,
+                "created_at": self.start,
+            }
+
+    def tickets(self) -> Iterator[dict]:
+        statuses, status_w = list(STATUS_WEIGHTS), list(accumulate(STATUS_WEIGHTS.values()))
+        priorities, priority_w = list(PRIORITY_WEIGHTS), list(accumulate(PRIORITY_WEIGHTS.values()))
+        rng = self.rng
+        n_texts = len(self.subjects)
+        for k in range(1, self.spec.tickets + 1):
+            created = self.ticket_created(k)
+            yield {
+                "id": self.first_ticket + k - 1,
+                "user_id": self.owner(k),
+                "subject": self.subjects[rng.randrange(n_texts)],
+                "description": self.descriptions[rng.randrange(n_texts)],
+                "status": rng.choices(statuses, cum_weights=status_w)[0],
+                "priority": rng.choices(priorities, cum_weights=priority_w)[0],
+                "created_at": created,
+                "updated_at": created,
+            }
+
+    def replies(self) -> Iterator[dict]:
+        spec = self.spec
+        if not spec.tickets:
+            return
+        rng = self.rng
+        for j in range(spec.replies):
+            k = self.hot_ticket(_zipf_rank(rng.random(), spec.tickets, spec.skew))
+            staff = spec.admins and rng.random() < 0.5
+            created = self.ticket_created(k) + timedelta(minutes=rng.randrange(1, 60 * 24 * 7))
+            yield {
+                "id": self.first_reply + j,
+                "ticket_id": self.first_ticket + k - 1,
+                "author_id": (
+                    self.first_admin + rng.randrange(spec.admins) if staff else self.owner(k)
+                ),
+                "message": self.messages[rng.randrange(len(self.messages))],
+                "created_at": min(created, self.now),
+            }
+
+
+def seed_dataset(
+    bind: Engine, spec: DatasetSpec, on_progress: ProgressFn | None = None
+) -> SeedReport:
+    """
+    Generate and insert spec's users, tickets and replies, then build the
+    deferred indexes, the SQLite FTS index, the stats rollup and the
+    tickets' reply counters once. Ids
+    continue from each table's current maximum, but emails do not, so seed
+    an empty database (the bootstrap admin aside).
+    """
+    if spec.tickets and not spec.users:
+        raise ValueError("tickets need at least one user")
+
+    report = SeedReport()
+    password_hash = hash_password(spec.password)  # one bcrypt for every user
+
+    with bind.connect() as conn:
+        first_ids = {
+            model.__tablename__: (conn.scalar(select(func.max(model.id))) or 0) + 1
+            for model in (User, Ticket, TicketReply)
+        }
+        conn.commit()
+        end = (
+            datetime.combine(spec.end_date, dt_time.max).replace(microsecond=0)
+            if spec.end_date
+            else utcnow()
+        )
+        gen = _Generator(spec, first_ids, end)
+
+        deferred = [Ticket.__table__, TicketReply.__table__] if spec.defer_indexes else []
+        with _bulk_load_settings(conn):
+            with _deferred_indexes(conn, deferred), deferred_fts(conn):
+                for table, rows, total in (
+                    (User.__table__, gen.users(password_hash), spec.users + spec.admins),
+                    (Ticket.__table__, gen.tickets(), spec.tickets),
+                    (TicketReply.__table__, gen.replies(), spec.replies if spec.tickets else 0),
+                ):
+                    report.tables[table.name] = _load(conn, table, rows, total, spec, on_progress)
+                finalize_started = time.perf_counter()
+            with Session(bind=conn) as db:
+                rebuild_ticket_stats(db)
+                reconcile_reply_counters(db, batch_size=spec.commit_every)
+            report.finalize_seconds = time.perf_counter() - finalize_started
+    return report
@@ -0,0 +1,308 @@
+"""
+Drive the API with concurrent clients and report latency percentiles.
+
+Each scenario exercises one hot path and runs on its own: `concurrency`
+client tasks share one httpx.AsyncClient until `requests` calls have
+completed, so an endpoint's throughput is not diluted by the others. The
+client talks either to the ASGI app in-process (no sockets: framework, auth
+and DB cost only) or to a uvicorn server over TCP (adds HTTP parsing and
+worker processes).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Iterator
+
+import httpx
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.bench.targets import BenchUser, Targets
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.core.principal import invalidate_principal
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class Scenario:
+    name: str
+    # performs one call and returns its HTTP status (200 for in-process calls)
+    run: Callable[[httpx.AsyncClient, random.Random], Awaitable[int]]
+
+
+@dataclass
+class EndpointResult:
+    name: str
+    seconds: float
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+
+    def summary(self) -> dict:
+        ordered = sorted(self.latencies_ms)
+        n = len(ordered)
+        out = {
+            "requests": n,
+            "errors": sum(self.errors.values()),
+            "error_codes": dict(self.errors),
+            "seconds": round(self.seconds, 3),
+            "rps": round(n / self.seconds, 1) if self.seconds else 0.0,
+            "mean_ms": round(sum(ordered) / n, 3) if n else None,
+            "max_ms": round(ordered[-1], 3) if n else None,
+        }
+        for pct in PERCENTILES:
+            out[f"p{pct}_ms"] = round(percentile(ordered, pct), 3) if n else None
+        return out
+
+
+def percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, -(-len(ordered) * pct // 100))  # ceil without floats
+    return ordered[int(rank) - 1]
+
+
+class _Tokens:
+    """One access token per bench user, minted on first use."""
+
+    def __init__(self):
+        self._tokens: dict[int, str] = {}
+
+    def token(self, user: BenchUser) -> str:
+        token = self._tokens.get(user.id)
+        if token is None:
+            token = self._tokens[user.id] = user.token()
+        return token
+
+    def header(self, user: BenchUser) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token(user)}"}
+
+
+def _http_get(
+    tokens: _Tokens, pick: Callable[[random.Random], tuple[str, BenchUser]]
+) -> Callable[[httpx.AsyncClient, random.Random], Awaitable[int]]:
+    async def run(client: httpx.AsyncClient, rng: random.Random) -> int:
+        path, user = pick(rng)
+        response = await client.get(path, headers=tokens.header(user))
+        return response.status_code
+
+    return run
+
+
+def http_scenarios(targets: Targets, page_size: int = 20) -> list[Scenario]:
+    """
+    The read paths customers and agents hit most. Users and tickets come from
+    Targets, which already over-represents the hot ones.
+    """
+    tokens = _Tokens()
+    scenarios = []
+    if targets.users:
+        scenarios.append(
+            Scenario(
+                "list_tickets",
+                _http_get(
+                    tokens,
+                    lambda rng: (f"/tickets?page_size={page_size}", rng.choice(targets.users)),
+                ),
+            )
+        )
+    if targets.admins:
+        scenarios.append(
+            Scenario(
+                "list_tickets_admin",
+                _http_get(
+                    tokens,
+                    lambda rng: (
+                        f"/tickets?page_size={page_size}&status=OPEN",
+                        rng.choice(targets.admins),
+                    ),
+                ),
+            )
+        )
+    if targets.tickets:
+
+        def pick_ticket(rng: random.Random) -> tuple[str, BenchUser]:
+            ticket_id, owner = rng.choice(targets.tickets)
+            return f"/tickets/{ticket_id}", owner
+
+        scenarios.append(Scenario("get_ticket", _http_get(tokens, pick_ticket)))
+    if targets.threads:
+
+        def pick_thread(rng: random.Random) -> tuple[str, BenchUser]:
+            ticket_id, owner = rng.choice(targets.threads)
+            return f"/tickets/{ticket_id}/replies?page_size=50", owner
+
+        scenarios.append(Scenario("reply_thread", _http_get(tokens, pick_thread)))
+    return scenarios
+
+
+def current_user_scenario(session_factory, targets: Targets) -> Scenario:
+    """
+    get_current_user on a cold principal cache (token decode + user lookup),
+    called directly in a worker thread. The HTTP scenarios only see the warm
+    path, since they reuse one token per user.
+    """
+    tokens = _Tokens()
+    users = targets.users or targets.admins
+
+    def resolve(user: BenchUser) -> None:
+        invalidate_principal(user.email)
+        creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=tokens.token(user))
+        with session_factory() as db:
+            get_current_user(db, creds)
+
+    async def run(client: httpx.AsyncClient, rng: random.Random) -> int:
+        await asyncio.to_thread(resolve, rng.choice(users))
+        return 200
+
+    return Scenario("get_current_user", run)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    seed: int = 0,
+) -> EndpointResult:
+    async def drive(n: int, result: EndpointResult | None) -> None:
+        remaining = n
+
+        async def worker(i: int) -> None:
+            nonlocal remaining
+            rng = random.Random(seed * 1009 + i)
+            while remaining > 0:
+                remaining -= 1  # one event loop: no lock needed
+                started = time.perf_counter()
+                try:
+                    status = await scenario.run(client, rng)
+                except httpx.HTTPError as exc:
+                    status = type(exc).__name__
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                if result is None:
+                    continue
+                result.latencies_ms.append(elapsed_ms)
+                if not isinstance(status, int) or status >= 400:
+                    result.errors[str(status)] += 1
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+    if warmup:
+        await drive(warmup, None)
+    result = EndpointResult(scenario.name, seconds=0.0)
+    started = time.perf_counter()
+    await drive(requests, result)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+async def run_all(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> dict[str, dict]:
+    results = {}
+    for i, scenario in enumerate(scenarios):
+        result = await run_scenario(client, scenario, requests, concurrency, warmup, seed=i)
+        results[scenario.name] = result.summary()
+    return results
+
+
+def inprocess_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60
+    )
+
+
+@contextmanager
+def uvicorn_server(
+    port: int, workers: int = 1, host: str = "127.0.0.1", startup_timeout: float = 30
+) -> Iterator[str]:
+    """
+    Run app.main:app under uvicorn in a child process (same environment, so
+    the same DATABASE_URL) and yield its base URL once it answers.
+    """
+    base_url = f"http://{host}:{port}"
+    cmd = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", host, "--port", str(port)]
+    cmd += ["--workers", str(workers), "--log-level", "warning", "--no-access-log"]
+    proc = subprocess.Popen(cmd, cwd=BACKEND_DIR, env=os.environ.copy())
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+            try:
+                httpx.get(f"{base_url}/tickets", timeout=1)  # any answer (401) means up
+                break
+            except httpx.TransportError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"uvicorn did not start within {startup_timeout}s")
+                time.sleep(0.2)
+        yield base_url
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def remote_client(base_url: str, concurrency: int) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60)
+
+
+def report_meta(**extra) -> dict:
+    url = settings.resolved_database_url
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "database": url.split(":", 1)[0],
+        "db_async": settings.db_async,
+        "auth_stateless": settings.auth_stateless,
+        "response_cache_enabled": settings.response_cache_enabled,
+        **extra,
+    }
+
+
+def compare(report: dict, baseline: dict) -> list[str]:
+    """
+    One line per (mode, endpoint) present in both reports: throughput and
+    p95/p99 change relative to the baseline run.
+    """
+
+    def change(new, old) -> str:
+        if not old or new is None:
+            return "    n/a"
+        return f"{(new - old) / old * 100:+6.1f}%"
+
+    lines = []
+    old_runs = {run["mode"]: run["endpoints"] for run in baseline.get("runs", [])}
+    for run in report.get("runs", []):
+        old_endpoints = old_runs.get(run["mode"], {})
+        for name, new in run["endpoints"].items():
+            old = old_endpoints.get(name)
+            if old is None:
+                continue
+            lines.append(
+                f"{run['mode']:<10} {name:<20} rps {change(new['rps'], old['rps'])}  "
+                f"p95 {change(new['p95_ms'], old['p95_ms'])}  "
+                f"p99 {change(new['p99_ms'], old['p99_ms'])}"
+            )
+    return lines
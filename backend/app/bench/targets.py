@@ -0,0 +1,93 @@
+"""
+Request targets for benchmark runs: which users to authenticate as and which
+tickets and threads to ask for, sampled from the database under test.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.security import create_access_token
+from app.domain.enums import Role
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class BenchUser:
+    id: int
+    email: str
+    role: str
+
+    def token(self) -> str:
+        return create_access_token(subject=self.email, role=self.role, user_id=self.id)
+
+
+@dataclass
+class Targets:
+    """Who to authenticate as and which rows to ask for, sampled from the DB."""
+
+    users: list[BenchUser]
+    admins: list[BenchUser]
+    # (ticket id, owner) pairs, sampled uniformly over tickets
+    tickets: list[tuple[int, BenchUser]]
+    # (ticket id, owner) pairs, sampled per reply, so long threads come up often
+    threads: list[tuple[int, BenchUser]]
+
+
+def load_targets(db: Session, n: int = 500, seed: int = 0) -> Targets:
+    """
+    Sample request targets from whatever is in the database (seeded here or
+    elsewhere) without scanning whole tables: random ids in [min, max] are
+    looked up by primary key, and gaps are simply skipped.
+    """
+    rng = random.Random(seed)
+
+    def sample_ids(column) -> list[int]:
+        lo, hi = db.execute(select(func.min(column), func.max(column))).one()
+        if lo is None:
+            return []
+        return [rng.randint(lo, hi) for _ in range(n)]
+
+    users = {
+        row.id: BenchUser(row.id, row.email, row.role)
+        for row in db.execute(select(User.id, User.email, User.role).where(User.role == Role.ADMIN))
+    }
+    admins = list(users.values())
+
+    def with_owner(rows) -> list[tuple[int, BenchUser]]:
+        rows = list(rows)
+        missing = {r.user_id for r in rows} - users.keys()
+        if missing:
+            for row in db.execute(
+                select(User.id, User.email, User.role).where(User.id.in_(missing))
+            ):
+                users[row.id] = BenchUser(row.id, row.email, row.role)
+        return [(r.ticket_id, users[r.user_id]) for r in rows]
+
+    ticket_ids = sample_ids(Ticket.id)
+    tickets = with_owner(
+        db.execute(
+            select(Ticket.id.label("ticket_id"), Ticket.user_id).where(Ticket.id.in_(ticket_ids))
+        )
+    )
+    # one entry per sampled id, so owners show up in proportion to their tickets
+    by_id = dict(tickets)
+    tickets = [(i, by_id[i]) for i in ticket_ids if i in by_id]
+
+    reply_ids = sample_ids(TicketReply.id)
+    thread_rows = db.execute(
+        select(TicketReply.id, TicketReply.ticket_id, Ticket.user_id)
+        .join(Ticket, Ticket.id == TicketReply.ticket_id)
+        .where(TicketReply.id.in_(reply_ids))
+    ).all()
+    owners = dict((r.id, r) for r in thread_rows)
+    threads = with_owner(owners[i] for i in reply_ids if i in owners)
+
+    customers = [owner for _, owner in tickets if owner.role != Role.ADMIN]
+    return Targets(users=customers, admins=admins, tickets=tickets, threads=threads)
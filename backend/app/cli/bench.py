@@ -0,0 +1,112 @@
+"""
+Benchmark the API hot paths against the configured database.
+
+    DATABASE_URL=sqlite:///bench.db python -m app.cli.bench --tickets 50000 --out run.json
+    python -m app.cli.bench --mode both --workers 4 --baseline before.json --out after.json
+
+An empty database is seeded first with a skewed synthetic dataset
+(app.cli.seed); a non-empty one is benchmarked as-is. Results go to
+--out as JSON (throughput and p50/p95/p99 per endpoint and mode).
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from sqlalchemy import select
+
+from app.bench.runner import (
+    compare,
+    current_user_scenario,
+    http_scenarios,
+    inprocess_client,
+    remote_client,
+    report_meta,
+    run_all,
+    uvicorn_server,
+)
+from app.bench.targets import load_targets
+from app.cli.seed import add_dataset_args, seed_with_progress, spec_from_args
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal, init_db
+from app.main import app
+from app.models.ticket import Ticket
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn", "both"), default="inprocess")
+    parser.add_argument("--requests", type=int, default=2000, help="per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=100, help="unrecorded calls per endpoint")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--only", nargs="*", default=None, help="endpoint names to run")
+    parser.add_argument("--out", default=None, help="write the JSON report here")
+    parser.add_argument("--baseline", default=None, help="earlier report to compare against")
+    add_dataset_args(parser.add_argument_group("dataset (used only when the database is empty)"))
+    return parser.parse_args(argv)
+
+
+async def _run_inprocess(args, targets) -> dict:
+    scenarios = http_scenarios(targets) + [current_user_scenario(SessionLocal, targets)]
+    scenarios = [s for s in scenarios if not args.only or s.name in args.only]
+    async with inprocess_client(app) as client:
+        return await run_all(client, scenarios, args.requests, args.concurrency, args.warmup)
+
+
+async def _run_uvicorn(args, targets, base_url: str) -> dict:
+    scenarios = [s for s in http_scenarios(targets) if not args.only or s.name in args.only]
+    async with remote_client(base_url, args.concurrency) as client:
+        return await run_all(client, scenarios, args.requests, args.concurrency, args.warmup)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    setup_logging("WARNING")  # after app.main, which sets INFO on import
+    init_db()
+
+    with SessionLocal() as db:
+        empty = db.scalar(select(Ticket.id).limit(1)) is None
+    dataset = None
+    if empty:
+        spec = spec_from_args(args)
+        dataset = {**spec.as_dict(), "load": seed_with_progress(spec).as_dict()}
+    with SessionLocal() as db:
+        targets = load_targets(db, seed=args.seed)
+
+    runs = []
+    if args.mode in ("inprocess", "both"):
+        runs.append({"mode": "inprocess", "endpoints": asyncio.run(_run_inprocess(args, targets))})
+    if args.mode in ("uvicorn", "both"):
+        with uvicorn_server(args.port, args.workers) as base_url:
+            endpoints = asyncio.run(_run_uvicorn(args, targets, base_url))
+        runs.append({"mode": "uvicorn", "workers": args.workers, "endpoints": endpoints})
+
+    report = {
+        "meta": report_meta(
+            requests=args.requests,
+            concurrency=args.concurrency,
+            warmup=args.warmup,
+            seeded=dataset,
+        ),
+        "runs": runs,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        for line in compare(report, baseline):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Import tickets and replies exported from the old helpdesk.
+
+    python -m app.cli.import_tickets export.ndjson
+    python -m app.cli.import_tickets tickets.csv --format csv --batch-size 5000
+"""
+
+import argparse
+import json
+import logging
+import sys
+from dataclasses import asdict
+
+from app.core.logging import setup_logging
+from app.db.session import SessionLocal
+from app.domain.errors import ValidationError
+from app.services.ticket_import import ImportReport, import_file
+
+logger = logging.getLogger("app.cli.import_tickets")
+
+
+def _progress(report: ImportReport) -> None:
+    print(
+        f"\rprocessed={report.processed} tickets={report.tickets} "
+        f"replies={report.replies} failed={report.failed}",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="input file, '-' for stdin")
+    parser.add_argument("--format", choices=("ndjson", "csv"), default=None)
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+    setup_logging("WARNING")
+
+    db = SessionLocal()
+    try:
+        if args.path == "-":
+            report = import_file(db, sys.stdin, fmt, args.batch_size, on_progress=_progress)
+        else:
+            with open(args.path, encoding="utf-8", newline="") as fh:
+                report = import_file(db, fh, fmt, args.batch_size, on_progress=_progress)
+    except ValidationError as exc:
+        print(f"\nerror: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    print(file=sys.stderr)
+    json.dump(asdict(report), sys.stdout, indent=2)
+    print()
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
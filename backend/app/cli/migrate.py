@@ -0,0 +1,25 @@
+"""
+Apply pending schema changes to an existing database.
+
+    python -m app.cli.migrate
+"""
+
+import logging
+
+from app.core.logging import setup_logging
+from app.db.base import Base
+from app.db.migrations import upgrade
+from app.db.session import engine
+
+logger = logging.getLogger("app.cli.migrate")
+
+
+def main() -> None:
+    setup_logging("INFO")
+    Base.metadata.create_all(bind=engine)
+    created = upgrade(engine)
+    logger.info("migrate_complete created=%s", len(created))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Recompute the ticket_daily_stats rollup from the tickets table (backfill
+after deploy, or repair after out-of-band changes).
+
+    python -m app.cli.rebuild_stats
+"""
+
+import logging
+
+from app.core.logging import setup_logging
+from app.crud.stats import rebuild_ticket_stats
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+
+logger = logging.getLogger("app.cli.rebuild_stats")
+
+
+def main() -> None:
+    setup_logging("INFO")
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        buckets = rebuild_ticket_stats(db)
+    logger.info("rebuild_stats_complete buckets=%s", buckets)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Recompute the denormalized reply columns on tickets (reply_count,
+last_reply_at, last_reply_author_id) from ticket_replies: backfill after
+deploy, or repair after out-of-band changes.
+
+    python -m app.cli.reconcile_reply_counters --batch-size 10000
+"""
+
+import argparse
+import logging
+
+from app.core.logging import setup_logging
+from app.crud.replies import reconcile_reply_counters
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+
+logger = logging.getLogger("app.cli.reconcile_reply_counters")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=10_000, help="tickets per transaction")
+    args = parser.parse_args(argv)
+
+    setup_logging("INFO")
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as db:
+        fixed = reconcile_reply_counters(db, batch_size=args.batch_size)
+    logger.info("reconcile_reply_counters_complete fixed=%s", fixed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Fill the configured database with a deterministic synthetic dataset.
+
+    DATABASE_URL=sqlite:///bench.db python -m app.cli.seed --tickets 10000000 --replies 50000000
+    python -m app.cli.seed --users 50000 --seed 7 --batch-size 10000 --commit-every 500000
+
+The same arguments always produce the same rows. Meant for an empty
+database; see app.bench.dataset for how the data is shaped and loaded.
+"""
+
+import argparse
+import json
+import sys
+from datetime import date
+
+from app.bench.dataset import DatasetSpec, SeedReport, TableLoad, seed_dataset
+from app.core.logging import setup_logging
+from app.db.session import engine, init_db
+
+
+def _progress(table: str, load: TableLoad, total: int) -> None:
+    print(
+        f"\r{table:<15} {load.rows:>12,}/{total:<12,} {load.rows_per_sec:>10,.0f} rows/s",
+        end="\n" if load.rows >= total else "",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def add_dataset_args(parser: argparse.ArgumentParser) -> None:
+    defaults = DatasetSpec()
+    for name in ("users", "tickets", "replies", "admins", "days", "seed"):
+        parser.add_argument(f"--{name}", type=int, default=getattr(defaults, name))
+    parser.add_argument("--skew", type=float, default=defaults.skew)
+    parser.add_argument(
+        "--end-date", type=date.fromisoformat, default=None, help="YYYY-MM-DD, default today"
+    )
+    parser.add_argument("--password", default=defaults.password, help="shared by every user")
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--commit-every", type=int, default=defaults.commit_every)
+    parser.add_argument(
+        "--keep-indexes",
+        action="store_true",
+        help="maintain secondary indexes during the load instead of rebuilding them after",
+    )
+
+
+def spec_from_args(args: argparse.Namespace) -> DatasetSpec:
+    return DatasetSpec(
+        users=args.users,
+        tickets=args.tickets,
+        replies=args.replies,
+        admins=args.admins,
+        skew=args.skew,
+        days=args.days,
+        end_date=args.end_date,
+        seed=args.seed,
+        password=args.password,
+        batch_size=args.batch_size,
+        commit_every=args.commit_every,
+        defer_indexes=not args.keep_indexes,
+    )
+
+
+def seed_with_progress(spec: DatasetSpec) -> SeedReport:
+    report = seed_dataset(engine, spec, on_progress=_progress)
+    print(
+        f"indexes, stats and reply counters built in {report.finalize_seconds:.1f}s",
+        file=sys.stderr,
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    add_dataset_args(parser)
+    args = parser.parse_args(argv)
+
+    setup_logging("WARNING")
+    init_db()
+    spec = spec_from_args(args)
+    report = seed_with_progress(spec)
+    json.dump({"spec": spec.as_dict(), "load": report.as_dict()}, sys.stdout, indent=2)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,25 @@ class Settings(BaseSettings):
     db_port: int | None = None
     db_name: str | None = None
 
+    # Connection pool (QueuePool backends; ignored for SQLite). Recycle below
+    # the server's idle timeout; pre-ping then only matters after failovers.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # Read replicas for GET routes (JSON list in env). A user's reads go to the
+    # primary for replica_sticky_seconds after they write.
+    db_replica_urls: list[str] = []
+    replica_sticky_seconds: float = 5.0
+    replica_health_check_seconds: float = 10.0
+
+    # Serve the ticket/reply/admin routes with async def handlers on an
+    # AsyncEngine instead of the threadpool + sync Session.
+    db_async: bool = False
+    async_database_url: str | None = None
+
     # NEW: store CA cert content (PEM) or a path
     db_ssl_ca_pem: str | None = None
     db_ssl_ca_path: str | None = None
@@ -28,6 +47,52 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expire_minutes: int = 60
 
+    # bcrypt runs on its own bounded pool; excess auth calls get 503. Keep
+    # workers + max_queue well under the request threadpool (40 threads) so
+    # sync callers of hash_password can never exhaust it.
+    hashing_pool_workers: int = 2
+    hashing_pool_max_queue: int = 8
+
+    # Trust the signed uid/role claims instead of loading the user; tokens are
+    # still revoked by bumping users.token_version (checked via a small cache).
+    auth_stateless: bool = False
+    token_version_cache_ttl_seconds: float = 30.0
+
+    # authenticated principals cached per (token sub, iat)
+    principal_cache_ttl_seconds: float = 60.0
+    principal_cache_max_size: int = 10_000
+
+    # list totals served for include_total=estimate
+    count_cache_ttl_seconds: float = 30.0
+    count_cache_max_entries: int = 10_000
+
+    # GET /tickets response cache; versions are bumped on ticket writes, the
+    # TTL only bounds staleness across workers without a shared backend
+    response_cache_enabled: bool = True
+    response_cache_url: str | None = None
+    response_cache_ttl_seconds: float = 30.0
+    response_cache_max_entries: int = 5_000
+
+    # /metrics; set a shared dir when running several uvicorn workers
+    metrics_enabled: bool = True
+    metrics_multiproc_dir: str | None = None
+    metrics_flush_seconds: float = 5.0
+
+    # warn when one request runs the same statement this many times
+    n_plus_one_threshold: int = 10
+
+    # GET /tickets/{id}/events (SSE); set a redis:// URL to share events
+    # between workers
+    events_broker_url: str | None = None
+    events_max_queue: int = 100
+    events_heartbeat_seconds: float = 15.0
+    events_max_stream_seconds: float = 300.0
+
+    # rows per INSERT batch (and transaction) for ticket import
+    import_batch_size: int = 1000
+    # rows fetched per server-side cursor round trip for ticket export
+    export_batch_size: int = 1000
+
     bootstrap_admin_email: str | None = None
     bootstrap_admin_password: str | None = None
 
@@ -45,5 +110,19 @@ class Settings(BaseSettings):
 
         return "sqlite+pysqlite:///:memory:"
 
+    @property
+    def resolved_async_database_url(self) -> str:
+        if self.async_database_url:
+            return self.async_database_url
+
+        url = self.resolved_database_url
+        for sync_driver, async_driver in (
+            ("mysql+pymysql://", "mysql+aiomysql://"),
+            ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+        ):
+            if url.startswith(sync_driver):
+                return async_driver + url[len(sync_driver) :]
+        return url
+
 
 settings = Settings()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import functools
+import inspect
 import logging
 import time
 from typing import Any, Callable, TypeVar, ParamSpec
 
+from app.core.metrics import call_duration
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -13,17 +16,38 @@ def timed(
     logger_name: str = "app.timing", threshold_ms: int = 50
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
-    Measures execution time and logs if duration >= threshold_ms.
-    Useful for spotting slow endpoints/DB calls early.
+    Measures execution time, records it in the app_call_duration_seconds
+    histogram and logs if duration >= threshold_ms.
+    Useful for spotting slow endpoints/DB calls early. Works on coroutine
+    functions too (FastAPI must still see them as async).
     """
     logger = logging.getLogger(logger_name)
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                start = time.perf_counter()
+                result = await func(*args, **kwargs)
+                elapsed = time.perf_counter() - start
+                call_duration.observe(elapsed, layer=logger_name, func=func.__name__)
+                elapsed_ms = int(elapsed * 1000)
+                if elapsed_ms >= threshold_ms:
+                    logger.info(
+                        "slow_call func=%s elapsed_ms=%s", func.__name__, elapsed_ms
+                    )
+                return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             start = time.perf_counter()
             result = func(*args, **kwargs)
-            elapsed_ms = int((time.perf_counter() - start) * 1000)
+            elapsed = time.perf_counter() - start
+            call_duration.observe(elapsed, layer=logger_name, func=func.__name__)
+            elapsed_ms = int(elapsed * 1000)
             if elapsed_ms >= threshold_ms:
                 logger.info(
                     "slow_call func=%s elapsed_ms=%s", func.__name__, elapsed_ms
@@ -1,18 +1,20 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.principal import Principal, principal_cache, token_version_cache
 from app.core.security import decode_token
-from app.db.session import get_db
-from app.crud.users import get_user_by_email
+from app.db.replicas import replica_router
+from app.db.session import get_async_db, get_db
+from app.crud.users import get_token_version, get_user_by_email
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    creds: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
-):
+def _decode_bearer(creds: HTTPAuthorizationCredentials | None) -> dict:
     if creds is None or not creds.credentials:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated"
@@ -27,19 +29,101 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         )
 
-    email = payload.get("sub")
-    if not email:
+    if not payload.get("sub"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         )
+    return payload
+
+
+def resolve_principal(db: Session, payload: dict) -> Principal:
+    """
+    Resolve decoded token claims to a Principal. Served from principal_cache
+    when possible, so the common path makes no DB round-trip. With
+    settings.auth_stateless the uid/role claims are trusted as-is, subject to
+    the token_version check.
+    """
+    email = payload["sub"]
+    token_version = payload.get("ver", 0)
+
+    if settings.auth_stateless and payload.get("uid") and payload.get("role"):
+        user_id = payload["uid"]
+        current_version = token_version_cache.get(user_id)
+        if current_version is None:
+            current_version = get_token_version(db, user_id)
+            if current_version is None:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+                )
+            token_version_cache.set(user_id, current_version)
+        if current_version != token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
+            )
+        return Principal(id=user_id, email=email, role=payload["role"])
+
+    cache_key = (email, payload.get("iat"))
+    principal = principal_cache.get(cache_key)
+    if principal is not None:
+        return principal
 
     user = get_user_by_email(db, email=email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
+    if user.token_version != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
+        )
+
+    principal = Principal.from_user(user)
+    principal_cache.set(cache_key, principal)
+    return principal
+
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    creds: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> Principal:
+    principal = resolve_principal(db, _decode_bearer(creds))
+    # lets the after_commit hook make this user's next reads sticky to the primary
+    db.info["principal_id"] = principal.id
+    return principal
 
-    return user
+
+def get_read_db(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """
+    Session for read-only routes: a healthy replica when configured, else the
+    primary session. Recent writers stay on the primary.
+    """
+    replica = None
+    if not replica_router.is_sticky(current_user.id):
+        replica = replica_router.pick()
+    if replica is None:
+        yield db
+        return
+
+    read_db: Session = replica.session_factory()
+    try:
+        yield read_db
+    except OperationalError:
+        replica_router.mark_down(replica)
+        raise
+    finally:
+        read_db.close()
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db),
+    creds: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> Principal:
+    payload = _decode_bearer(creds)
+    # cache hits never touch the connection; misses run on the async driver
+    return await db.run_sync(resolve_principal, payload)
 
 
 def require_admin(current_user=Depends(get_current_user)):
@@ -48,3 +132,7 @@ def require_admin(current_user=Depends(get_current_user)):
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
         )
     return current_user
+
+
+async def require_admin_async(current_user=Depends(get_current_user_async)):
+    return require_admin(current_user)
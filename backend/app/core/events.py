@@ -0,0 +1,225 @@
+"""
+Ticket change events for server-sent event streams.
+
+Services publish after their write commits; GET /tickets/{id}/events
+subscribes to the ticket's channel. Delivery goes through a Broker:
+
+- LocalBroker (default) fans out inside this process. It is enough for one
+  worker and for tests.
+- RedisBroker (settings.events_broker_url = "redis://...") uses Redis
+  pub/sub, so an event published by any worker reaches subscribers on all of
+  them. It needs the optional `redis` package.
+
+Delivery is best-effort and at-most-once. A client that (re)connects should
+load the current state first and then apply events on top.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.core.events")
+
+REPLY_CREATED = "reply_created"
+STATUS_CHANGED = "status_changed"
+
+
+class Subscription(ABC):
+    @abstractmethod
+    async def get(self, timeout: float) -> str | None:
+        """Next message, or None if nothing arrived within timeout seconds."""
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+
+class Broker(ABC):
+    @abstractmethod
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Called from sync code: a threadpool thread, or the event loop thread
+        itself when an async route runs the service via run_sync. In the
+        latter case it must not block at all.
+        """
+
+    @abstractmethod
+    async def subscribe(self, channel: str) -> Subscription: ...
+
+
+class _LocalSubscription(Subscription):
+    def __init__(self, broker: "LocalBroker", channel: str, max_queue: int):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
+
+    def deliver(self, message: str) -> None:
+        # runs on the subscriber's loop via call_soon_threadsafe
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("event_dropped channel=%s reason=slow_consumer", self.channel)
+
+    async def get(self, timeout: float) -> str | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self) -> None:
+        self.broker._remove(self)
+
+
+class LocalBroker(Broker):
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self._subs: dict[str, set[_LocalSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._lock:
+            subs = list(self._subs.get(channel, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.deliver, message)
+            except RuntimeError:  # subscriber's loop already closed
+                self._remove(sub)
+
+    async def subscribe(self, channel: str) -> Subscription:
+        sub = _LocalSubscription(self, channel, self.max_queue)
+        with self._lock:
+            self._subs.setdefault(channel, set()).add(sub)
+        return sub
+
+    def subscriber_count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._subs.get(channel, ()))
+
+    def _remove(self, sub: _LocalSubscription) -> None:
+        with self._lock:
+            subs = self._subs.get(sub.channel)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[sub.channel]
+
+
+class _RedisSubscription(Subscription):
+    def __init__(self, pubsub):
+        self.pubsub = pubsub
+
+    async def get(self, timeout: float) -> str | None:
+        msg = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if msg is None:
+            return None
+        data = msg["data"]
+        return data.decode("utf-8") if isinstance(data, bytes) else data
+
+    async def close(self) -> None:
+        await self.pubsub.aclose()
+
+
+class RedisBroker(Broker):
+    """
+    Publishes with the blocking client from threadpool threads. On the event
+    loop thread (db_async mode) the publish is handed to redis.asyncio as a
+    task instead, so the loop never waits on a Redis round trip.
+    """
+
+    def __init__(self, sync_client, async_client):
+        self._sync = sync_client
+        self._async = async_client
+        self._pending: set[asyncio.Task] = set()
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisBroker":
+        try:
+            import redis
+            import redis.asyncio as aioredis
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError("EVENTS_BROKER_URL=redis://... requires the redis package") from exc
+        return cls(redis.Redis.from_url(url), aioredis.Redis.from_url(url))
+
+    def publish(self, channel: str, message: str) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._sync.publish(channel, message)
+            return
+        task = loop.create_task(self._async.publish(channel, message))
+        self._pending.add(task)  # keep a reference until it is done
+        task.add_done_callback(self._published)
+
+    def _published(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("event_publish_failed reason=%r", task.exception())
+
+    async def subscribe(self, channel: str) -> Subscription:
+        pubsub = self._async.pubsub()
+        await pubsub.subscribe(channel)
+        return _RedisSubscription(pubsub)
+
+
+def _build_broker() -> Broker:
+    url = settings.events_broker_url
+    if url and url.startswith(("redis://", "rediss://")):
+        return RedisBroker.from_url(url)
+    return LocalBroker(max_queue=settings.events_max_queue)
+
+
+broker: Broker = _build_broker()
+
+
+def set_broker(new_broker: Broker) -> None:
+    """Plug in another Broker implementation (or a test double)."""
+    global broker
+    broker = new_broker
+
+
+def ticket_channel(ticket_id: int) -> str:
+    return f"ticket:{ticket_id}"
+
+
+def publish_ticket_event(ticket_id: int, event: str, data: dict[str, Any]) -> None:
+    message = json.dumps({"event": event, "data": data}, default=str)
+    try:
+        broker.publish(ticket_channel(ticket_id), message)
+    except Exception:  # noqa: BLE001  the write already committed; never fail it
+        logger.exception("event_publish_failed ticket_id=%s event=%s", ticket_id, event)
+
+
+async def ticket_event_stream(
+    ticket_id: int,
+    heartbeat_seconds: float | None = None,
+    max_seconds: float | None = None,
+) -> AsyncIterator[str]:
+    """
+    SSE frames for one ticket. A comment line is sent first (so proxies flush
+    headers) and then every heartbeat_seconds while idle. The stream ends
+    after max_seconds; EventSource clients reconnect on their own.
+    """
+    heartbeat = heartbeat_seconds or settings.events_heartbeat_seconds
+    lifetime = max_seconds or settings.events_max_stream_seconds
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + lifetime
+
+    sub = await broker.subscribe(ticket_channel(ticket_id))
+    try:
+        yield ": connected\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            message = await sub.get(timeout=min(heartbeat, remaining))
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            payload = json.loads(message)
+            yield f"event: {payload['event']}\ndata: {json.dumps(payload['data'])}\n\n"
+    finally:
+        await sub.close()
@@ -1,10 +1,13 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse
+
+from app.core.metrics import domain_errors
 from app.domain.errors import (
     DomainError,
     NotFoundError,
     ForbiddenError,
     InvalidTransitionError,
+    OverloadedError,
     ValidationError,
 )
 
@@ -21,8 +24,14 @@ def add_exception_handlers(app):
             status = 400
         if isinstance(exc, ValidationError):
             status = 400
+        headers = None
+        if isinstance(exc, OverloadedError):
+            status = 503
+            headers = {"Retry-After": "1"}
 
+        domain_errors.inc(code=exc.code)
         return JSONResponse(
             status_code=status,
             content={"error": {"code": exc.code, "message": str(exc)}},
+            headers=headers,
         )
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.core.config import settings
+from app.domain.errors import OverloadedError
+
+R = TypeVar("R")
+
+
+class HashingPool:
+    """
+    Dedicated, bounded executor for password hashing/verification.
+
+    bcrypt releases the GIL while hashing, so a few threads give real
+    parallelism while keeping the CPU cost off the shared request threadpool.
+    At most workers + max_queue calls are admitted; beyond that callers get
+    OverloadedError (HTTP 503) instead of piling up behind a login storm.
+
+    Request handlers use `arun`, which awaits the executor from the event loop
+    so queued calls hold no thread at all. `run` blocks its calling thread
+    until the hash is done and is meant for scripts and other sync callers.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hashing")
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._wait_ms_total = 0.0
+        self._run_ms_total = 0.0
+
+    def _admit(self) -> float:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise OverloadedError("Authentication is busy, retry shortly")
+        with self._lock:
+            self._in_flight += 1
+        return time.perf_counter()
+
+    def _release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._completed += 1
+        self._slots.release()
+
+    def _timed(self, submitted: float, fn: Callable[..., R], args: tuple) -> Callable[[], R]:
+        def call() -> R:
+            started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._wait_ms_total += (started - submitted) * 1000
+                    self._run_ms_total += (finished - started) * 1000
+
+        return call
+
+    def run(self, fn: Callable[..., R], *args) -> R:
+        submitted = self._admit()
+        try:
+            return self._executor.submit(self._timed(submitted, fn, args)).result()
+        finally:
+            self._release()
+
+    async def arun(self, fn: Callable[..., R], *args) -> R:
+        submitted = self._admit()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self._timed(submitted, fn, args))
+        finally:
+            self._release()
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            done = self._completed or 1
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.workers),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_wait_ms": round(self._wait_ms_total / done, 2),
+                "avg_run_ms": round(self._run_ms_total / done, 2),
+            }
+
+
+hashing_pool = HashingPool(
+    workers=settings.hashing_pool_workers,
+    max_queue=settings.hashing_pool_max_queue,
+)
@@ -0,0 +1,243 @@
+"""
+Minimal in-process metrics registry with Prometheus text exposition.
+
+Counters and histograms are kept per label tuple in this process. With
+settings.metrics_multiproc_dir set (one directory shared by all uvicorn
+workers), each process periodically dumps its samples to
+<dir>/metrics_<pid>.json and /metrics merges every file, so a scrape that
+lands on any worker reports totals for all of them.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import threading
+import time
+from typing import Iterable
+
+from app.core.config import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._registry: Registry | None = None
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def _touched(self) -> None:
+        if self._registry is not None:
+            self._registry.mark_dirty()
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+        self._touched()
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def dump(self) -> dict:
+        with self._lock:
+            return {"|".join(k): v for k, v in self._values.items()}
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label tuple: [bucket counts..., +Inf count, sum]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+                    break
+            else:
+                row[len(self.buckets)] += 1
+            row[-1] += value
+        self._touched()
+
+    def dump(self) -> dict:
+        with self._lock:
+            return {"|".join(k): list(v) for k, v in self._values.items()}
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._flushed_at = 0.0
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            metric._registry = self
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def reset(self) -> None:
+        with self._lock:
+            for metric in self._metrics.values():
+                with metric._lock:
+                    metric._values.clear()
+
+    # ---- multiprocess ----
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+        if (
+            settings.metrics_multiproc_dir
+            and time.monotonic() - self._flushed_at >= settings.metrics_flush_seconds
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        directory = settings.metrics_multiproc_dir
+        if not directory:
+            return
+        self._flushed_at = time.monotonic()
+        self._dirty = False
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"metrics_{os.getpid()}.json")
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self._dump(), fh)
+        os.replace(tmp, path)
+
+    def _dump(self) -> dict:
+        with self._lock:
+            return {name: m.dump() for name, m in self._metrics.items()}
+
+    def _collect(self) -> dict:
+        directory = settings.metrics_multiproc_dir
+        if not directory:
+            return self._dump()
+
+        self.flush()
+        merged: dict[str, dict] = {}
+        for path in glob.glob(os.path.join(directory, "metrics_*.json")):
+            try:
+                with open(path, encoding="utf-8") as fh:
+                    data = json.load(fh)
+            except (OSError, ValueError):
+                continue  # file being replaced by its worker; picked up next scrape
+            for name, samples in data.items():
+                target = merged.setdefault(name, {})
+                for key, value in samples.items():
+                    if isinstance(value, list):
+                        prev = target.get(key) or [0.0] * len(value)
+                        target[key] = [a + b for a, b in zip(prev, value)]
+                    else:
+                        target[key] = target.get(key, 0.0) + value
+        return merged
+
+    # ---- exposition ----
+
+    def render(self) -> str:
+        data = self._collect()
+        lines: list[str] = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key, value in sorted(data.get(metric.name, {}).items()):
+                labels = dict(zip(metric.labelnames, key.split("|"))) if metric.labelnames else {}
+                if isinstance(metric, Histogram):
+                    bucket = f"{metric.name}_bucket"
+                    cumulative = 0.0
+                    for bound, count in zip(metric.buckets, value):
+                        cumulative += count
+                        lines.append(_sample(bucket, {**labels, "le": _fmt(bound)}, cumulative))
+                    cumulative += value[len(metric.buckets)]
+                    lines.append(_sample(bucket, {**labels, "le": "+Inf"}, cumulative))
+                    lines.append(_sample(f"{metric.name}_count", labels, cumulative))
+                    lines.append(_sample(f"{metric.name}_sum", labels, value[-1]))
+                else:
+                    lines.append(_sample(metric.name, labels, value))
+        return "\n".join(lines) + "\n"
+
+
+def _fmt(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name: str, labels: dict[str, str], value: float) -> str:
+    if labels:
+        rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+        return f"{name}{{{rendered}}} {_fmt(value)}"
+    return f"{name} {_fmt(value)}"
+
+
+registry = Registry()
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, method and status code.",
+    ("method", "route", "status"),
+)
+call_duration = registry.histogram(
+    "app_call_duration_seconds",
+    "Duration of functions wrapped by @timed/@db_timed (endpoints, CRUD).",
+    ("layer", "func"),
+)
+domain_errors = registry.counter(
+    "app_domain_errors_total",
+    "Domain errors returned to clients, by error code.",
+    ("code",),
+)
@@ -1,6 +1,14 @@
+import logging
+import time
 import uuid
 from fastapi import Request
 
+from app.core.config import settings
+from app.core.metrics import http_request_duration
+from app.db.query_stats import track_queries
+
+logger = logging.getLogger("app.db.queries")
+
 
 async def request_id_middleware(request: Request, call_next):
     rid = request.headers.get("X-Request-Id") or str(uuid.uuid4())
@@ -8,3 +16,42 @@ async def request_id_middleware(request: Request, call_next):
     response = await call_next(request)
     response.headers["X-Request-Id"] = rid
     return response
+
+
+async def metrics_middleware(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    # label by template (/tickets/{ticket_id}) to keep cardinality bounded
+    http_request_duration.observe(
+        time.perf_counter() - start,
+        method=request.method,
+        route=getattr(route, "path", "unmatched"),
+        status=str(response.status_code),
+    )
+    return response
+
+
+async def query_stats_middleware(request: Request, call_next):
+    with track_queries() as stats:
+        response = await call_next(request)
+
+    rid = getattr(request.state, "request_id", "-")
+    response.headers["X-DB-Queries"] = str(stats.count)
+    response.headers["Server-Timing"] = f'db;dur={stats.db_ms:.1f};desc="{stats.count} queries"'
+    logger.debug(
+        "request_queries rid=%s path=%s count=%s db_ms=%.1f",
+        rid,
+        request.url.path,
+        stats.count,
+        stats.db_ms,
+    )
+    for sql, n in stats.repeated(settings.n_plus_one_threshold):
+        logger.warning(
+            "n_plus_one_suspect rid=%s path=%s count=%s sql=%s",
+            rid,
+            request.url.path,
+            n,
+            " ".join(sql.split())[:200],
+        )
+    return response
@@ -0,0 +1,51 @@
+from app.core.config import settings
+from app.utils.cache import TTLCache
+
+
+class Principal:
+    """
+    Authenticated caller as seen by routes/policies: just id, email and role.
+
+    Detached from any Session, so it can be cached across requests without
+    expire/refresh surprises.
+    """
+
+    __slots__ = ("id", "email", "role")
+
+    def __init__(self, id: int, email: str, role: str):  # noqa: A002
+        self.id = id
+        self.email = email
+        self.role = role
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(id=user.id, email=user.email, role=user.role)
+
+    def __repr__(self) -> str:
+        return f"Principal(id={self.id!r}, email={self.email!r}, role={self.role!r})"
+
+
+# (sub, iat) -> Principal. Keying on iat means a re-issued token always
+# re-reads the user once; the TTL bounds staleness for changes made by
+# other processes.
+principal_cache: TTLCache[Principal] = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+
+# user id -> current users.token_version, for stateless mode. Other workers
+# see a bump once their entry expires.
+token_version_cache: TTLCache[int] = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl_seconds=settings.token_version_cache_ttl_seconds,
+)
+
+
+def invalidate_principal(email: str, user_id: int | None = None) -> None:
+    """
+    Drop every cached token for this user (role changed, user deleted, ...).
+    """
+    principal_cache.pop_where(lambda key: key[0] == email)
+    if user_id is not None:
+        token_version_cache.pop(user_id)
@@ -0,0 +1,210 @@
+"""
+Response cache for list endpoints, with versioned invalidation.
+
+Entries are keyed by (scope, scope version, request parameters). A scope is
+the set of rows one role can see: "all" for admins, "user:<id>" for one
+customer. Writes do not delete entries. They bump the version of every
+scope that can see the changed ticket, and later lookups use new keys. The
+old entries become unreachable and age out of the LRU/TTL.
+
+The backend is pluggable:
+
+- MemoryBackend (default) is per process. Another worker's write only
+  reaches this process when the TTL expires, so keep the TTL short when
+  running several workers without a shared backend.
+- RedisBackend (settings.response_cache_url = "redis://...") shares entries
+  and versions between workers. It needs the optional `redis` package.
+
+Values must be JSON-serializable, such as the dict form of a response model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterable
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger("app.core.response_cache")
+
+cache_requests = registry.counter(
+    "app_response_cache_requests_total",
+    "Response cache lookups by cache name and result (hit/miss).",
+    ("cache", "result"),
+)
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None: ...
+
+    @abstractmethod
+    def get_versions(self, names: list[str]) -> list[int]: ...
+
+    @abstractmethod
+    def bump_versions(self, names: list[str]) -> None: ...
+
+    def clear(self) -> None:
+        """Drop everything (tests, manual flush). Optional for shared backends."""
+
+
+class MemoryBackend(CacheBackend):
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._entries: TTLCache[Any] = TTLCache(max_size=max_entries, ttl_seconds=ttl_seconds)
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._entries.set(key, value, ttl_seconds=ttl_seconds)
+
+    def get_versions(self, names: list[str]) -> list[int]:
+        with self._lock:
+            return [self._versions.get(n, 0) for n in names]
+
+    def bump_versions(self, names: list[str]) -> None:
+        with self._lock:
+            for n in names:
+                self._versions[n] = self._versions.get(n, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        with self._lock:
+            self._versions.clear()
+
+
+class RedisBackend(CacheBackend):
+    def __init__(self, url: str, prefix: str = "respcache:"):
+        try:
+            import redis
+        except ImportError as exc:  # optional dependency
+            raise RuntimeError("RESPONSE_CACHE_URL=redis://... requires the redis package") from exc
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        raw = self._redis.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._redis.set(self._prefix + key, json.dumps(value), px=int(ttl_seconds * 1000))
+
+    def get_versions(self, names: list[str]) -> list[int]:
+        raw = self._redis.mget([f"{self._prefix}v:{n}" for n in names])
+        return [int(v) if v is not None else 0 for v in raw]
+
+    def bump_versions(self, names: list[str]) -> None:
+        pipe = self._redis.pipeline(transaction=False)
+        for n in names:
+            pipe.incr(f"{self._prefix}v:{n}")
+        pipe.execute()
+
+
+class ResponseCache:
+    def __init__(self, name: str, backend: CacheBackend, ttl_seconds: float, enabled: bool = True):
+        self.name = name
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+    def _key(self, scope: str, params: Any) -> str:
+        version = self.backend.get_versions([f"{self.name}:{scope}"])[0]
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"{self.name}:{scope}:v{version}:{digest}"
+
+    def lookup(self, scope: str, params: Any) -> tuple[str | None, Any | None]:
+        """
+        Returns (key, cached value or None). Pass the key to store() after
+        computing a miss; a None key means the cache is off or unavailable.
+        """
+        if not self.enabled:
+            return None, None
+        try:
+            key = self._key(scope, params)
+            cached = self.backend.get(key)
+        except Exception:  # noqa: BLE001  a cache outage must not fail the read
+            logger.exception("response_cache_unavailable cache=%s", self.name)
+            return None, None
+        cache_requests.inc(cache=self.name, result="hit" if cached is not None else "miss")
+        return key, cached
+
+    def store(self, key: str | None, value: Any) -> None:
+        if key is None:
+            return
+        try:
+            self.backend.set(key, value, self.ttl_seconds)
+        except Exception:  # noqa: BLE001
+            logger.exception("response_cache_unavailable cache=%s", self.name)
+
+    def get_or_set(self, scope: str, params: Any, produce: Callable[[], Any]) -> Any:
+        key, cached = self.lookup(scope, params)
+        if cached is not None:
+            return cached
+        value = produce()
+        self.store(key, value)
+        return value
+
+    def invalidate(self, scopes: Iterable[str]) -> None:
+        names = [f"{self.name}:{s}" for s in dict.fromkeys(scopes)]
+        if not names:
+            return
+        try:
+            self.backend.bump_versions(names)
+        except Exception:  # noqa: BLE001  entries still expire by TTL
+            logger.exception("response_cache_invalidate_failed cache=%s", self.name)
+
+    def stats(self) -> dict[str, float]:
+        hits = cache_requests.value(cache=self.name, result="hit")
+        misses = cache_requests.value(cache=self.name, result="miss")
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+
+def _build_backend() -> CacheBackend:
+    url = settings.response_cache_url
+    if url and url.startswith(("redis://", "rediss://")):
+        return RedisBackend(url)
+    return MemoryBackend(
+        max_entries=settings.response_cache_max_entries,
+        ttl_seconds=settings.response_cache_ttl_seconds,
+    )
+
+
+ticket_list_cache = ResponseCache(
+    "ticket_list",
+    _build_backend(),
+    ttl_seconds=settings.response_cache_ttl_seconds,
+    enabled=settings.response_cache_enabled,
+)
+
+
+def ticket_list_scope(current_user) -> str:
+    return "all" if current_user.role == "ADMIN" else f"user:{current_user.id}"
+
+
+def invalidate_ticket_lists(owner_ids: Iterable[int]) -> None:
+    """
+    A ticket change is visible to its owner's lists and to the admin ("all")
+    lists, so bump both.
+    """
+    ticket_list_cache.invalidate(["all", *(f"user:{uid}" for uid in owner_ids)])
@@ -4,25 +4,38 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
+from app.core.hashing import hashing_pool
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return hashing_pool.run(pwd_context.hash, password)
 
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password, password_hash)
+    return hashing_pool.run(pwd_context.verify, password, password_hash)
 
 
-def create_access_token(subject: str, role: str) -> str:
+async def hash_password_async(password: str) -> str:
+    return await hashing_pool.arun(pwd_context.hash, password)
+
+
+async def verify_password_async(password: str, password_hash: str) -> bool:
+    return await hashing_pool.arun(pwd_context.verify, password, password_hash)
+
+
+def create_access_token(
+    subject: str, role: str, user_id: int | None = None, token_version: int = 0
+) -> str:
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=settings.jwt_expire_minutes)
 
     payload = {
         "sub": subject,
         "role": role,
+        "uid": user_id,
+        "ver": token_version,
         "iat": int(now.timestamp()),
         "exp": int(expire.timestamp()),  # unix timestamp (int)
     }
@@ -0,0 +1,37 @@
+from typing import Hashable
+
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domain.enums import IncludeTotal
+from app.utils.cache import TTLCache
+
+# Short-lived totals keyed by (table, role scope, filter tuple). Good enough for
+# "about N results" in paginated UIs; writes are not reflected until expiry.
+count_cache: TTLCache[int] = TTLCache(
+    max_size=settings.count_cache_max_entries,
+    ttl_seconds=settings.count_cache_ttl_seconds,
+)
+
+
+def count_rows(db: Session, count_q: Select, mode: IncludeTotal | str, key: Hashable) -> int | None:
+    """
+    Resolve the list total for the requested mode:
+      - "false": skip the COUNT entirely
+      - "exact": always run it
+      - "estimate": serve from count_cache, running the COUNT only on a miss
+    """
+    mode = IncludeTotal(mode)
+    if mode == IncludeTotal.FALSE:
+        return None
+
+    if mode == IncludeTotal.ESTIMATE:
+        cached = count_cache.get(key)
+        if cached is not None:
+            return cached
+
+    total = db.scalar(count_q) or 0
+    if mode == IncludeTotal.ESTIMATE:
+        count_cache.set(key, total)
+    return total
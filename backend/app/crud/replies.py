@@ -1,33 +1,152 @@
-from sqlalchemy import asc, select, func
+from typing import Iterable
+
+from sqlalchemy import Row, asc, case, desc, literal, or_, select, func, update
 from sqlalchemy.orm import Session
 
 from app.core.decorators import db_timed, log_call
+from app.core.response_cache import invalidate_ticket_lists
+from app.crud.counts import count_rows
+from app.db.timestamps import stamp_unless_returning
+from app.domain.enums import IncludeTotal
 from app.models.reply import TicketReply
+from app.models.ticket import Ticket
 
 
 @log_call(logger_name="app.crud.replies")
 @db_timed(threshold_ms=15)
 def create_reply(
-    db: Session, ticket_id: int, author_id: int, message: str
+    db: Session, ticket_id: int, author_id: int, message: str, ticket_owner_id: int
 ) -> TicketReply:
     r = TicketReply(ticket_id=ticket_id, author_id=author_id, message=message)
+    stamp_unless_returning(db, r, "created_at")
     db.add(r)
+    db.flush()  # r.created_at via RETURNING (or stamped above)
+
+    # counters move in the reply's transaction; the increment is done by the
+    # database, so concurrent replies cannot lose each other's update
+    # bound with the column type so SQLite stores the same text format
+    created_at = literal(r.created_at, Ticket.last_reply_at.type)
+    newer = or_(Ticket.last_reply_at.is_(None), Ticket.last_reply_at <= created_at)
+    db.execute(
+        update(Ticket)
+        .where(Ticket.id == ticket_id)
+        .values(
+            reply_count=Ticket.reply_count + 1,
+            last_reply_at=case((newer, created_at), else_=Ticket.last_reply_at),
+            last_reply_author_id=case((newer, author_id), else_=Ticket.last_reply_author_id),
+        )
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
-    db.refresh(r)
+    invalidate_ticket_lists([ticket_owner_id])
     return r
 
 
+def _counter_values() -> dict:
+    # correlated per ticket: each lookup is a range on the ticket_id index.
+    # updated_at is carried over, or its onupdate would stamp every
+    # recomputed ticket as just modified.
+    of_ticket = TicketReply.ticket_id == Ticket.id
+    return {
+        "updated_at": Ticket.updated_at,
+        "reply_count": select(func.count()).where(of_ticket).scalar_subquery(),
+        "last_reply_at": select(func.max(TicketReply.created_at))
+        .where(of_ticket)
+        .scalar_subquery(),
+        "last_reply_author_id": select(TicketReply.author_id)
+        .where(of_ticket)
+        .order_by(desc(TicketReply.created_at), desc(TicketReply.id))
+        .limit(1)
+        .scalar_subquery(),
+    }
+
+
+def refresh_reply_counters(db: Session, ticket_ids: Iterable[int]) -> None:
+    """
+    Recompute the counters of the given tickets from their replies, in the
+    caller's transaction (no commit). For writers that add replies in bulk.
+    """
+    ids = list(set(ticket_ids))
+    if ids:
+        db.execute(
+            update(Ticket)
+            .where(Ticket.id.in_(ids))
+            .values(_counter_values())
+            .execution_options(synchronize_session=False)
+        )
+
+
+@log_call(logger_name="app.crud.replies")
+def reconcile_reply_counters(db: Session, batch_size: int = 10_000) -> int:
+    """
+    Recompute reply_count / last_reply_at / last_reply_author_id for every
+    ticket whose stored values disagree with ticket_replies, walking the
+    tickets in id ranges of batch_size with one commit each so no single
+    transaction holds the whole table. Returns the number of tickets fixed.
+    """
+    values = _counter_values()
+    drifted = or_(
+        *(
+            getattr(Ticket, name).is_distinct_from(expr)
+            for name, expr in values.items()
+            if name != "updated_at"
+        )
+    )
+    fixed = 0
+    low = db.scalar(select(func.min(Ticket.id)))
+    high = db.scalar(select(func.max(Ticket.id)))
+    if low is None:
+        return 0
+    while low <= high:
+        result = db.execute(
+            update(Ticket)
+            .where(Ticket.id >= low, Ticket.id < low + batch_size, drifted)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        fixed += result.rowcount
+        low += batch_size
+    return fixed
+
+
+@db_timed(threshold_ms=15)
+def get_thread_version(db: Session, ticket_id: int) -> Row | None:
+    """
+    (user_id, last_reply_id, reply_count) for a ticket, None if the ticket
+    does not exist. Replies are append-only, so the newest id and the count
+    identify the thread's state; both come off the ticket_id index.
+    """
+    return db.execute(
+        select(
+            Ticket.user_id,
+            func.max(TicketReply.id).label("last_reply_id"),
+            func.count(TicketReply.id).label("reply_count"),
+        )
+        .select_from(Ticket)
+        .outerjoin(TicketReply, TicketReply.ticket_id == Ticket.id)
+        .where(Ticket.id == ticket_id)
+        .group_by(Ticket.id, Ticket.user_id)
+    ).first()
+
+
 @db_timed(threshold_ms=15)
 def list_replies(
     db: Session,
     ticket_id: int,
     page: int,
     page_size: int,
-) -> tuple[list[TicketReply], int]:
+    include_total: IncludeTotal | str = IncludeTotal.EXACT,
+) -> tuple[list[TicketReply], int | None]:
     base = select(TicketReply).where(TicketReply.ticket_id == ticket_id)
 
-    # total count
-    total = db.scalar(select(func.count()).select_from(base.subquery())) or 0
+    # total count, straight off the ticket_id index (no subquery)
+    count_q = (
+        select(func.count())
+        .select_from(TicketReply)
+        .where(TicketReply.ticket_id == ticket_id)
+    )
+    total = count_rows(db, count_q, include_total, key=("replies", ticket_id))
 
     # stable ordering (thread order)
     q = (
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import Float, Integer, desc, func, select, text, union_all
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.orm import Session
+
+from app.core.decorators import db_timed
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.utils.pagination import Page
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def search_terms(q: str) -> list[str]:
+    return _WORD.findall(q or "")
+
+
+def _fts5_query(terms: list[str]) -> str:
+    # quote every term so user input cannot inject FTS5 syntax; OR mirrors
+    # MySQL natural-language mode (any term matches, more matches rank higher)
+    return " OR ".join('"' + t.replace('"', '""') + '"' for t in terms)
+
+
+def _sqlite_hits(terms: list[str]):
+    match_q = _fts5_query(terms)
+    # bm25() is lower-is-better, negate it so scores sort like MySQL relevance
+    ticket_hits = text(
+        "SELECT rowid AS ticket_id, -bm25(tickets_fts) AS score "
+        "FROM tickets_fts WHERE tickets_fts MATCH :q"
+    ).columns(ticket_id=Integer, score=Float)
+    reply_hits = text(
+        "SELECT r.ticket_id AS ticket_id, -bm25(ticket_replies_fts) AS score "
+        "FROM ticket_replies_fts JOIN ticket_replies r ON r.id = ticket_replies_fts.rowid "
+        "WHERE ticket_replies_fts MATCH :q"
+    ).columns(ticket_id=Integer, score=Float)
+    return union_all(ticket_hits, reply_hits).subquery("hits"), {"q": match_q}
+
+
+def _mysql_hits(terms: list[str]):
+    q = " ".join(terms)
+    ticket_score = match(Ticket.subject, Ticket.description, against=q).in_natural_language_mode()
+    reply_score = match(TicketReply.message, against=q).in_natural_language_mode()
+    ticket_hits = select(Ticket.id.label("ticket_id"), ticket_score.label("score")).where(
+        ticket_score
+    )
+    reply_hits = select(TicketReply.ticket_id, reply_score.label("score")).where(reply_score)
+    return union_all(ticket_hits, reply_hits).subquery("hits"), {}
+
+
+@db_timed(threshold_ms=50)
+def search_tickets(
+    db: Session,
+    terms: list[str],
+    page: Page,
+    *,
+    is_admin: bool,
+    user_id: int | None = None,
+) -> tuple[list[tuple[Ticket, float]], int]:
+    """
+    Returns ([(ticket, score), ...], total) for tickets whose subject,
+    description or any reply matches, best match first. A ticket's score is
+    the sum of its own match and its replies' matches. Both go through the
+    backend's full-text index (MySQL FULLTEXT, SQLite FTS5), never LIKE.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        hits, params = _sqlite_hits(terms)
+    else:
+        hits, params = _mysql_hits(terms)
+
+    scored = (
+        select(hits.c.ticket_id, func.sum(hits.c.score).label("score"))
+        .group_by(hits.c.ticket_id)
+        .subquery("scored")
+    )
+
+    base_q = select(Ticket, scored.c.score).join(scored, scored.c.ticket_id == Ticket.id)
+    count_q = select(func.count()).select_from(scored).join(Ticket, scored.c.ticket_id == Ticket.id)
+    # RBAC: user sees only own tickets
+    if not is_admin:
+        base_q = base_q.where(Ticket.user_id == user_id)
+        count_q = count_q.where(Ticket.user_id == user_id)
+
+    total = db.scalar(count_q, params)
+    rows = db.execute(
+        base_q.order_by(desc(scored.c.score), desc(Ticket.id))
+        .offset(page.offset)
+        .limit(page.page_size),
+        params,
+    ).all()
+    return [(row[0], row[1]) for row in rows], total
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime
+from typing import Iterable
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.decorators import db_timed, log_call
+from app.models.ticket import Ticket
+from app.models.ticket_stats import TicketDailyStat
+
+# (day, status, priority) -> signed change in ticket count
+StatDeltas = Counter
+
+
+def _day(created_at: datetime | date) -> date:
+    return created_at.date() if isinstance(created_at, datetime) else created_at
+
+
+def ticket_moved(
+    deltas: StatDeltas,
+    created_at: datetime,
+    priority: str,
+    old_status: str | None,
+    new_status: str | None,
+) -> None:
+    """
+    Record one ticket leaving old_status and entering new_status (either may
+    be None for create/delete) in a pending deltas Counter.
+    """
+    day = _day(created_at)
+    if old_status is not None:
+        deltas[(day, old_status, priority)] -= 1
+    if new_status is not None:
+        deltas[(day, new_status, priority)] += 1
+
+
+def bump_ticket_stats(db: Session, deltas: StatDeltas) -> None:
+    """
+    Apply deltas to the rollup with a single upsert (executemany). Does not
+    commit: callers run it inside the transaction that changes the tickets,
+    so the rollup never disagrees with committed ticket rows.
+    """
+    params = [
+        {"day": day, "status": status, "priority": priority, "count": n}
+        for (day, status, priority), n in deltas.items()
+        if n
+    ]
+    if not params:
+        return
+
+    table = TicketDailyStat.__table__
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.day, table.c.status, table.c.priority],
+            set_={"count": table.c.count + stmt.excluded["count"]},
+        )
+        db.execute(stmt, params)
+    elif dialect in ("mysql", "mariadb"):
+        stmt = mysql.insert(table)
+        stmt = stmt.on_duplicate_key_update(count=table.c.count + stmt.inserted["count"])
+        db.execute(stmt, params)
+    else:
+        # no native upsert: update, then insert the buckets that did not exist
+        for p in params:
+            result = db.execute(
+                update(table)
+                .where(
+                    table.c.day == p["day"],
+                    table.c.status == p["status"],
+                    table.c.priority == p["priority"],
+                )
+                .values(count=table.c.count + p["count"])
+            )
+            if result.rowcount == 0:
+                db.execute(table.insert(), [p])
+
+
+@db_timed(threshold_ms=25)
+def list_ticket_stats(
+    db: Session, day_from: date | None = None, day_to: date | None = None
+) -> list[TicketDailyStat]:
+    q = select(TicketDailyStat).where(TicketDailyStat.count != 0)
+    if day_from:
+        q = q.where(TicketDailyStat.day >= day_from)
+    if day_to:
+        q = q.where(TicketDailyStat.day <= day_to)
+    return list(db.scalars(q.order_by(TicketDailyStat.day)))
+
+
+@log_call(logger_name="app.crud.stats")
+@db_timed(threshold_ms=1000)
+def rebuild_ticket_stats(db: Session) -> int:
+    """
+    Recompute the whole rollup from tickets in one transaction (a set-based
+    INSERT ... SELECT ... GROUP BY). Returns the number of buckets written.
+    """
+    day = func.date(Ticket.created_at)
+    grouped = select(day, Ticket.status, Ticket.priority, func.count()).group_by(
+        day, Ticket.status, Ticket.priority
+    )
+    db.execute(delete(TicketDailyStat))
+    db.execute(
+        TicketDailyStat.__table__.insert().from_select(
+            ["day", "status", "priority", "count"], grouped
+        )
+    )
+    db.commit()
+    return db.scalar(select(func.count()).select_from(TicketDailyStat))
+
+
+def deltas_for_new_tickets(rows: Iterable[dict]) -> StatDeltas:
+    deltas: StatDeltas = Counter()
+    for row in rows:
+        ticket_moved(deltas, row["created_at"], row["priority"], None, row["status"])
+    return deltas
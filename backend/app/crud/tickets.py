@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 from datetime import datetime
-from sqlalchemy import and_, desc, func, select
+from typing import Iterator, Sequence
+
+from sqlalchemy import Row, and_, case, desc, false, func, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.core.decorators import db_timed, log_call
+from app.core.response_cache import invalidate_ticket_lists
 from app.core.transitions import validate_transition
+from app.crud.counts import count_rows
+from app.crud.stats import StatDeltas, bump_ticket_stats, ticket_moved
+from app.db.timestamps import stamp_unless_returning, utcnow
+from app.domain.enums import PRIORITY_RANK, IncludeTotal, TicketSort
 from app.models.ticket import Ticket
-from app.utils.pagination import Page
+from app.utils.pagination import Cursor, Page
 
 
 @log_call(logger_name="app.crud.tickets")
@@ -18,9 +25,15 @@ def create_ticket(
     t = Ticket(
         user_id=user_id, subject=subject, description=description, priority=priority
     )
+    stamp_unless_returning(db, t, "created_at", "updated_at")
     db.add(t)
+    db.flush()  # INSERT ... RETURNING gives created_at for the stats bucket
+
+    deltas = StatDeltas()
+    ticket_moved(deltas, t.created_at, t.priority, None, t.status)
+    bump_ticket_stats(db, deltas)
     db.commit()
-    db.refresh(t)
+    invalidate_ticket_lists([t.user_id])
     return t
 
 
@@ -29,18 +42,40 @@ def get_ticket(db: Session, ticket_id: int) -> Ticket | None:
     return db.get(Ticket, ticket_id)
 
 
-@db_timed(threshold_ms=25)
-def list_tickets(
-    db: Session,
-    page: Page,
+@db_timed(threshold_ms=15)
+def get_tickets_by_ids(db: Session, ticket_ids: Sequence[int]) -> dict[int, Ticket]:
+    """
+    Full tickets by id in one SELECT ... WHERE id IN (...); ids with no row
+    are simply absent from the result.
+    """
+    if not ticket_ids:
+        return {}
+    rows = db.scalars(select(Ticket).where(Ticket.id.in_(ticket_ids)))
+    return {t.id: t for t in rows}
+
+
+@db_timed(threshold_ms=10)
+def get_ticket_version(db: Session, ticket_id: int) -> Row | None:
+    """
+    (id, user_id, status, updated_at, reply_count) by primary key: enough for
+    RBAC and an ETag without loading or hydrating the full ticket.
+    """
+    return db.execute(
+        select(
+            Ticket.id, Ticket.user_id, Ticket.status, Ticket.updated_at, Ticket.reply_count
+        ).where(Ticket.id == ticket_id)
+    ).first()
+
+
+def _ticket_filters(
     *,
     is_admin: bool,
-    user_id: int | None = None,
-    status: str | None = None,
-    priority: str | None = None,
-    created_from: datetime | None = None,
-    created_to: datetime | None = None,
-) -> tuple[list[Ticket], int]:
+    user_id: int | None,
+    status: str | None,
+    priority: str | None,
+    created_from: datetime | None,
+    created_to: datetime | None,
+):
     filters = []
 
     # RBAC: user sees only own tickets
@@ -61,7 +96,105 @@ def list_tickets(
     if created_to:
         filters.append(Ticket.created_at <= created_to)
 
-    where_clause = and_(*filters) if filters else None
+    return and_(*filters) if filters else None
+
+
+# ORDER BY keys before the id tiebreaker, and their direction, per sort
+# mode. Every mode has a matching (key..., id) index per list scope on the
+# Ticket model, so pages are read in index order without a sort step.
+SORT_KEYS = {
+    TicketSort.NEWEST: ((Ticket.created_at,), True),
+    TicketSort.OLDEST: ((Ticket.created_at,), False),
+    TicketSort.PRIORITY: ((Ticket.priority_rank, Ticket.created_at), True),
+    TicketSort.UPDATED: ((Ticket.updated_at,), True),
+    TicketSort.ACTIVE: ((Ticket.last_reply_at,), True),
+}
+
+
+def cursor_fits_sort(cursor: Cursor, sort: TicketSort) -> bool:
+    """
+    Whether `cursor` carries one value of the right type per SORT_KEYS[sort]
+    column (None only for nullable ones), so it can be bound in the seek
+    predicate. Cursors are client-supplied, so anything else is rejected.
+    """
+    keys, _ = SORT_KEYS[sort]
+    if cursor.sort != sort or len(cursor.keys) != len(keys):
+        return False
+    if isinstance(cursor.id, bool) or not isinstance(cursor.id, int):
+        return False
+    for column, value in zip(keys, cursor.keys):
+        if value is None:
+            if not column.expression.nullable:
+                return False
+        elif isinstance(value, bool) or not isinstance(value, column.type.python_type):
+            return False
+    return True
+
+
+def _sorts_after(column, value, descending: bool):
+    """
+    Rows whose `column` sorts strictly after `value`. SQLite and MySQL order
+    NULL lowest, so NULLs come last in a DESC list and first in an ASC one.
+    """
+    if value is None:
+        return false() if descending else column.is_not(None)
+    if not descending:
+        return column > value
+    if column.expression.nullable:
+        return or_(column < value, column.is_(None))
+    return column < value
+
+
+def _seek_after(keys: tuple, cursor: Cursor, descending: bool):
+    # expanded form of (k1, ..., id) < (:v1, ..., :id) so MySQL can range-scan
+    # the index: k1 after v1, or k1 equal and k2 after v2, ... then id
+    columns, values = (*keys, Ticket.id), (*cursor.keys, cursor.id)
+    branches = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal = [c.is_(None) if v is None else c == v for c, v in zip(columns[:i], values[:i])]
+        branches.append(and_(*equal, _sorts_after(column, value, descending)))
+    seek = or_(*branches)
+
+    # redundant bound on the leading key, which SQLite needs to start the index
+    # scan at the cursor. Not for a nullable key: "<= v OR IS NULL" turns into
+    # a multi-index OR plus a sort there (MySQL range-scans the OR form as is).
+    lead, value = columns[0], values[0]
+    if value is not None and not lead.expression.nullable:
+        return and_(lead <= value if descending else lead >= value, seek)
+    return seek
+
+
+@db_timed(threshold_ms=25)
+def list_tickets(
+    db: Session,
+    page: Page,
+    *,
+    is_admin: bool,
+    user_id: int | None = None,
+    status: str | None = None,
+    priority: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    include_total: IncludeTotal | str = IncludeTotal.EXACT,
+    sort: TicketSort = TicketSort.NEWEST,
+) -> tuple[list[Ticket], int | None, Cursor | None]:
+    """
+    Returns (items, total, next_cursor).
+
+    Rows are ordered by SORT_KEYS[sort] and then id. With page.cursor set
+    (it must come from the same sort), rows are located by a seek predicate
+    on those keys instead of OFFSET, so deep pages cost the same as the
+    first one. next_cursor is None once there are no further rows; total is
+    None when include_total="false".
+    """
+    where_clause = _ticket_filters(
+        is_admin=is_admin,
+        user_id=user_id,
+        status=status,
+        priority=priority,
+        created_from=created_from,
+        created_to=created_to,
+    )
 
     base_q = select(Ticket)
     count_q = select(func.count()).select_from(Ticket)
@@ -70,23 +203,198 @@ def list_tickets(
         base_q = base_q.where(where_clause)
         count_q = count_q.where(where_clause)
 
-    total = db.scalar(count_q) or 0
+    scope = ("tickets", "admin" if is_admin else user_id)
+    total = count_rows(
+        db,
+        count_q,
+        include_total,
+        key=(*scope, status, priority, created_from, created_to),
+    )
+
+    keys, descending = SORT_KEYS[sort]
+    base_q = base_q.order_by(
+        *(c.desc() if descending else c.asc() for c in (*keys, Ticket.id))
+    )
+    if page.cursor is not None:
+        if not cursor_fits_sort(page.cursor, sort):
+            raise ValueError("cursor does not match the sort")
+        base_q = base_q.where(_seek_after(keys, page.cursor, descending))
+    else:
+        base_q = base_q.offset(page.offset)
+
+    # one extra row tells us whether another page exists
+    rows = db.scalars(base_q.limit(page.page_size + 1)).all()
+    items = rows[: page.page_size]
+
+    next_cursor = None
+    if len(rows) > page.page_size:
+        last = items[-1]
+        next_cursor = Cursor(
+            keys=tuple(getattr(last, c.key) for c in keys), id=last.id, sort=sort.value
+        )
+
+    return items, total, next_cursor
+
+
+@log_call(logger_name="app.crud.tickets")
+def backfill_priority_rank(db: Session) -> int:
+    """
+    Set priority_rank from priority wherever they disagree (after the column
+    was added, or out-of-band priority edits). Returns the rows updated.
+    """
+    rank = case(
+        {priority.value: value for priority, value in PRIORITY_RANK.items()},
+        value=Ticket.priority,
+        else_=0,
+    )
+    result = db.execute(
+        update(Ticket)
+        .where(Ticket.priority_rank != rank)
+        .values(priority_rank=rank, updated_at=Ticket.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
 
-    items = db.scalars(
-        base_q.order_by(desc(Ticket.created_at), desc(Ticket.id))
-        .offset(page.offset)
-        .limit(page.page_size)
-    ).all()
+EXPORT_COLUMNS = (
+    Ticket.id,
+    Ticket.user_id,
+    Ticket.subject,
+    Ticket.description,
+    Ticket.status,
+    Ticket.priority,
+    Ticket.created_at,
+    Ticket.updated_at,
+)
+
+
+def iter_tickets(
+    db: Session,
+    *,
+    is_admin: bool,
+    user_id: int | None = None,
+    status: str | None = None,
+    priority: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    batch_size: int = 1000,
+) -> Iterator[Sequence[Row]]:
+    """
+    Yields the matching tickets as plain rows (EXPORT_COLUMNS), newest first,
+    in batches of batch_size. stream_results makes the driver use a
+    server-side cursor, so only one batch is held in memory at a time.
+    """
+    where_clause = _ticket_filters(
+        is_admin=is_admin,
+        user_id=user_id,
+        status=status,
+        priority=priority,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    q = select(*EXPORT_COLUMNS).order_by(desc(Ticket.created_at), desc(Ticket.id))
+    if where_clause is not None:
+        q = q.where(where_clause)
 
-    return items, total
+    result = db.execute(q.execution_options(stream_results=True, yield_per=batch_size))
+    try:
+        yield from result.partitions()
+    finally:
+        result.close()
 
 
 @log_call(logger_name="app.crud.tickets")
 @db_timed(threshold_ms=20)
 def update_ticket_status(db: Session, ticket: Ticket, new_status: str) -> Ticket:
     validate_transition(ticket.status, new_status)
+    deltas = StatDeltas()
+    ticket_moved(deltas, ticket.created_at, ticket.priority, ticket.status, new_status)
+
     ticket.status = new_status
+    stamp_unless_returning(db, ticket, "updated_at", update=True)
     db.add(ticket)
+    bump_ticket_stats(db, deltas)
     db.commit()
-    db.refresh(ticket)
+    invalidate_ticket_lists([ticket.user_id])
     return ticket
+
+
+@db_timed(threshold_ms=25)
+def get_ticket_states(db: Session, ticket_ids: list[int]) -> dict[int, Row]:
+    """
+    Lightweight (id, user_id, status, priority, created_at) rows by id,
+    without loading full tickets; enough to validate transitions, move stats
+    and invalidate the owners' cached lists.
+    """
+    rows = db.execute(
+        select(
+            Ticket.id, Ticket.user_id, Ticket.status, Ticket.priority, Ticket.created_at
+        ).where(Ticket.id.in_(ticket_ids))
+    )
+    return {row.id: row for row in rows}
+
+
+@log_call(logger_name="app.crud.tickets")
+@db_timed(threshold_ms=50)
+def bulk_update_ticket_status(
+    db: Session,
+    ids_by_status: dict[str, list[int]],
+    new_status: str,
+    states: dict[int, Row],
+) -> list[int]:
+    """
+    One UPDATE per source status, each guarded by that status so a row changed
+    concurrently since it was read is left alone. Stats for the moved rows
+    (from `states`, as read by get_ticket_states) go in one upsert. Single
+    commit. Returns the ids that moved under us since `states` was read and
+    were left alone, normally empty.
+
+    A row a concurrent writer already put in new_status looks the same after
+    the UPDATE as one we moved, so rowcount alone cannot tell them apart.
+    With UPDATE ... RETURNING the ids we actually moved come back directly;
+    elsewhere the rows are locked and compared with their `states` snapshot
+    first, and any whose status changed are skipped.
+    """
+    now = utcnow()
+    returning = db.get_bind().dialect.update_returning
+    stale: list[int] = []
+    moved_by_status: dict[str, list[int]] = {}
+    for old_status, ids in ids_by_status.items():
+        validate_transition(old_status, new_status)
+        if not returning:
+            current = dict(
+                db.execute(
+                    select(Ticket.id, Ticket.status).where(Ticket.id.in_(ids)).with_for_update()
+                ).all()
+            )
+            changed = {i for i in ids if current.get(i) != states[i].status}
+            stale.extend(i for i in ids if i in changed)
+            ids = [i for i in ids if i not in changed]
+            if not ids:
+                continue
+        stmt = (
+            update(Ticket)
+            .where(Ticket.id.in_(ids), Ticket.status == old_status)
+            .values(status=new_status, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if returning:
+            updated = set(db.scalars(stmt.returning(Ticket.id)))
+            stale.extend(i for i in ids if i not in updated)
+            moved_by_status[old_status] = [i for i in ids if i in updated]
+        else:
+            db.execute(stmt)
+            moved_by_status[old_status] = ids
+
+    deltas = StatDeltas()
+    owners = set()
+    for old_status, ids in moved_by_status.items():
+        for i in ids:
+            state = states[i]
+            ticket_moved(deltas, state.created_at, state.priority, old_status, new_status)
+            owners.add(state.user_id)
+    bump_ticket_stats(db, deltas)
+    db.commit()
+    invalidate_ticket_lists(owners)
+    return stale
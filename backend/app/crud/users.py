@@ -2,7 +2,9 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.decorators import db_timed, log_call
+from app.core.principal import invalidate_principal
 from app.core.security import hash_password
+from app.db.timestamps import stamp_unless_returning
 from app.models.user import User
 
 
@@ -14,8 +16,51 @@ def get_user_by_email(db: Session, email: str) -> User | None:
 @log_call(logger_name="app.crud.users")
 @db_timed(threshold_ms=10)
 def create_user(db: Session, email: str, password: str, role: str = "USER") -> User:
-    user = User(email=email, password_hash=hash_password(password), role=role)
+    return insert_user(db, email=email, password_hash=hash_password(password), role=role)
+
+
+@log_call(logger_name="app.crud.users")
+@db_timed(threshold_ms=10)
+def insert_user(db: Session, email: str, password_hash: str, role: str = "USER") -> User:
+    """create_user for callers that hashed the password themselves."""
+    user = User(email=email, password_hash=password_hash, role=role)
+    stamp_unless_returning(db, user, "created_at")
+    db.add(user)
+    db.commit()
+    return user
+
+
+@log_call(logger_name="app.crud.users")
+@db_timed(threshold_ms=10)
+def update_user_role(db: Session, user: User, role: str) -> User:
+    user.role = role
+    # tokens carry the old role claim; revoke them
+    user.token_version += 1
+    db.add(user)
+    db.commit()
+    invalidate_principal(user.email, user.id)
+    return user
+
+
+@db_timed(threshold_ms=10)
+def get_token_version(db: Session, user_id: int) -> int | None:
+    return db.scalar(select(User.token_version).where(User.id == user_id))
+
+
+@log_call(logger_name="app.crud.users")
+@db_timed(threshold_ms=10)
+def revoke_user_tokens(db: Session, user: User) -> User:
+    user.token_version += 1
     db.add(user)
     db.commit()
-    db.refresh(user)
+    invalidate_principal(user.email, user.id)
     return user
+
+
+@log_call(logger_name="app.crud.users")
+@db_timed(threshold_ms=10)
+def delete_user(db: Session, user: User) -> None:
+    email, user_id = user.email, user.id
+    db.delete(user)
+    db.commit()
+    invalidate_principal(email, user_id)
@@ -0,0 +1,120 @@
+"""
+Full-text index plumbing.
+
+MySQL uses FULLTEXT indexes declared on the models. SQLite has no FULLTEXT,
+so there each searchable table gets an external-content FTS5 table that
+triggers keep in sync. It holds only the inverted index; the text stays in
+the base table. The FTS5 tables are created and dropped together with their
+base tables, and ensure_fts() adds them to an existing SQLite database.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+
+logger = logging.getLogger("app.db.fulltext")
+
+# base table -> (fts table, indexed columns)
+FTS_TABLES = {
+    Ticket.__tablename__: ("tickets_fts", ("subject", "description")),
+    TicketReply.__tablename__: ("ticket_replies_fts", ("message",)),
+}
+
+
+def _fts_ddl(base: str) -> list[str]:
+    fts, cols = FTS_TABLES[base]
+    col_list = ", ".join(cols)
+    new_vals = ", ".join(f"new.{c}" for c in cols)
+    old_vals = ", ".join(f"old.{c}" for c in cols)
+    delete_row = (
+        f"INSERT INTO {fts}({fts}, rowid, {col_list}) VALUES ('delete', old.id, {old_vals});"
+    )
+    insert_row = f"INSERT INTO {fts}(rowid, {col_list}) VALUES (new.id, {new_vals});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{col_list}, content='{base}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {base} BEGIN {insert_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {base} BEGIN {delete_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {col_list} ON {base} "
+        f"BEGIN {delete_row} {insert_row} END",
+    ]
+
+
+def _drop_fts(conn: Connection, base: str) -> None:
+    fts, _ = FTS_TABLES[base]
+    conn.execute(text(f"DROP TABLE IF EXISTS {fts}"))
+
+
+def _create_fts(conn: Connection, base: str) -> None:
+    for ddl in _fts_ddl(base):
+        conn.execute(text(ddl))
+
+
+def ensure_fts(engine: Engine) -> list[str]:
+    """
+    Create missing FTS5 tables on an existing SQLite database and index the
+    rows already there. No-op on other backends. Returns the tables created.
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+    existing = set(inspect(engine).get_table_names())
+    created = []
+    for base, (fts, _) in FTS_TABLES.items():
+        if base not in existing or fts in existing:
+            continue
+        logger.info("creating_fts table=%s", fts)
+        with engine.begin() as conn:
+            _create_fts(conn, base)
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        created.append(fts)
+    return created
+
+
+@contextmanager
+def deferred_fts(conn: Connection) -> Iterator[None]:
+    """
+    For bulk loads on SQLite: drop the FTS insert triggers for the duration,
+    then recreate them and rebuild each index in one pass, instead of
+    indexing row by row. Rows inserted by anyone else meanwhile are covered by
+    the rebuild. No-op on other backends.
+    """
+    if conn.dialect.name != "sqlite":
+        yield
+        return
+    for fts, _ in FTS_TABLES.values():
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {fts}_ai"))
+    conn.commit()
+    try:
+        yield
+    finally:
+        conn.rollback()  # no-op after a clean load; discards a failed batch
+        for base, (fts, _) in FTS_TABLES.items():
+            _create_fts(conn, base)  # IF NOT EXISTS: only the dropped triggers
+            conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        conn.commit()
+
+
+def _after_create(table, conn: Connection, **_kw) -> None:
+    if conn.dialect.name == "sqlite":
+        # a leftover index from a previously dropped table would map old
+        # rowids to new rows
+        _drop_fts(conn, table.name)
+        _create_fts(conn, table.name)
+
+
+def _before_drop(table, conn: Connection, **_kw) -> None:
+    if conn.dialect.name == "sqlite":
+        _drop_fts(conn, table.name)
+
+
+for _model in (Ticket, TicketReply):
+    event.listen(_model.__table__, "after_create", _after_create)
+    event.listen(_model.__table__, "before_drop", _before_drop)
@@ -0,0 +1,103 @@
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import CreateColumn
+
+from app.db.base import Base
+from app.db.fulltext import ensure_fts
+
+logger = logging.getLogger("app.db.migrations")
+
+
+def missing_columns(engine: Engine) -> list:
+    """
+    Model columns not present on existing tables. New columns must be
+    nullable or carry a server_default so existing rows stay valid.
+    """
+    insp = inspect(engine)
+    existing_tables = set(insp.get_table_names())
+
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {col["name"] for col in insp.get_columns(table.name)}
+        missing.extend(col for col in table.columns if col.name not in present)
+    return missing
+
+
+def missing_indexes(engine: Engine) -> list:
+    """
+    Indexes declared on the models that do not exist yet in the database.
+    Tables that do not exist at all are skipped: create_all() builds them
+    together with their indexes.
+    """
+    insp = inspect(engine)
+    existing_tables = set(insp.get_table_names())
+
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        present = {ix["name"] for ix in insp.get_indexes(table.name)}
+        missing.extend(
+            ix
+            for ix in table.indexes
+            if ix.name not in present and index_applies_to(ix, engine.dialect.name)
+        )
+    return missing
+
+
+def index_applies_to(ix, dialect_name: str) -> bool:
+    # indexes declared with .ddl_if(dialect=...) exist only on that backend
+    ddl_if = getattr(ix, "_ddl_if", None)
+    if ddl_if is None or ddl_if.dialect is None:
+        return True
+    dialects = (ddl_if.dialect,) if isinstance(ddl_if.dialect, str) else ddl_if.dialect
+    return dialect_name in dialects
+
+
+def upgrade(engine: Engine) -> list[str]:
+    """
+    Bring an existing schema up to date with the models.
+
+    create_all() never touches tables that already exist, so columns and
+    indexes added to a model after the first deploy are created here. Safe
+    to run repeatedly; returns the names of what it created.
+    """
+    created = []
+    for col in missing_columns(engine):
+        ddl = CreateColumn(col).compile(dialect=engine.dialect)
+        logger.info("adding_column table=%s column=%s", col.table.name, col.name)
+        with engine.begin() as conn:
+            conn.execute(text(f"ALTER TABLE {col.table.name} ADD COLUMN {ddl}"))
+        created.append(f"{col.table.name}.{col.name}")
+
+    for ix in missing_indexes(engine):
+        logger.info("creating_index table=%s index=%s", ix.table.name, ix.name)
+        ix.create(bind=engine)
+        created.append(ix.name)
+
+    _backfill(engine, created)
+
+    created.extend(ensure_fts(engine))
+    return created
+
+
+def _backfill(engine: Engine, created: list[str]) -> None:
+    """
+    Derived columns that were just added hold their server default on every
+    existing row; fill them once from the data they derive from.
+    """
+    # imported here because app.crud depends on app.db
+    from sqlalchemy.orm import Session
+
+    from app.crud.replies import reconcile_reply_counters
+    from app.crud.tickets import backfill_priority_rank
+
+    with Session(bind=engine) as db:
+        if "tickets.priority_rank" in created:
+            logger.info("backfilled_priority_rank tickets=%s", backfill_priority_rank(db))
+        if "tickets.reply_count" in created:
+            logger.info("backfilled_reply_counters tickets=%s", reconcile_reply_counters(db))
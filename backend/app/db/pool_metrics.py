@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    Counters for one engine's connection pool, fed by pool events plus the
+    checkout wait measured in InstrumentedQueuePool.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidated = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record_wait(self, wait_ms: float) -> None:
+        with self._lock:
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def attach(self, engine: Engine) -> None:
+        pool = engine.pool
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self
+
+        @event.listens_for(pool, "checkout")
+        def _on_checkout(*_args) -> None:
+            with self._lock:
+                self.checkouts += 1
+
+        @event.listens_for(pool, "connect")
+        def _on_connect(*_args) -> None:
+            with self._lock:
+                self.connects += 1
+
+        @event.listens_for(pool, "invalidate")
+        def _on_invalidate(*_args) -> None:
+            with self._lock:
+                self.invalidated += 1
+
+        @event.listens_for(pool, "soft_invalidate")
+        def _on_soft_invalidate(*_args) -> None:
+            with self._lock:
+                self.invalidated += 1
+
+    def snapshot(self, engine: Engine) -> dict[str, float | int | str | None]:
+        pool = engine.pool
+
+        def _call(name: str):
+            fn = getattr(pool, name, None)
+            return fn() if callable(fn) else None
+
+        with self._lock:
+            return {
+                "pool_class": type(pool).__name__,
+                "size": _call("size"),
+                "checked_out": _call("checkedout"),
+                "checked_in": _call("checkedin"),
+                "overflow": _call("overflow"),
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidated": self.invalidated,
+                "avg_wait_ms": round(self.wait_ms_total / (self.checkouts or 1), 3),
+                "max_wait_ms": round(self.wait_ms_max, 3),
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that times how long a checkout waits for a free connection
+    (including opening a new one), which pool events cannot observe.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_wait((time.perf_counter() - start) * 1000)
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
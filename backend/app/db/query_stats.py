@@ -0,0 +1,99 @@
+"""
+Per-request SQL statement accounting.
+
+Engine-wide cursor events add every statement (and its DB time) to the
+QueryStats bound to the current context; the HTTP middleware binds one per
+request. assert_max_queries() registers a process-wide observer instead,
+because TestClient runs the app on another thread than the test body.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    __slots__ = ("count", "db_ms", "statements")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.db_ms = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def add(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.db_ms += elapsed_ms
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        Statements executed at least `threshold` times: the usual N+1 shape
+        (same SELECT with different parameters, once per parent row).
+        """
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+# test-mode observers: see every statement regardless of thread/context
+_observers: list[QueryStats] = []
+_observers_lock = threading.Lock()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_count: int) -> Iterator[QueryStats]:
+    """
+    Test helper: fail if the block runs more than max_count statements.
+
+        with assert_max_queries(2):
+            client.get("/tickets", headers=headers)
+    """
+    stats = QueryStats()
+    with _observers_lock:
+        _observers.append(stats)
+    try:
+        yield stats
+    finally:
+        with _observers_lock:
+            _observers.remove(stats)
+    if stats.count > max_count:
+        listing = "\n".join(f"  {n}x {sql}" for sql, n in stats.statements.most_common())
+        raise AssertionError(f"expected at most {max_count} queries, ran {stats.count}:\n{listing}")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+    if _current.get() is not None or _observers:
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, _cursor, statement, _parameters, _context, _executemany):
+    stats = _current.get()
+    if stats is None and not _observers:
+        return
+    starts = conn.info.get("query_start")
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000 if starts else 0.0
+    if stats is not None:
+        stats.add(statement, elapsed_ms)
+    with _observers_lock:
+        for observer in _observers:
+            observer.add(statement, elapsed_ms)
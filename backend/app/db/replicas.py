@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from typing import Callable
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.db.session import engine_options
+from app.utils.cache import TTLCache
+
+logger = logging.getLogger("app.db.replicas")
+
+
+class _Replica:
+    def __init__(self, url: str, engine_kwargs: dict):
+        self.engine = create_engine(url, **engine_kwargs)
+        self.session_factory = sessionmaker(
+            bind=self.engine, autocommit=False, autoflush=False, expire_on_commit=False
+        )
+        self.down_until = 0.0
+        self.checked_at = 0.0
+
+
+class ReplicaRouter:
+    """
+    Picks a read replica per request: round-robin over healthy replicas,
+    falling back to the primary when none is usable or when the caller wrote
+    within the last sticky_seconds (read-your-writes).
+
+    Health: a replica is probed with SELECT 1 at most every
+    health_check_seconds; a failed probe or a connection error during a
+    request takes it out of rotation for that long.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        sticky_seconds: float,
+        health_check_seconds: float,
+        engine_kwargs_for: Callable[[str], dict] = engine_options,
+    ):
+        self.replicas = [_Replica(url, engine_kwargs_for(url)) for url in urls]
+        self.health_check_seconds = health_check_seconds
+        self._rr = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._lock = threading.Lock()
+        self._recent_writers: TTLCache[bool] = TTLCache(
+            max_size=100_000, ttl_seconds=sticky_seconds
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def note_write(self, user_id: int) -> None:
+        self._recent_writers.set(user_id, True)
+
+    def is_sticky(self, user_id: int | None) -> bool:
+        return user_id is not None and self._recent_writers.get(user_id, False)
+
+    def mark_down(self, replica: _Replica) -> None:
+        replica.down_until = time.monotonic() + self.health_check_seconds
+        logger.warning("replica_down url=%s", replica.engine.url.render_as_string())
+
+    def _healthy(self, replica: _Replica) -> bool:
+        now = time.monotonic()
+        if replica.down_until > now:
+            return False
+        if now - replica.checked_at < self.health_check_seconds:
+            return True
+        replica.checked_at = now
+        try:
+            with replica.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception:  # noqa: BLE001  any driver error means "not usable now"
+            self.mark_down(replica)
+            return False
+        return True
+
+    def pick(self) -> _Replica | None:
+        if not self.replicas:
+            return None
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                replica = self.replicas[next(self._rr)]
+            if self._healthy(replica):
+                return replica
+        return None
+
+
+replica_router = ReplicaRouter(
+    settings.db_replica_urls,
+    sticky_seconds=settings.replica_sticky_seconds,
+    health_check_seconds=settings.replica_health_check_seconds,
+)
+
+
+# Read-your-writes bookkeeping: get_current_user stamps the session with the
+# caller's id; a commit that flushed anything marks that user sticky.
+@event.listens_for(Session, "after_flush")
+def _flag_write(session: Session, _flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _note_write(session: Session) -> None:
+    if session.info.pop("wrote", False) and replica_router.enabled:
+        user_id = session.info.get("principal_id")
+        if user_id is not None:
+            replica_router.note_write(user_id)
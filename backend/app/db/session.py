@@ -1,30 +1,30 @@
 import logging
+import ssl
 from pathlib import Path
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import settings
 from app.db.base import Base
+from app.db.migrations import upgrade
 from app.models import (
     user,
     ticket,
     reply,
 )  # noqa: F401  # ensure models imported for metadata
 from app.core.decorators import db_timed
+from app.db.pool_metrics import InstrumentedQueuePool, PoolMetrics
 
 logger = logging.getLogger("app.db.session")
 
 
-def _build_connect_args() -> dict:
+def _resolve_ca_path() -> str | None:
     """
-    Aiven requires TLS. PyMySQL needs ssl as a dict, not 'ssl=true'.
     supports:
       - settings.db_ssl_ca_path: a filesystem path to CA pem
       - settings.db_ssl_ca_pem: the PEM content stored in env var
     """
-    if not settings.resolved_database_url.startswith("mysql+pymysql://"):
-        return {}
-
     ca_path = settings.db_ssl_ca_path
 
     if not ca_path and settings.db_ssl_ca_pem:
@@ -33,6 +33,18 @@ def _build_connect_args() -> dict:
         pem_file.write_text(settings.db_ssl_ca_pem, encoding="utf-8")
         ca_path = str(pem_file)
 
+    return ca_path
+
+
+def _build_connect_args(url: str | None = None) -> dict:
+    """
+    Aiven requires TLS. PyMySQL needs ssl as a dict, not 'ssl=true'.
+    """
+    url = url or settings.resolved_database_url
+    if not url.startswith("mysql+pymysql://"):
+        return {}
+
+    ca_path = _resolve_ca_path()
     if ca_path:
         return {"ssl": {"ca": ca_path}}
 
@@ -41,16 +53,47 @@ def _build_connect_args() -> dict:
     return {}
 
 
-engine = create_engine(
-    settings.resolved_database_url,
-    pool_pre_ping=True,
-    connect_args=_build_connect_args(),
-)
+def _build_pool_kwargs(url: str) -> dict:
+    # SQLite uses SingletonThreadPool/StaticPool, which reject QueuePool sizing
+    if url.startswith("sqlite"):
+        return {"pool_pre_ping": settings.db_pool_pre_ping}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def engine_options(url: str) -> dict:
+    """
+    create_engine() kwargs for a sync URL (primary or replica).
+    """
+    kwargs = _build_pool_kwargs(url)
+    if not url.startswith("sqlite"):
+        kwargs["poolclass"] = InstrumentedQueuePool
+    kwargs["connect_args"] = _build_connect_args(url)
+    return kwargs
+
+
+def _build_engine():
+    url = settings.resolved_database_url
+    return create_engine(url, **engine_options(url))
+
 
+engine = _build_engine()
+pool_metrics = PoolMetrics()
+pool_metrics.attach(engine)
 
+
+# expire_on_commit=False: crud functions return the committed object as-is;
+# server defaults are already loaded (RETURNING or app-side), so expiring
+# would only force a reload SELECT during response serialization.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine,
 )
 
@@ -63,12 +106,51 @@ def get_db():
         db.close()
 
 
+def _build_async_connect_args() -> dict:
+    # aiomysql wants an SSLContext rather than PyMySQL's dict
+    if not settings.resolved_async_database_url.startswith("mysql+aiomysql://"):
+        return {}
+
+    ca_path = _resolve_ca_path()
+    if ca_path:
+        return {"ssl": ssl.create_default_context(cafile=ca_path)}
+    return {}
+
+
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """
+    Built on first use so the async driver (aiomysql/aiosqlite) is only
+    required when settings.db_async is on.
+    """
+    global _async_session_factory
+    if _async_session_factory is None:
+        async_url = settings.resolved_async_database_url
+        async_engine = create_async_engine(
+            async_url,
+            connect_args=_build_async_connect_args(),
+            **_build_pool_kwargs(async_url),
+        )
+        _async_session_factory = async_sessionmaker(
+            bind=async_engine, autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
 @db_timed(threshold_ms=10)
 def init_db() -> None:
     """
-    create tables at startup.
+    create tables at startup, then apply index changes to existing tables.
     """
     Base.metadata.create_all(bind=engine)
+    upgrade(engine)
     _bootstrap_admin_if_configured()
 
 
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+
+def utcnow() -> datetime:
+    # naive UTC at second precision, same as what DATETIME columns hold
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def stamp_unless_returning(db: Session, obj, *attrs: str, update: bool = False) -> None:
+    """
+    Models use eager_defaults, so server-generated timestamps come back via
+    INSERT/UPDATE ... RETURNING on backends that have it (SQLite 3.35+,
+    MariaDB). Elsewhere (MySQL) set them app-side so the ORM does not need a
+    follow-up SELECT to know them.
+    """
+    dialect = db.get_bind().dialect
+    if dialect.update_returning if update else dialect.insert_returning:
+        return
+    now = utcnow()
+    for attr in attrs:
+        setattr(obj, attr, now)
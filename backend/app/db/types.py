@@ -0,0 +1,12 @@
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import sqlite
+
+# SQLite stores DATETIME as text. CURRENT_TIMESTAMP writes "YYYY-MM-DD HH:MM:SS"
+# while SQLAlchemy binds append ".ffffff", which breaks equality and range
+# comparisons between server-set and bound values (e.g. keyset seeks).
+# Store second precision on SQLite, matching MySQL's DATETIME.
+_SQLITE_DATETIME = sqlite.DATETIME(
+    storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+)
+
+Timestamp = DateTime(timezone=False).with_variant(_SQLITE_DATETIME, "sqlite")
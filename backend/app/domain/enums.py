@@ -17,3 +17,21 @@ class TicketPriority(StrEnum):
     LOW = "LOW"
     MEDIUM = "MEDIUM"
     HIGH = "HIGH"
+
+
+# stored in tickets.priority_rank so "highest first" is a numeric index order
+PRIORITY_RANK = {TicketPriority.LOW: 1, TicketPriority.MEDIUM: 2, TicketPriority.HIGH: 3}
+
+
+class TicketSort(StrEnum):
+    NEWEST = "newest"  # created_at DESC
+    OLDEST = "oldest"  # created_at ASC
+    PRIORITY = "priority"  # priority_rank DESC, then newest
+    UPDATED = "updated"  # updated_at DESC
+    ACTIVE = "active"  # last_reply_at DESC, never-replied tickets last
+
+
+class IncludeTotal(StrEnum):
+    FALSE = "false"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
@@ -16,3 +16,7 @@ class InvalidTransitionError(DomainError):
 
 class ValidationError(DomainError):
     code = "VALIDATION_ERROR"
+
+
+class OverloadedError(DomainError):
+    code = "OVERLOADED"
@@ -8,11 +8,17 @@ from app.api.routes.auth import router as auth_router
 from app.api.routes.tickets import router as tickets_router
 from app.api.routes.replies import router as replies_router
 from app.api.routes.admin import router as admin_router
+from app.api.routes.metrics import router as metrics_router
+from app.api.routes import async_api
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.db.session import init_db
 from app.core.exception_handlers import add_exception_handlers
-from app.core.middleware import request_id_middleware
+from app.core.middleware import (
+    metrics_middleware,
+    query_stats_middleware,
+    request_id_middleware,
+)
 
 logger = logging.getLogger("app")
 
@@ -30,10 +36,24 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    add_exception_handlers(app)
+    # last registered runs first: request id is set before queries are logged
+    app.middleware("http")(query_stats_middleware)
+    app.middleware("http")(metrics_middleware)
+    app.middleware("http")(request_id_middleware)
+
+    if settings.db_async:
+        # registered first, so these win over the sync routes on the same paths
+        app.include_router(async_api.tickets_router, prefix="/tickets", tags=["tickets"])
+        app.include_router(async_api.replies_router, tags=["replies"])
+        app.include_router(async_api.admin_router, prefix="/admin", tags=["admin"])
+
     app.include_router(auth_router, prefix="/auth", tags=["auth"])
     app.include_router(tickets_router, prefix="/tickets", tags=["tickets"])
     app.include_router(replies_router, tags=["replies"])
     app.include_router(admin_router, prefix="/admin", tags=["admin"])
+    if settings.metrics_enabled:
+        app.include_router(metrics_router, tags=["metrics"])
 
     @app.on_event("startup")
     def _startup() -> None:
@@ -46,5 +66,3 @@ def create_app() -> FastAPI:
 
 
 app = create_app()
-add_exception_handlers(app)
-app.middleware("http")(request_id_middleware)
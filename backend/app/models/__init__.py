@@ -1,3 +1,5 @@
 from .user import User  # noqa: F401
 from .ticket import Ticket  # noqa: F401
 from .reply import TicketReply  # noqa: F401
+from .ticket_stats import TicketDailyStat  # noqa: F401
+from app.db import fulltext  # noqa: F401,E402  (SQLite FTS5 tables follow their base tables)
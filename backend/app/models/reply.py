@@ -1,13 +1,22 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Text, func
+from sqlalchemy import ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import Timestamp
 
 
 class TicketReply(Base):
     __tablename__ = "ticket_replies"
+    # fetch server defaults (created_at/updated_at) with RETURNING on write
+    __mapper_args__ = {"eager_defaults": True}
+    # /tickets/search on MySQL; SQLite uses the FTS5 table in app.db.fulltext
+    __table_args__ = (
+        Index("ft_ticket_replies_message", "message", mysql_prefix="FULLTEXT").ddl_if(
+            dialect="mysql"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
@@ -24,7 +33,7 @@ class TicketReply(Base):
 
     message: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), server_default=func.now(), index=True, nullable=False
+        Timestamp, server_default=func.now(), index=True, nullable=False
     )
 
     ticket = relationship("Ticket", back_populates="replies")
@@ -1,13 +1,66 @@
 from datetime import datetime
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import ForeignKey, Index, Integer, SmallInteger, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.domain.enums import TicketPriority, TicketStatus
+from app.domain.enums import PRIORITY_RANK, TicketPriority, TicketStatus
 from app.db.base import Base
+from app.db.types import Timestamp
+
+
+def _priority_rank(context) -> int:
+    # per row, so Core executemany inserts (import, seed) get it too
+    priority = context.get_current_parameters().get("priority", TicketPriority.MEDIUM)
+    return PRIORITY_RANK[TicketPriority(priority)]
 
 
 class Ticket(Base):
     __tablename__ = "tickets"
+    # fetch server defaults (created_at/updated_at) with RETURNING on write
+    __mapper_args__ = {"eager_defaults": True}
+    # Composite indexes mirror the list_tickets query shapes so each sort
+    # mode's (key..., id) ordering is read straight from an index.
+    __table_args__ = (
+        Index("ix_tickets_user_created_id", "user_id", "created_at", "id"),
+        Index("ix_tickets_status_created_id", "status", "created_at", "id"),
+        Index(
+            "ix_tickets_status_priority_created_id",
+            "status",
+            "priority",
+            "created_at",
+            "id",
+        ),
+        # one index per list sort mode (app.crud.tickets.SORT_KEYS) and scope:
+        # all tickets (admin), one status (admin filter), one owner (customer)
+        Index("ix_tickets_rank_created_id", "priority_rank", "created_at", "id"),
+        Index(
+            "ix_tickets_status_rank_created_id",
+            "status",
+            "priority_rank",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_tickets_user_rank_created_id",
+            "user_id",
+            "priority_rank",
+            "created_at",
+            "id",
+        ),
+        Index("ix_tickets_updated_id", "updated_at", "id"),
+        Index("ix_tickets_status_updated_id", "status", "updated_at", "id"),
+        Index("ix_tickets_user_updated_id", "user_id", "updated_at", "id"),
+        # "most recently active" listings, off the denormalized reply columns
+        Index("ix_tickets_last_reply_id", "last_reply_at", "id"),
+        Index("ix_tickets_status_last_reply_id", "status", "last_reply_at", "id"),
+        Index("ix_tickets_user_last_reply_id", "user_id", "last_reply_at", "id"),
+        # /tickets/search on MySQL; SQLite uses the FTS5 table in app.db.fulltext
+        Index(
+            "ft_tickets_subject_description",
+            "subject",
+            "description",
+            mysql_prefix="FULLTEXT",
+        ).ddl_if(dialect="mysql"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -26,15 +79,30 @@ class Ticket(Base):
     priority: Mapped[str] = mapped_column(
         String(20), index=True, nullable=False, default=TicketPriority.MEDIUM
     )
+    # PRIORITY_RANK[priority], derived on insert; sort key for sort=priority
+    priority_rank: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=_priority_rank, server_default="0"
+    )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), server_default=func.now(), index=True, nullable=False
+        Timestamp, server_default=func.now(), index=True, nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), server_default=func.now(), onupdate=func.now(), nullable=False
+        Timestamp, server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+    # Denormalized from ticket_replies by app.crud.replies.create_reply, in the
+    # reply's transaction; `python -m app.cli.reconcile_reply_counters`
+    # recomputes them (backfill, or repair after out-of-band changes).
+    reply_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_reply_at: Mapped[datetime | None] = mapped_column(Timestamp, nullable=True)
+    last_reply_author_id: Mapped[int | None] = mapped_column(
+        ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
 
-    creator = relationship("User", back_populates="tickets")
+    creator = relationship("User", back_populates="tickets", foreign_keys=[user_id])
     replies = relationship(
         "TicketReply", back_populates="ticket", cascade="all, delete-orphan"
     )
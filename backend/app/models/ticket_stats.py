@@ -0,0 +1,25 @@
+from datetime import date
+
+from sqlalchemy import Date, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class TicketDailyStat(Base):
+    """
+    Rollup of tickets by (creation day, current status, priority).
+
+    Written in the same transaction as the ticket changes that move a ticket
+    between buckets (app.crud.stats.bump_ticket_stats), so dashboard totals
+    read O(buckets) rows instead of counting tickets. Rebuild with
+    `python -m app.cli.rebuild_stats` after out-of-band changes (e.g. a user
+    delete cascading to their tickets).
+    """
+
+    __tablename__ = "ticket_daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), primary_key=True)
+    priority: Mapped[str] = mapped_column(String(20), primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
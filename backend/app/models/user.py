@@ -1,13 +1,16 @@
 from datetime import datetime
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import Timestamp
 from app.domain.enums import Role
 
 
 class User(Base):
     __tablename__ = "users"
+    # fetch server defaults (created_at/updated_at) with RETURNING on write
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     email: Mapped[str] = mapped_column(
@@ -15,11 +18,18 @@ class User(Base):
     )
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     role: Mapped[Role] = mapped_column(String(20), nullable=False, default=Role.USER)
+    # Bumped to revoke every token issued so far (checked in stateless auth mode).
+    token_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=False), server_default=func.now(), nullable=False
+        Timestamp, server_default=func.now(), nullable=False
     )
 
     tickets = relationship(
-        "Ticket", back_populates="creator", cascade="all, delete-orphan"
+        "Ticket",
+        back_populates="creator",
+        cascade="all, delete-orphan",
+        foreign_keys="Ticket.user_id",
     )
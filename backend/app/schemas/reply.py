@@ -18,6 +18,7 @@ class ReplyOut(BaseModel):
 
 class ReplyListOut(BaseModel):
     items: list[ReplyOut]
-    total: int
+    # None when the request passed include_total=false
+    total: int | None = None
     page: int
     page_size: int
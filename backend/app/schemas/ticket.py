@@ -1,5 +1,5 @@
-from datetime import datetime
-from pydantic import BaseModel, Field
+from datetime import date, datetime
+from pydantic import BaseModel, Field, conint
 
 from app.domain.enums import TicketPriority, TicketStatus
 
@@ -19,6 +19,9 @@ class TicketOut(BaseModel):
     priority: TicketPriority
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    reply_count: int = 0
+    last_reply_at: datetime | None = None
+    last_reply_author_id: int | None = None
 
     model_config = {"from_attributes": True}
 
@@ -27,7 +30,59 @@ class TicketListOut(BaseModel):
     items: list[TicketOut]
     page: int
     page_size: int
+    # None when the request passed include_total=false
+    total: int | None = None
+    # opaque keyset token for the following page; pass back as ?cursor=
+    next_cursor: str | None = None
+
+
+class TicketBatchIn(BaseModel):
+    # count is checked by the service, same as ?ids= on the GET form
+    ids: list[conint(ge=1, le=2**63 - 1)]
+
+
+class TicketBatchOut(BaseModel):
+    # in the order requested; duplicate ids are returned once
+    found: list[TicketOut]
+    # exist, but belong to another customer
+    forbidden: list[int]
+    missing: list[int]
+
+
+class TicketSearchHit(TicketOut):
+    # relevance, higher is better; only comparable within one result set
+    score: float
+
+    @classmethod
+    def from_hit(cls, ticket, score: float) -> "TicketSearchHit":
+        return cls(**TicketOut.model_validate(ticket).model_dump(), score=score)
+
+
+class TicketSearchOut(BaseModel):
+    items: list[TicketSearchHit]
+    page: int
+    page_size: int
+    total: int
+
+
+class StatusPriorityCount(BaseModel):
+    status: TicketStatus
+    priority: TicketPriority
+    count: int
+
+
+class DayCount(BaseModel):
+    day: date
+    count: int
+
+
+class TicketStatsOut(BaseModel):
     total: int
+    by_status: dict[str, int]
+    by_priority: dict[str, int]
+    by_status_priority: list[StatusPriorityCount]
+    # tickets created per day (buckets are keyed by creation day)
+    per_day: list[DayCount]
 
 
 class StatusUpdate(BaseModel):
@@ -0,0 +1,139 @@
+"""
+Async variants of the ticket/reply services for settings.db_async.
+
+Each one runs the existing sync service (and the crud functions under it) on
+an AsyncSession via run_sync: SQLAlchemy drives the same ORM code through a
+greenlet on the async driver, so queries, RBAC and validation stay defined
+in one place while the request never occupies a threadpool thread.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.enums import IncludeTotal, TicketPriority
+from app.services.tickets import (
+    create_reply_service,
+    list_replies_service,
+    update_status_service,
+)
+from app.services.tickets_list_service import (
+    TicketFilters,
+    create_ticket_service,
+    get_ticket_if_modified_service,
+    get_ticket_service,
+    get_tickets_batch_service,
+    list_tickets_service,
+    search_tickets_service,
+)
+from app.utils.pagination import Page
+
+
+async def create_ticket_service_async(
+    db: AsyncSession,
+    current_user,
+    subject: str,
+    description: str,
+    priority: TicketPriority | str,
+):
+    return await db.run_sync(
+        lambda s: create_ticket_service(
+            s,
+            current_user=current_user,
+            subject=subject,
+            description=description,
+            priority=priority,
+        )
+    )
+
+
+async def get_ticket_service_async(db: AsyncSession, ticket_id: int, current_user):
+    return await db.run_sync(
+        lambda s: get_ticket_service(s, ticket_id=ticket_id, current_user=current_user)
+    )
+
+
+async def get_tickets_batch_service_async(
+    db: AsyncSession, ticket_ids: Sequence[int], current_user
+):
+    return await db.run_sync(
+        lambda s: get_tickets_batch_service(s, ticket_ids=ticket_ids, current_user=current_user)
+    )
+
+
+async def get_ticket_if_modified_service_async(
+    db: AsyncSession, ticket_id: int, current_user, if_none_match: str | None = None
+):
+    return await db.run_sync(
+        lambda s: get_ticket_if_modified_service(
+            s, ticket_id=ticket_id, current_user=current_user, if_none_match=if_none_match
+        )
+    )
+
+
+async def list_tickets_service_async(
+    db: AsyncSession,
+    current_user,
+    page: Page,
+    filters: TicketFilters,
+    cursor: str | None = None,
+    include_total: IncludeTotal = IncludeTotal.EXACT,
+) -> Tuple[list, Optional[int], Optional[str]]:
+    return await db.run_sync(
+        lambda s: list_tickets_service(
+            s,
+            current_user=current_user,
+            page=page,
+            filters=filters,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    )
+
+
+async def search_tickets_service_async(
+    db: AsyncSession, current_user, q: str, page: Page
+) -> Tuple[list, int]:
+    return await db.run_sync(
+        lambda s: search_tickets_service(s, current_user=current_user, q=q, page=page)
+    )
+
+
+async def list_replies_service_async(
+    db: AsyncSession,
+    ticket_id: int,
+    current_user,
+    page: int,
+    page_size: int,
+    include_total: IncludeTotal = IncludeTotal.EXACT,
+    if_none_match: str | None = None,
+):
+    return await db.run_sync(
+        lambda s: list_replies_service(
+            s,
+            ticket_id=ticket_id,
+            current_user=current_user,
+            page=page,
+            page_size=page_size,
+            include_total=include_total,
+            if_none_match=if_none_match,
+        )
+    )
+
+
+async def create_reply_service_async(db: AsyncSession, ticket_id: int, current_user, message: str):
+    return await db.run_sync(
+        lambda s: create_reply_service(
+            s, ticket_id=ticket_id, current_user=current_user, message=message
+        )
+    )
+
+
+async def update_status_service_async(
+    db: AsyncSession, ticket_id: int, current_user, new_status: str
+):
+    return await db.run_sync(
+        lambda s: update_status_service(
+            s, ticket_id=ticket_id, current_user=current_user, new_status=new_status
+        )
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.crud.stats import list_ticket_stats
+from app.domain.errors import ValidationError
+from app.policies.tickets import ensure_admin
+
+
+def ticket_stats_service(
+    db: Session, current_user, day_from: date | None = None, day_to: date | None = None
+) -> dict:
+    """
+    Dashboard aggregates folded from the daily rollup in one pass: cost is
+    O(buckets in range), independent of how many tickets they represent.
+    Buckets are keyed by creation day, so per_day counts tickets created
+    that day and by_status counts their current status.
+    """
+    ensure_admin(current_user)
+    if day_from and day_to and day_from > day_to:
+        raise ValidationError("created_from must be <= created_to")
+
+    by_status: dict[str, int] = defaultdict(int)
+    by_priority: dict[str, int] = defaultdict(int)
+    by_status_priority: dict[tuple[str, str], int] = defaultdict(int)
+    per_day: dict[date, int] = defaultdict(int)
+
+    for row in list_ticket_stats(db, day_from, day_to):
+        by_status[row.status] += row.count
+        by_priority[row.priority] += row.count
+        by_status_priority[(row.status, row.priority)] += row.count
+        per_day[row.day] += row.count
+
+    return {
+        "total": sum(by_status.values()),
+        "by_status": dict(by_status),
+        "by_priority": dict(by_priority),
+        "by_status_priority": [
+            {"status": s, "priority": p, "count": n}
+            for (s, p), n in sorted(by_status_priority.items())
+        ],
+        "per_day": [{"day": d, "count": n} for d, n in sorted(per_day.items())],
+    }
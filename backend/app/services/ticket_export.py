@@ -0,0 +1,82 @@
+"""
+Streaming ticket export (NDJSON or CSV) for reporting.
+
+Rows come from a server-side cursor one batch at a time and are rendered
+into one text chunk per batch, so memory is bounded by export_batch_size
+whatever the size of the export.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Iterator
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.tickets import EXPORT_COLUMNS, iter_tickets
+from app.domain.enums import Role
+from app.domain.errors import ValidationError
+from app.services.tickets_list_service import TicketFilters
+
+FIELDS = [c.key for c in EXPORT_COLUMNS]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _ndjson_chunk(rows) -> str:
+    return "".join(json.dumps(dict(zip(FIELDS, row)), default=_isoformat) + "\n" for row in rows)
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def _csv_chunk(rows, header: bool) -> str:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        writer.writerow(FIELDS)
+    for row in rows:
+        writer.writerow(v.isoformat() if hasattr(v, "isoformat") else v for v in row)
+    return buf.getvalue()
+
+
+def export_tickets_service(
+    db: Session,
+    current_user,
+    filters: TicketFilters,
+    fmt: str,
+    batch_size: int | None = None,
+) -> Iterator[str]:
+    filters.validate()
+    if fmt not in MEDIA_TYPES:
+        raise ValidationError(f"Unsupported export format: {fmt}")
+
+    batches = iter_tickets(
+        db,
+        is_admin=current_user.role == Role.ADMIN,
+        user_id=current_user.id,
+        status=filters.status.value if filters.status else None,
+        priority=filters.priority.value if filters.priority else None,
+        created_from=filters.created_from,
+        created_to=filters.created_to,
+        batch_size=batch_size or settings.export_batch_size,
+    )
+    return _render(batches, fmt)
+
+
+def _render(batches, fmt: str) -> Iterator[str]:
+    if fmt == "csv":
+        # header even for an empty export
+        yield _csv_chunk([], header=True)
+        for rows in batches:
+            yield _csv_chunk(rows, header=False)
+    else:
+        for rows in batches:
+            yield _ndjson_chunk(rows)
@@ -0,0 +1,323 @@
+"""
+Streaming import of historical tickets and replies (NDJSON or CSV).
+
+Each record is validated with the public TicketCreate/ReplyCreate schemas
+(plus the fields a migration has to carry: owner, status, timestamps and an
+optional legacy id), buffered up to batch_size, and written with one
+executemany INSERT per batch inside a single transaction. Input is consumed
+as an iterator, so memory is bounded by the batch, not the file.
+
+Record shapes (`type` defaults to "ticket"):
+  {"type": "ticket", "id": 42, "user_id": 7, "subject": "...", "description": "...",
+   "priority": "HIGH", "status": "CLOSED", "created_at": "2021-03-04T10:00:00"}
+  {"type": "reply", "ticket_id": 42, "author_id": 7, "message": "...",
+   "created_at": "2021-03-04T11:00:00"}
+Replies reference tickets by id, so import tickets with their legacy ids
+(or already present tickets) before their replies. Owners, authors and
+replied-to tickets are checked to exist before each batch is written (SQLite
+does not enforce the foreign keys); rows pointing elsewhere are reported
+as row errors.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import IO, Callable, Iterable, Iterator
+
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.response_cache import invalidate_ticket_lists
+from app.crud.replies import refresh_reply_counters
+from app.crud.stats import bump_ticket_stats, deltas_for_new_tickets
+from app.db.timestamps import utcnow
+from app.domain.enums import TicketStatus
+from app.domain.errors import ValidationError
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.models.user import User
+from app.schemas.reply import ReplyCreate
+from app.schemas.ticket import TicketCreate
+
+logger = logging.getLogger("app.services.ticket_import")
+
+MAX_REPORTED_ERRORS = 1000
+
+
+class TicketImportRow(TicketCreate):
+    id: int | None = None
+    user_id: int
+    status: TicketStatus = TicketStatus.OPEN
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+
+class ReplyImportRow(ReplyCreate):
+    ticket_id: int
+    author_id: int
+    created_at: datetime | None = None
+
+
+@dataclass
+class RowError:
+    line: int
+    message: str
+
+
+@dataclass
+class ImportReport:
+    processed: int = 0
+    tickets: int = 0
+    replies: int = 0
+    failed: int = 0
+    errors: list[RowError] = field(default_factory=list)
+
+    def add_error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(line=line, message=message))
+
+
+def iter_ndjson(stream: Iterable[str | bytes]) -> Iterator[tuple[int, dict | str]]:
+    """
+    Yields (line_no, record). Unparseable lines yield an error message string
+    instead of a dict so the caller can report them per row.
+    """
+    for line_no, raw in enumerate(stream, start=1):
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_no, f"invalid JSON: {exc}"
+            continue
+        yield line_no, record if isinstance(record, dict) else "expected a JSON object"
+
+
+def iter_csv(stream: IO[str]) -> Iterator[tuple[int, dict | str]]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        # empty cells mean "not provided" so schema defaults apply
+        yield reader.line_num, {k: v for k, v in row.items() if k and v not in ("", None)}
+
+
+def _naive_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _ticket_values(row: TicketImportRow) -> dict:
+    created_at = _naive_utc(row.created_at) or utcnow()
+    values = {
+        "user_id": row.user_id,
+        "subject": row.subject.strip(),
+        "description": row.description.strip(),
+        "priority": row.priority.value,
+        "status": row.status.value,
+        "created_at": created_at,
+        "updated_at": _naive_utc(row.updated_at) or created_at,
+    }
+    if row.id is not None:
+        values["id"] = row.id
+    return values
+
+
+def _reply_values(row: ReplyImportRow) -> dict:
+    return {
+        "ticket_id": row.ticket_id,
+        "author_id": row.author_id,
+        "message": row.message,
+        "created_at": _naive_utc(row.created_at) or utcnow(),
+    }
+
+
+class TicketImporter:
+    def __init__(
+        self,
+        db: Session,
+        batch_size: int | None = None,
+        on_progress: Callable[[ImportReport], None] | None = None,
+    ):
+        self.db = db
+        self.batch_size = batch_size or settings.import_batch_size
+        self.on_progress = on_progress
+        self.report = ImportReport()
+        self._tickets: list[tuple[int, dict]] = []
+        self._replies: list[tuple[int, dict]] = []
+
+    def add(self, line: int, record: dict | str) -> None:
+        self.report.processed += 1
+        if isinstance(record, str):
+            self.report.add_error(line, record)
+            return
+
+        kind = record.pop("type", "ticket")
+        try:
+            if kind == "ticket":
+                self._tickets.append((line, _ticket_values(TicketImportRow(**record))))
+            elif kind == "reply":
+                self._replies.append((line, _reply_values(ReplyImportRow(**record))))
+            else:
+                self.report.add_error(line, f"unknown type: {kind}")
+                return
+        except PydanticValidationError as exc:
+            self.report.add_error(line, _describe(exc))
+            return
+
+        if len(self._tickets) + len(self._replies) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._tickets and not self._replies:
+            return
+        tickets, replies = self._check_references(self._tickets, self._replies)
+        self._tickets, self._replies = [], []
+
+        try:
+            ticket_rows = [v for _, v in tickets]
+            self._insert(Ticket, ticket_rows)
+            self._insert(TicketReply, [v for _, v in replies])
+            refresh_reply_counters(self.db, (v["ticket_id"] for _, v in replies))
+            bump_ticket_stats(self.db, deltas_for_new_tickets(ticket_rows))
+            self.db.commit()
+            self.report.tickets += len(tickets)
+            self.report.replies += len(replies)
+        except IntegrityError:
+            # a bad row (duplicate id) poisons the batch;
+            # redo it row by row to import the rest and pinpoint the offenders
+            self.db.rollback()
+            self._insert_one_by_one(Ticket, tickets)
+            self._insert_one_by_one(TicketReply, replies)
+        # owners of tickets that only received replies are not looked up;
+        # their own lists catch up within the cache TTL
+        invalidate_ticket_lists({v["user_id"] for _, v in tickets})
+
+        logger.info(
+            "import_progress processed=%s tickets=%s replies=%s failed=%s",
+            self.report.processed,
+            self.report.tickets,
+            self.report.replies,
+            self.report.failed,
+        )
+        if self.on_progress:
+            self.on_progress(self.report)
+
+    def _check_references(
+        self, tickets: list[tuple[int, dict]], replies: list[tuple[int, dict]]
+    ) -> tuple[list[tuple[int, dict]], list[tuple[int, dict]]]:
+        """
+        Drops (and reports) rows whose owner, author or ticket does not exist.
+        One SELECT per referenced table for the whole batch.
+        """
+        user_ids = {v["user_id"] for _, v in tickets} | {v["author_id"] for _, v in replies}
+        known_users = self._existing(User.id, user_ids)
+        tickets = self._keep(tickets, "user_id", known_users)
+
+        ticket_ids = {v["ticket_id"] for _, v in replies}
+        # tickets from this batch count, as long as their own row is still in
+        known_tickets = self._existing(Ticket.id, ticket_ids) | {
+            v["id"] for _, v in tickets if "id" in v
+        }
+        replies = self._keep(replies, "author_id", known_users)
+        return tickets, self._keep(replies, "ticket_id", known_tickets)
+
+    def _existing(self, column, ids: set[int]) -> set[int]:
+        if not ids:
+            return set()
+        return set(self.db.scalars(select(column).where(column.in_(ids))))
+
+    def _keep(
+        self, rows: list[tuple[int, dict]], key: str, known: set[int]
+    ) -> list[tuple[int, dict]]:
+        kept = []
+        for line, values in rows:
+            if values[key] in known:
+                kept.append((line, values))
+            else:
+                self.report.add_error(line, f"{key}: no such {key[:-3]} {values[key]}")
+        return kept
+
+    def _insert(self, model, rows: list[dict]) -> None:
+        # executemany needs uniform keys: rows with and without a legacy id
+        # go in separate statements
+        groups: dict[tuple, list[dict]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+        for group in groups.values():
+            self.db.execute(insert(model), group)
+
+    def _insert_one_by_one(self, model, rows: list[tuple[int, dict]]) -> None:
+        for line, values in rows:
+            try:
+                self.db.execute(insert(model), [values])
+                if model is Ticket:
+                    bump_ticket_stats(self.db, deltas_for_new_tickets([values]))
+                else:
+                    refresh_reply_counters(self.db, [values["ticket_id"]])
+                self.db.commit()
+            except IntegrityError as exc:
+                self.db.rollback()
+                self.report.add_error(line, f"rejected by database: {exc.orig}")
+                continue
+            if model is Ticket:
+                self.report.tickets += 1
+            else:
+                self.report.replies += 1
+
+    def finish(self) -> ImportReport:
+        self.flush()
+        return self.report
+
+
+def _describe(exc: PydanticValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in exc.errors()
+    )
+
+
+def import_file(
+    db: Session,
+    stream: IO[str],
+    fmt: str,
+    batch_size: int | None = None,
+    on_progress: Callable[[ImportReport], None] | None = None,
+) -> ImportReport:
+    if fmt == "ndjson":
+        records = iter_ndjson(stream)
+    elif fmt == "csv":
+        records = iter_csv(stream)
+    else:
+        raise ValidationError(f"Unsupported import format: {fmt}")
+
+    importer = TicketImporter(db, batch_size=batch_size, on_progress=on_progress)
+    try:
+        for line, record in records:
+            importer.add(line, record)
+    except UnicodeDecodeError as exc:
+        # batches are committed as they fill, so say what already went in
+        imported = importer.report.tickets + importer.report.replies
+        message = "file must be UTF-8"
+        if imported:
+            message += f" ({imported} rows before the invalid bytes were imported)"
+        raise ValidationError(message) from exc
+    return importer.finish()
+
+
+def import_binary(
+    db: Session, stream: IO[bytes], fmt: str, batch_size: int | None = None
+) -> ImportReport:
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        return import_file(db, text, fmt, batch_size=batch_size)
+    finally:
+        text.detach()
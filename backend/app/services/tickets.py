@@ -1,9 +1,17 @@
 from sqlalchemy.orm import Session
 
+from app.core.events import REPLY_CREATED, STATUS_CHANGED, publish_ticket_event
 from app.core.transitions import validate_transition
-from app.domain.errors import InvalidTransitionError, NotFoundError
-from app.crud.tickets import get_ticket, update_ticket_status
-from app.crud.replies import create_reply, list_replies
+from app.domain.enums import IncludeTotal
+from app.domain.errors import InvalidTransitionError, NotFoundError, ValidationError
+from app.crud.tickets import (
+    bulk_update_ticket_status,
+    get_ticket,
+    get_ticket_states,
+    update_ticket_status,
+)
+from app.crud.replies import create_reply, get_thread_version, list_replies
+from app.utils.etag import etag_matches, make_etag
 from app.policies.tickets import (
     can_reply_ticket,
     can_view_ticket,
@@ -18,26 +26,143 @@ def _get_ticket_or_404(db: Session, ticket_id: int):
     return t
 
 
-def list_replies_service(db: Session, ticket_id: int, current_user):
-    t = _get_ticket_or_404(db, ticket_id)
-    can_view_ticket(current_user, t)
+def list_replies_service(
+    db: Session,
+    ticket_id: int,
+    current_user,
+    page: int,
+    page_size: int,
+    include_total: IncludeTotal = IncludeTotal.EXACT,
+    if_none_match: str | None = None,
+):
+    """
+    Returns (items, total, etag); items and total are None when
+    if_none_match already names the current thread state (send 304).
+    """
+    version = get_thread_version(db, ticket_id)
+    if not version:
+        raise NotFoundError("Ticket not found")
+    can_view_ticket(current_user, version)
 
-    return list_replies(db, ticket_id=ticket_id)
+    # the representation is one page of the thread, so the page shape is
+    # part of the validator too
+    etag = make_etag(
+        "replies",
+        ticket_id,
+        version.last_reply_id,
+        version.reply_count,
+        page,
+        page_size,
+        IncludeTotal(include_total).value,
+    )
+    if etag_matches(if_none_match, etag):
+        return None, None, etag
+
+    items, total = list_replies(
+        db,
+        ticket_id=ticket_id,
+        page=page,
+        page_size=page_size,
+        include_total=include_total,
+    )
+    return items, total, etag
 
 
 def create_reply_service(db: Session, ticket_id: int, current_user, message: str):
     t = _get_ticket_or_404(db, ticket_id)
     can_reply_ticket(current_user, t)
-    return create_reply(
-        db, ticket_id=ticket_id, author_id=current_user.id, message=message
+    reply = create_reply(
+        db,
+        ticket_id=ticket_id,
+        author_id=current_user.id,
+        message=message,
+        ticket_owner_id=t.user_id,
+    )
+    publish_ticket_event(
+        ticket_id,
+        REPLY_CREATED,
+        {
+            "id": reply.id,
+            "ticket_id": ticket_id,
+            "author_id": reply.author_id,
+            "message": reply.message,
+            "created_at": reply.created_at,
+        },
     )
+    return reply
 
 
 def update_status_service(db: Session, ticket_id: int, current_user, new_status: str):
     can_update_status(current_user)
     t = _get_ticket_or_404(db, ticket_id)
+    old_status = t.status
     try:
-        validate_transition(t.status, new_status)
+        validate_transition(old_status, new_status)
     except ValueError as e:
         raise InvalidTransitionError(str(e)) from e
-    return update_ticket_status(db, t, new_status)
+    updated = update_ticket_status(db, t, new_status)
+    if old_status != new_status:
+        _publish_status_changed(ticket_id, old_status, new_status)
+    return updated
+
+
+def _publish_status_changed(ticket_id: int, old_status: str, new_status: str) -> None:
+    publish_ticket_event(
+        ticket_id,
+        STATUS_CHANGED,
+        {"ticket_id": ticket_id, "old_status": old_status, "status": new_status},
+    )
+
+
+def bulk_update_status_service(
+    db: Session, ticket_ids: list[int], current_user, new_status: str
+) -> list[dict]:
+    """
+    Apply one target status to many tickets: a single SELECT reads current
+    statuses, every row is checked against ALLOWED_TRANSITIONS, and the
+    allowed ones are updated set-based per source status. Returns one result
+    per requested id, in request order.
+    """
+    can_update_status(current_user)
+    ids = list(dict.fromkeys(ticket_ids))  # dedupe, keep order
+    if not ids:
+        raise ValidationError("ids must not be empty")
+
+    states = get_ticket_states(db, ids)
+
+    results: dict[int, dict] = {}
+    to_update: dict[str, list[int]] = {}
+    for ticket_id in ids:
+        state = states.get(ticket_id)
+        if state is None:
+            results[ticket_id] = {"id": ticket_id, "ok": False, "error": NotFoundError.code}
+            continue
+        old_status = state.status
+        try:
+            validate_transition(old_status, new_status)
+        except ValueError:
+            results[ticket_id] = {
+                "id": ticket_id,
+                "ok": False,
+                "status": old_status,
+                "error": InvalidTransitionError.code,
+            }
+            continue
+        results[ticket_id] = {"id": ticket_id, "ok": True, "status": new_status}
+        if old_status != new_status:
+            to_update.setdefault(old_status, []).append(ticket_id)
+
+    if to_update:
+        stale = set(bulk_update_ticket_status(db, to_update, new_status, states))
+        for ticket_id in stale:
+            results[ticket_id] = {
+                "id": ticket_id,
+                "ok": False,
+                "error": InvalidTransitionError.code,
+            }
+        for old_status, moved in to_update.items():
+            for ticket_id in moved:
+                if ticket_id not in stale:
+                    _publish_status_changed(ticket_id, old_status, new_status)
+
+    return [results[i] for i in ids]
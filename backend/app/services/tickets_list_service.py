@@ -1,19 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
 
 from sqlalchemy import and_, desc, func, select
 from sqlalchemy.orm import Session
 
-from app.domain.enums import Role, TicketStatus, TicketPriority
-from app.domain.errors import NotFoundError, ValidationError
+from app.domain.enums import IncludeTotal, Role, TicketStatus, TicketPriority, TicketSort
+from app.domain.errors import ForbiddenError, NotFoundError, ValidationError
 from app.policies.tickets import can_view_ticket, ensure_customer
+from app.crud.search import search_terms
+from app.crud.search import search_tickets as crud_search_tickets
 from app.crud.tickets import create_ticket as crud_create_ticket
+from app.crud.tickets import cursor_fits_sort
 from app.crud.tickets import get_ticket as crud_get_ticket
+from app.crud.tickets import get_ticket_version as crud_get_ticket_version
+from app.crud.tickets import get_tickets_by_ids as crud_get_tickets_by_ids
 from app.crud.tickets import list_tickets as crud_list_tickets
-from app.utils.pagination import Page
+from app.utils.etag import etag_matches, make_etag
+from app.utils.pagination import Page, decode_cursor, encode_cursor
 
 
 @dataclass(frozen=True)
@@ -22,10 +28,15 @@ class TicketFilters:
     priority: Optional[str] = None
     created_from: Optional[datetime] = None
     created_to: Optional[datetime] = None
+    # one of TicketSort; kept as the raw string so unknown values become a 400
+    sort: str = TicketSort.NEWEST
 
     def validate(self) -> None:
         if self.created_from and self.created_to and self.created_from > self.created_to:
             raise ValidationError("created_from must be <= created_to")
+        if self.sort not in TicketSort.__members__.values():
+            allowed = ", ".join(TicketSort)
+            raise ValidationError(f"Unknown sort: {self.sort} (expected one of {allowed})")
 
 
 def create_ticket_service(
@@ -65,20 +76,107 @@ def get_ticket_service(db: Session, ticket_id: int, current_user):
     return t
 
 
+MAX_BATCH_IDS = 100
+# BIGINT range; larger values overflow in the driver instead of matching nothing
+MAX_TICKET_ID = 2**63 - 1
+
+
+def parse_ticket_ids(raw: str) -> list[int]:
+    """
+    "1,2,3" -> [1, 2, 3]; blanks between commas are ignored.
+    """
+    try:
+        ids = [int(part) for part in raw.split(",") if part.strip()]
+    except ValueError as exc:
+        raise ValidationError("ids must be a comma-separated list of integers") from exc
+    if any(not 1 <= i <= MAX_TICKET_ID for i in ids):
+        raise ValidationError(f"ids must be between 1 and {MAX_TICKET_ID}")
+    return ids
+
+
+def get_tickets_batch_service(db: Session, ticket_ids: Sequence[int], current_user):
+    """
+    Returns (found, forbidden_ids, missing_ids) for up to MAX_BATCH_IDS ids,
+    loading every row in one IN query and applying can_view_ticket to each.
+    Duplicates are collapsed; all three lists keep the requested order.
+    """
+    ids = list(dict.fromkeys(ticket_ids))
+    if not ids:
+        raise ValidationError("ids is required")
+    if len(ids) > MAX_BATCH_IDS:
+        raise ValidationError(f"At most {MAX_BATCH_IDS} ids per batch")
+
+    rows = crud_get_tickets_by_ids(db, ids)
+    found, forbidden, missing = [], [], []
+    for ticket_id in ids:
+        t = rows.get(ticket_id)
+        if t is None:
+            missing.append(ticket_id)
+            continue
+        try:
+            can_view_ticket(current_user, t)
+        except ForbiddenError:
+            forbidden.append(ticket_id)
+        else:
+            found.append(t)
+    return found, forbidden, missing
+
+
+def ticket_etag(ticket) -> str:
+    # status and reply_count are included because updated_at only has
+    # second precision
+    return make_etag("ticket", ticket.id, ticket.updated_at, ticket.status, ticket.reply_count)
+
+
+def get_ticket_if_modified_service(
+    db: Session, ticket_id: int, current_user, if_none_match: str | None = None
+):
+    """
+    Conditional GET: returns (ticket, etag), or (None, etag) when the
+    client's copy is current. With If-None-Match the version columns are
+    checked first (same 404/403 rules), so an unchanged ticket is never
+    loaded or serialized.
+    """
+    if if_none_match:
+        version = crud_get_ticket_version(db, ticket_id)
+        if not version:
+            raise NotFoundError("Ticket not found")
+        can_view_ticket(current_user, version)
+        etag = ticket_etag(version)
+        if etag_matches(if_none_match, etag):
+            return None, etag
+
+    t = get_ticket_service(db, ticket_id, current_user)
+    return t, ticket_etag(t)
+
+
 def list_tickets_service(
     db: Session,
     current_user,
     page: Page,
     filters: TicketFilters,
-) -> Tuple[list, int]:
+    cursor: str | None = None,
+    include_total: IncludeTotal = IncludeTotal.EXACT,
+) -> Tuple[list, Optional[int], Optional[str]]:
     filters.validate()
+    sort = TicketSort(filters.sort)
+
+    if cursor:
+        try:
+            page = replace(page, cursor=decode_cursor(cursor))
+        except ValueError as exc:
+            raise ValidationError("Invalid cursor") from exc
+        if page.cursor.sort != sort:
+            raise ValidationError("cursor was issued for another sort")
+        if not cursor_fits_sort(page.cursor, sort):
+            raise ValidationError("Invalid cursor")
 
     is_admin = current_user.role == Role.ADMIN
 
     status_value = filters.status.value if filters.status else None
     priority_value = filters.priority.value if filters.priority else None
 
-    items, total = crud_list_tickets(
+    items, total, next_cursor = crud_list_tickets(
         db,
         page,
         is_admin=is_admin,
@@ -87,5 +185,21 @@ def list_tickets_service(
         priority=priority_value,
         created_from=filters.created_from,
         created_to=filters.created_to,
+        include_total=include_total,
+        sort=sort,
+    )
+    return items, total, encode_cursor(next_cursor) if next_cursor else None
+
+
+def search_tickets_service(db: Session, current_user, q: str, page: Page) -> Tuple[list, int]:
+    terms = search_terms(q)
+    if not terms:
+        raise ValidationError("q must contain at least one word")
+
+    return crud_search_tickets(
+        db,
+        terms,
+        page,
+        is_admin=current_user.role == Role.ADMIN,
+        user_id=current_user.id,
     )
-    return items, total
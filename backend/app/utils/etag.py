@@ -0,0 +1,30 @@
+import hashlib
+
+
+def make_etag(*parts) -> str:
+    """
+    Weak validator from the values a representation is derived from. Weak
+    because JSON serialization details may change without the data changing.
+    """
+    digest = hashlib.sha1(":".join(str(p) for p in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses weak comparison (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+# clients may keep a copy but must revalidate it; shared caches must not
+CACHE_CONTROL = "private, no-cache"
+
+
+def validator_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
@@ -1,17 +1,74 @@
+import base64
+import json
 from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Keyset position: the sort key values and id of the last row of the
+    previous page, plus the sort they were taken under (a cursor is only
+    valid for the same sort). Keys are timestamps, numbers or None.
+    """
+
+    keys: tuple
+    id: int
+    sort: str = "newest"
 
 
 @dataclass(frozen=True)
 class Page:
     page: int
     page_size: int
+    cursor: Cursor | None = None
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.page_size
 
 
-def normalize_pagination(page: int, page_size: int, max_page_size: int = 50) -> Page:
+def normalize_pagination(
+    page: int, page_size: int, max_page_size: int = 50, cursor: Cursor | None = None
+) -> Page:
     page = max(1, page)
     page_size = max(1, min(page_size, max_page_size))
-    return Page(page=page, page_size=page_size)
+    return Page(page=page, page_size=page_size, cursor=cursor)
+
+
+def _encode_key(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _decode_key(value):
+    # timestamps are the only keys encoded as strings
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if value is None or isinstance(value, int):
+        return value
+    raise ValueError("Invalid cursor key")
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    keys = [_encode_key(k) for k in cursor.keys]
+    raw = json.dumps([cursor.sort, keys, cursor.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """
+    Raises ValueError for anything that is not a cursor we issued.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if len(decoded) == 2:
+            # issued before sort= existed: [created_at, id] of the newest-first list
+            created_at, row_id = decoded
+            return Cursor(keys=(datetime.fromisoformat(created_at),), id=int(row_id))
+        sort, keys, row_id = decoded
+        if not isinstance(sort, str) or not isinstance(keys, list):
+            raise ValueError("Invalid cursor")
+        return Cursor(keys=tuple(_decode_key(k) for k in keys), id=int(row_id), sort=sort)
+    except (ValueError, TypeError, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
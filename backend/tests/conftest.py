@@ -8,6 +8,11 @@ from sqlalchemy.pool import StaticPool
 from app.main import create_app
 from app.db.base import Base
 from app.db.session import get_db
+from app.crud.counts import count_cache
+from app.core.principal import principal_cache, token_version_cache
+from app.core.response_cache import ticket_list_cache
+from app.core.security import hash_password
+from app.models.user import User
 import app.models  # noqa: F401  (imports models to register metadata)
 
 from app.core.deps import get_db  # <-- adjust if your get_db is in a different module
@@ -23,13 +28,19 @@ engine = create_engine(
     poolclass=StaticPool,
 )
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 @pytest.fixture(autouse=True)
 def reset_db():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    count_cache.clear()
+    principal_cache.clear()
+    token_version_cache.clear()
+    ticket_list_cache.clear()
     yield
 
 
@@ -61,3 +72,41 @@ def db_session():
         yield db
     finally:
         db.close()
+
+
+ADMIN_PASSWORD = "admin12345"
+USER_PASSWORD = "password123"
+
+
+@pytest.fixture(scope="function")
+def seeded_users(client, db_session):
+    """
+    admin@example.com (ADMIN), u1@ and u2@example.com (USER), keyed "admin",
+    "u1", "u2". Depends on client so its table reset runs first.
+    """
+    users = {
+        "admin": User(
+            email="admin@example.com", password_hash=hash_password(ADMIN_PASSWORD), role="ADMIN"
+        ),
+        "u1": User(email="u1@example.com", password_hash=hash_password(USER_PASSWORD), role="USER"),
+        "u2": User(email="u2@example.com", password_hash=hash_password(USER_PASSWORD), role="USER"),
+    }
+    db_session.add_all(users.values())
+    db_session.commit()
+    return users
+
+
+@pytest.fixture(scope="function")
+def auth_headers(client):
+    """
+    auth_headers(email, password=None) -> bearer headers from POST /auth/login.
+    The password defaults to the seeded_users one for that email.
+    """
+
+    def login(email: str, password: str | None = None) -> dict[str, str]:
+        if password is None:
+            password = ADMIN_PASSWORD if email == "admin@example.com" else USER_PASSWORD
+        r = client.post("/auth/login", json={"email": email, "password": password})
+        return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+    return login
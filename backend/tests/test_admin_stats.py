@@ -0,0 +1,120 @@
+import json
+
+import pytest
+from sqlalchemy import select, update
+
+from app.crud.stats import rebuild_ticket_stats
+from app.crud.tickets import bulk_update_ticket_status, get_ticket_states
+from app.models.ticket import Ticket
+from app.models.ticket_stats import TicketDailyStat
+
+
+def _snapshot(db_session):
+    db_session.expire_all()
+    rows = db_session.scalars(select(TicketDailyStat).where(TicketDailyStat.count != 0))
+    return sorted((str(r.day), r.status, r.priority, r.count) for r in rows)
+
+
+def test_stats_follow_creates_status_changes_and_imports(
+    client, db_session, seeded_users, auth_headers
+):
+    admin, user = auth_headers("admin@example.com"), auth_headers("u1@example.com")
+
+    ids = []
+    for priority in ("LOW", "HIGH", "HIGH"):
+        r = client.post(
+            "/tickets",
+            headers=user,
+            json={"subject": "S", "description": "desc " * 5, "priority": priority},
+        )
+        ids.append(r.json()["id"])
+
+    client.put(f"/admin/tickets/{ids[0]}/status", headers=admin, json={"status": "IN_PROGRESS"})
+    client.post(
+        "/admin/tickets/status:bulk",
+        headers=admin,
+        json={"ids": [ids[0], ids[1]], "status": "CLOSED"},
+    )
+    owner_id = seeded_users["u1"].id
+    client.post(
+        "/admin/tickets/import",
+        headers=admin,
+        content=json.dumps(
+            {
+                "user_id": owner_id,
+                "subject": "Old",
+                "description": "Imported from legacy",
+                "priority": "LOW",
+                "status": "CLOSED",
+                "created_at": "2020-01-15T09:30:00",
+            }
+        ),
+    )
+
+    r = client.get("/admin/stats", headers=admin)
+    assert r.status_code == 200
+    body = r.json()
+    assert body["total"] == 4
+    assert body["by_status"] == {"CLOSED": 3, "OPEN": 1}
+    assert body["by_priority"] == {"LOW": 2, "HIGH": 2}
+    assert {"status": "OPEN", "priority": "HIGH", "count": 1} in body["by_status_priority"]
+    assert body["per_day"][0] == {"day": "2020-01-15", "count": 1}
+    assert sum(d["count"] for d in body["per_day"]) == 4
+
+    r = client.get("/admin/stats?created_from=2020-01-01&created_to=2020-12-31", headers=admin)
+    assert r.json()["by_status"] == {"CLOSED": 1}
+
+    # incremental maintenance agrees with a full rebuild
+    incremental = _snapshot(db_session)
+    assert rebuild_ticket_stats(db_session) == len(incremental)
+    assert _snapshot(db_session) == incremental
+
+
+@pytest.mark.parametrize("update_returning", [True, False], ids=["returning", "locking"])
+def test_bulk_status_skips_rows_moved_concurrently(
+    client, db_session, seeded_users, auth_headers, monkeypatch, update_returning
+):
+    admin, user = auth_headers("admin@example.com"), auth_headers("u1@example.com")
+    ids = [
+        client.post(
+            "/tickets",
+            headers=user,
+            json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+        ).json()["id"]
+        for _ in range(3)
+    ]
+    states = get_ticket_states(db_session, ids)
+
+    # another admin closes one of them between the read and the bulk update
+    client.put(f"/admin/tickets/{ids[0]}/status", headers=admin, json={"status": "CLOSED"})
+
+    monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", update_returning)
+    stale = bulk_update_ticket_status(db_session, {"OPEN": ids}, "CLOSED", states)
+    monkeypatch.undo()
+
+    assert stale == [ids[0]]
+    # the concurrent close was counted once, by its own writer
+    incremental = _snapshot(db_session)
+    assert sum(row[3] for row in incremental if row[1] == "CLOSED") == 3
+    assert rebuild_ticket_stats(db_session) == len(incremental)
+    assert _snapshot(db_session) == incremental
+
+
+def test_rebuild_repairs_out_of_band_changes(client, db_session, seeded_users, auth_headers):
+    admin, user = auth_headers("admin@example.com"), auth_headers("u1@example.com")
+    client.post(
+        "/tickets",
+        headers=user,
+        json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+    )
+    db_session.execute(update(Ticket).values(status="CLOSED"))
+    db_session.commit()
+    assert client.get("/admin/stats", headers=admin).json()["by_status"] == {"OPEN": 1}
+
+    rebuild_ticket_stats(db_session)
+    assert client.get("/admin/stats", headers=admin).json()["by_status"] == {"CLOSED": 1}
+
+
+def test_stats_require_admin(client, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+    assert client.get("/admin/stats", headers=user).status_code == 403
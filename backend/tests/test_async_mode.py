@@ -0,0 +1,139 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.session import get_async_db, get_db
+from app.main import create_app
+
+
+@pytest.fixture
+def async_client(tmp_path, monkeypatch):
+    # a file DB so the sync auth routes and async ticket routes share data
+    db_file = tmp_path / "async.db"
+    sync_engine = create_engine(
+        f"sqlite+pysqlite:///{db_file}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=sync_engine)
+    SyncSession = sessionmaker(autoflush=False, bind=sync_engine)
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}")
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    def override_get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSessionLocal() as db:
+            yield db
+
+    monkeypatch.setattr(settings, "db_async", True)
+    app = create_app()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as c:
+        yield c
+
+    sync_engine.dispose()
+
+
+def test_async_routes_serve_ticket_flow(async_client):
+    from app.api.routes import async_api
+
+    route = next(r for r in async_client.app.routes if getattr(r, "path", "") == "/tickets")
+    assert route.endpoint.__module__ == async_api.__name__
+
+    async_client.post("/auth/signup", json={"email": "a1@example.com", "password": "password123"})
+    token = async_client.post(
+        "/auth/login", json={"email": "a1@example.com", "password": "password123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    r = async_client.post(
+        "/tickets",
+        headers=headers,
+        json={"subject": "Async", "description": "desc " * 5, "priority": "HIGH"},
+    )
+    assert r.status_code == 201
+    ticket_id = r.json()["id"]
+
+    r = async_client.get("/tickets", headers=headers)
+    assert r.status_code == 200
+    assert r.json()["total"] == 1
+
+    r = async_client.post(f"/tickets/{ticket_id}/replies", headers=headers, json={"message": "hi"})
+    assert r.status_code == 201
+
+    r = async_client.get(f"/tickets/{ticket_id}/replies", headers=headers)
+    assert r.json()["items"][0]["message"] == "hi"
+    r = async_client.get(
+        f"/tickets/{ticket_id}/replies",
+        headers={**headers, "If-None-Match": r.headers["etag"]},
+    )
+    assert r.status_code == 304
+
+    r = async_client.get("/tickets/search?q=async", headers=headers)
+    assert r.status_code == 200
+    assert [i["id"] for i in r.json()["items"]] == [ticket_id]
+
+    r = async_client.get(f"/tickets:batch?ids={ticket_id},999", headers=headers)
+    assert r.status_code == 200
+    assert ([i["id"] for i in r.json()["found"]], r.json()["missing"]) == ([ticket_id], [999])
+
+    # domain errors still map to HTTP statuses on the async stack
+    r = async_client.get("/tickets/999", headers=headers)
+    assert r.status_code == 404
+
+
+def test_redis_publish_does_not_block_the_event_loop(async_client, monkeypatch):
+    import threading
+    import time
+
+    from app.core import events
+
+    published = []
+
+    class BlockingRedis:
+        def publish(self, channel, message):
+            raise AssertionError("blocking publish on the event loop")
+
+    class AsyncRedis:
+        async def publish(self, channel, message):
+            published.append((channel, json.loads(message)["event"], threading.get_ident()))
+
+    monkeypatch.setattr(events, "broker", events.RedisBroker(BlockingRedis(), AsyncRedis()))
+
+    async_client.post("/auth/signup", json={"email": "a2@example.com", "password": "password123"})
+    token = async_client.post(
+        "/auth/login", json={"email": "a2@example.com", "password": "password123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    ticket_id = async_client.post(
+        "/tickets",
+        headers=headers,
+        json={"subject": "Async", "description": "desc " * 5, "priority": "HIGH"},
+    ).json()["id"]
+
+    r = async_client.post(f"/tickets/{ticket_id}/replies", headers=headers, json={"message": "hi"})
+    assert r.status_code == 201
+
+    deadline = time.monotonic() + 2
+    while not published and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert [(channel, event) for channel, event, _ in published] == [
+        (f"ticket:{ticket_id}", events.REPLY_CREATED)
+    ]
+    # ran on the app's event loop, not in the test thread
+    assert published[0][2] != threading.get_ident()
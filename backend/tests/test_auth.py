@@ -34,3 +34,136 @@ def test_login_invalid_credentials(client):
         "/auth/login", json={"email": "u3@example.com", "password": "wrongpass123"}
     )
     assert r.status_code == 401
+
+
+def test_principal_cache_hits_and_invalidation(client, db_session):
+    from app.core.principal import principal_cache
+    from app.crud.users import get_user_by_email, update_user_role
+
+    client.post(
+        "/auth/signup", json={"email": "u4@example.com", "password": "password123"}
+    )
+    token = client.post(
+        "/auth/login", json={"email": "u4@example.com", "password": "password123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/tickets", headers=headers).status_code == 200
+    assert client.get("/tickets", headers=headers).status_code == 200
+    stats = principal_cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+    # role change drops the cached principal and revokes tokens carrying the old role
+    update_user_role(db_session, get_user_by_email(db_session, "u4@example.com"), "ADMIN")
+    assert principal_cache.stats()["size"] == 0
+    assert client.get("/tickets", headers=headers).status_code == 401
+
+
+def test_stateless_mode_trusts_claims_until_revoked(client, db_session, monkeypatch):
+    from app.core.config import settings
+    from app.core.principal import principal_cache, token_version_cache
+    from app.crud.users import get_user_by_email, revoke_user_tokens
+
+    monkeypatch.setattr(settings, "auth_stateless", True)
+
+    client.post(
+        "/auth/signup", json={"email": "u5@example.com", "password": "password123"}
+    )
+    token = client.post(
+        "/auth/login", json={"email": "u5@example.com", "password": "password123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.get("/tickets", headers=headers).status_code == 200
+    assert client.get("/tickets", headers=headers).status_code == 200
+    # claims path: principal cache untouched, one version lookup then cached
+    assert principal_cache.stats()["misses"] == 0
+    assert token_version_cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    revoke_user_tokens(db_session, get_user_by_email(db_session, "u5@example.com"))
+    r = client.get("/tickets", headers=headers)
+    assert r.status_code == 401
+
+
+def test_login_returns_503_when_hashing_pool_is_saturated(client, monkeypatch):
+    import threading
+    import time
+
+    from app.core import security
+    from app.core.hashing import HashingPool
+
+    client.post(
+        "/auth/signup", json={"email": "u6@example.com", "password": "password123"}
+    )
+
+    pool = HashingPool(workers=1, max_queue=0)
+    monkeypatch.setattr(security, "hashing_pool", pool)
+
+    release = threading.Event()
+    busy = threading.Thread(target=pool.run, args=(release.wait,))
+    busy.start()
+    while pool.stats()["in_flight"] == 0:
+        time.sleep(0.001)
+    try:
+        r = client.post(
+            "/auth/login", json={"email": "u6@example.com", "password": "password123"}
+        )
+    finally:
+        release.set()
+        busy.join()
+
+    assert r.status_code == 503
+    assert r.json()["error"]["code"] == "OVERLOADED"
+    assert r.headers["Retry-After"] == "1"
+    assert pool.stats()["rejected"] == 1
+
+
+def test_hashing_pool_awaits_off_the_event_loop_and_rejects_when_full():
+    import asyncio
+    import threading
+
+    from app.core.hashing import HashingPool
+    from app.domain.errors import OverloadedError
+
+    pool = HashingPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        busy = asyncio.ensure_future(pool.arun(release.wait))
+        queued = asyncio.ensure_future(pool.arun(lambda: "hashed"))
+        # both admitted and waiting, yet the loop keeps running other work
+        await asyncio.sleep(0.01)
+        assert pool.stats()["in_flight"] == 2
+        assert not busy.done() and not queued.done()
+
+        try:
+            await pool.arun(lambda: "rejected")
+        except OverloadedError:
+            pass
+        else:
+            raise AssertionError("third call should have been rejected")
+
+        release.set()
+        return await busy, await queued
+
+    assert asyncio.run(scenario()) == (True, "hashed")
+    stats = pool.stats()
+    assert (stats["in_flight"], stats["completed"], stats["rejected"]) == (0, 2, 1)
+
+
+def test_hashing_admission_stays_well_below_request_threadpool():
+    import inspect
+
+    import anyio.to_thread
+
+    from app.api.routes import auth
+    from app.core.config import settings
+
+    async def threadpool_size():
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    admitted = settings.hashing_pool_workers + settings.hashing_pool_max_queue
+    assert admitted <= anyio.run(threadpool_size) // 2
+    assert inspect.iscoroutinefunction(auth.signup)
+    assert inspect.iscoroutinefunction(auth.login)
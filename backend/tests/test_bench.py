@@ -0,0 +1,106 @@
+import asyncio
+
+from sqlalchemy import func, select, text
+
+from app.bench.dataset import DatasetSpec, seed_dataset
+from app.bench.runner import (
+    compare,
+    current_user_scenario,
+    http_scenarios,
+    inprocess_client,
+    percentile,
+    run_all,
+)
+from app.bench.targets import load_targets
+from app.db.base import Base
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.models.ticket_stats import TicketDailyStat
+from tests.conftest import TestingSessionLocal, engine
+
+
+def test_percentile_nearest_rank():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([7.0], 95) == 7.0
+
+
+def test_seed_dataset_is_skewed_and_deterministic(db_session):
+    spec = DatasetSpec(users=20, tickets=400, replies=800, seed=7)
+    report = seed_dataset(engine, spec)
+    assert {name: load.rows for name, load in report.tables.items()} == {
+        "users": 22,
+        "tickets": 400,
+        "ticket_replies": 800,
+    }
+
+    per_owner = db_session.execute(
+        select(Ticket.user_id, func.count()).group_by(Ticket.user_id).order_by(func.count().desc())
+    ).all()
+    # the hottest owner holds far more than a uniform 1/20 share
+    assert per_owner[0][1] > 3 * 400 / 20
+
+    longest = db_session.scalar(
+        select(func.count())
+        .select_from(TicketReply)
+        .group_by(TicketReply.ticket_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    assert longest > 10 * 800 / 400
+
+    first = db_session.execute(select(Ticket.user_id, Ticket.subject).order_by(Ticket.id)).all()
+    db_session.close()
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    seed_dataset(engine, spec)
+    again = db_session.execute(select(Ticket.user_id, Ticket.subject).order_by(Ticket.id)).all()
+    assert again == first
+
+
+def test_inprocess_run_reports_every_endpoint(client, db_session):
+    seed_dataset(engine, DatasetSpec(users=10, tickets=200, replies=400, seed=1))
+    targets = load_targets(db_session, n=50)
+    assert targets.users and targets.admins and targets.tickets and targets.threads
+
+    scenarios = http_scenarios(targets) + [current_user_scenario(TestingSessionLocal, targets)]
+
+    async def run():
+        async with inprocess_client(client.app) as http:
+            return await run_all(http, scenarios, requests=20, concurrency=4, warmup=2)
+
+    endpoints = asyncio.run(run())
+    assert set(endpoints) == {
+        "list_tickets",
+        "list_tickets_admin",
+        "get_ticket",
+        "reply_thread",
+        "get_current_user",
+    }
+    for summary in endpoints.values():
+        assert summary["requests"] == 20
+        assert summary["errors"] == 0, summary["error_codes"]
+        assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+        assert summary["rps"] > 0
+
+    report = {"runs": [{"mode": "inprocess", "endpoints": endpoints}]}
+    lines = compare(report, report)
+    assert len(lines) == 5
+    assert all("+0.0%" in line for line in lines)
+
+
+def test_seed_rebuilds_search_index_and_stats(db_session):
+    seed_dataset(engine, DatasetSpec(users=5, tickets=50, replies=100, seed=3))
+
+    indexed = db_session.scalar(
+        text("SELECT count(*) FROM tickets_fts WHERE tickets_fts MATCH 'refund OR login'")
+    )
+    assert indexed > 0
+    triggers = db_session.scalars(
+        text("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%_ai'")
+    ).all()
+    assert sorted(triggers) == ["ticket_replies_fts_ai", "tickets_fts_ai"]
+
+    assert db_session.scalar(select(func.sum(TicketDailyStat.count))) == 50
+    assert db_session.scalar(select(func.sum(Ticket.reply_count))) == 100
@@ -0,0 +1,80 @@
+from app.db.query_stats import assert_max_queries
+
+
+def _setup(client, auth_headers):
+    user = auth_headers("u1@example.com")
+    ticket = client.post(
+        "/tickets",
+        headers=user,
+        json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+    ).json()
+    return ticket, user, auth_headers("admin@example.com")
+
+
+def test_ticket_detail_revalidates_with_etag(client, seeded_users, auth_headers):
+    ticket, user, admin = _setup(client, auth_headers)
+    url = f"/tickets/{ticket['id']}"
+
+    r = client.get(url, headers=user)
+    etag = r.headers["etag"]
+    assert r.status_code == 200
+    assert etag.startswith('W/"')
+    assert r.headers["cache-control"] == "private, no-cache"
+
+    # a single narrow version lookup, no full row
+    with assert_max_queries(1) as stats:
+        r = client.get(url, headers={**user, "If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+    assert r.headers["etag"] == etag
+    assert "description" not in next(iter(stats.statements))
+
+    client.put(f"/admin/tickets/{ticket['id']}/status", headers=admin, json={"status": "CLOSED"})
+    r = client.get(url, headers={**user, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["status"] == "CLOSED"
+    assert r.headers["etag"] != etag
+
+
+def test_reply_thread_revalidates_with_etag(client, seeded_users, auth_headers):
+    ticket, user, _ = _setup(client, auth_headers)
+    url = f"/tickets/{ticket['id']}/replies"
+
+    etag = client.get(url, headers=user).headers["etag"]
+    with assert_max_queries(1):
+        assert client.get(url, headers={**user, "If-None-Match": etag}).status_code == 304
+
+    client.post(url, headers=user, json={"message": "new info"})
+    r = client.get(url, headers={**user, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.json()["total"] == 1
+    assert client.get(url, headers={**user, "If-None-Match": r.headers["etag"]}).status_code == 304
+
+
+def test_reply_etag_is_per_page(client, seeded_users, auth_headers):
+    ticket, user, _ = _setup(client, auth_headers)
+    url = f"/tickets/{ticket['id']}/replies"
+    for i in range(3):
+        client.post(url, headers=user, json={"message": f"reply {i}"})
+
+    etag = client.get(f"{url}?page=1&page_size=2", headers=user).headers["etag"]
+    r = client.get(f"{url}?page=2&page_size=2", headers={**user, "If-None-Match": etag})
+    assert r.status_code == 200
+    assert [item["message"] for item in r.json()["items"]] == ["reply 2"]
+
+    for query in ("page=1&page_size=3", "page=1&page_size=2&include_total=false"):
+        r = client.get(f"{url}?{query}", headers={**user, "If-None-Match": etag})
+        assert r.status_code == 200
+    r = client.get(f"{url}?page=1&page_size=2", headers={**user, "If-None-Match": etag})
+    assert r.status_code == 304
+
+
+def test_etag_does_not_bypass_access_checks(client, seeded_users, auth_headers):
+    ticket, user, _ = _setup(client, auth_headers)
+    etag = client.get(f"/tickets/{ticket['id']}", headers=user).headers["etag"]
+    other = auth_headers("u2@example.com")
+
+    r = client.get(f"/tickets/{ticket['id']}", headers={**other, "If-None-Match": etag})
+    assert r.status_code == 403
+    r = client.get("/tickets/999", headers={**other, "If-None-Match": "*"})
+    assert r.status_code == 404
@@ -0,0 +1,43 @@
+from sqlalchemy import create_engine, text
+
+from app.db.pool_metrics import InstrumentedQueuePool, PoolMetrics
+from app.db.session import _build_pool_kwargs
+
+
+def test_pool_kwargs_follow_settings(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "db_pool_size", 20)
+    monkeypatch.setattr(settings, "db_pool_recycle", 240)
+    monkeypatch.setattr(settings, "db_pool_pre_ping", False)
+
+    kwargs = _build_pool_kwargs("mysql+pymysql://u:p@h/db")
+    assert kwargs["pool_size"] == 20
+    assert kwargs["pool_recycle"] == 240
+    assert kwargs["pool_pre_ping"] is False
+
+    assert _build_pool_kwargs("sqlite+pysqlite:///:memory:") == {"pool_pre_ping": False}
+
+
+def test_instrumented_pool_reports_checkouts_and_waits(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=2,
+        max_overflow=0,
+    )
+    metrics = PoolMetrics()
+    metrics.attach(engine)
+
+    with engine.connect() as c1, engine.connect() as c2:
+        c1.execute(text("SELECT 1"))
+        c2.execute(text("SELECT 1"))
+        snap = metrics.snapshot(engine)
+        assert snap["checked_out"] == 2
+
+    snap = metrics.snapshot(engine)
+    assert snap["checkouts"] == 2
+    assert snap["connects"] == 2
+    assert snap["checked_out"] == 0
+    assert snap["max_wait_ms"] >= 0
+    engine.dispose()
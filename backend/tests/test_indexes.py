@@ -0,0 +1,70 @@
+from datetime import datetime
+
+from sqlalchemy import Index, event
+
+from app.crud.tickets import list_tickets
+from app.db.migrations import missing_indexes, upgrade
+from app.domain.enums import IncludeTotal
+from app.models.ticket import Ticket
+from app.utils.pagination import Cursor, Page
+from tests.conftest import engine
+
+
+def _list_plan(db_session, cursor: Cursor | None = None, **filters) -> str:
+    """
+    EXPLAIN QUERY PLAN for the page SELECT list_tickets actually emits, with
+    its bound parameters, so the assertions follow the ORM query.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        list_tickets(
+            db_session,
+            Page(page=1, page_size=10, cursor=cursor),
+            include_total=IncludeTotal.FALSE,
+            **filters,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    ((statement, parameters),) = statements
+    rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return " | ".join(row[-1] for row in rows)
+
+
+def test_user_listing_uses_user_created_index(db_session):
+    plan = _list_plan(db_session, is_admin=False, user_id=1)
+    assert "ix_tickets_user_created_id" in plan
+    assert "TEMP B-TREE" not in plan  # no filesort
+
+
+def test_status_listing_uses_status_created_index(db_session):
+    plan = _list_plan(db_session, is_admin=True, status="OPEN")
+    assert "ix_tickets_status_created_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_status_priority_listing_uses_composite_index(db_session):
+    plan = _list_plan(
+        db_session,
+        cursor=Cursor(keys=(datetime(2030, 1, 1),), id=1_000),
+        is_admin=True,
+        status="OPEN",
+        priority="HIGH",
+    )
+    assert "ix_tickets_status_priority_created_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_upgrade_creates_missing_indexes_on_existing_table():
+    ix = next(i for i in Ticket.__table__.indexes if i.name == "ix_tickets_user_created_id")
+    Index.drop(ix, bind=engine)
+    assert ix in missing_indexes(engine)
+
+    assert upgrade(engine) == ["ix_tickets_user_created_id"]
+    assert missing_indexes(engine) == []
+    assert upgrade(engine) == []
@@ -0,0 +1,45 @@
+from app.core.metrics import Registry, domain_errors, registry
+
+
+def test_metrics_endpoint_exposes_route_histograms_and_domain_errors(client):
+    registry.reset()
+    client.post("/auth/signup", json={"email": "m1@example.com", "password": "password123"})
+    token = client.post(
+        "/auth/login", json={"email": "m1@example.com", "password": "password123"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.get("/tickets", headers=headers)
+    client.get("/tickets/999", headers=headers)
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain")
+    body = r.text
+
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/tickets/{ticket_id}",'
+        'status="404"} 1.0' in body
+    )
+    assert 'app_call_duration_seconds_count{layer="app.api",func="list_tickets_api"} 1.0' in body
+    assert 'app_domain_errors_total{code="NOT_FOUND"} 1.0' in body
+    assert domain_errors.value(code="NOT_FOUND") == 1
+
+
+def test_multiprocess_files_are_merged(tmp_path, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "metrics_multiproc_dir", str(tmp_path))
+
+    worker = Registry()
+    hits = worker.counter("hits_total", "test", ("kind",))
+    hits.inc(kind="a")
+    worker.flush()
+
+    # a second worker's dump, as written by another pid
+    (tmp_path / "metrics_99999.json").write_text('{"hits_total": {"a": 2.0, "b": 1.0}}')
+
+    body = worker.render()
+    assert 'hits_total{kind="a"} 3.0' in body
+    assert 'hits_total{kind="b"} 1.0' in body
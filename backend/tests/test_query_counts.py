@@ -0,0 +1,75 @@
+import pytest
+
+from app.db.query_stats import assert_max_queries
+
+
+def _auth_headers(client, email="q1@example.com"):
+    client.post("/auth/signup", json={"email": email, "password": "password123"})
+    token = client.post("/auth/login", json={"email": email, "password": "password123"}).json()[
+        "access_token"
+    ]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_query_headers_are_reported(client):
+    headers = _auth_headers(client)
+
+    r = client.get("/tickets", headers=headers)
+    assert int(r.headers["X-DB-Queries"]) >= 1
+    assert r.headers["Server-Timing"].startswith("db;dur=")
+
+
+def test_list_tickets_query_budget(client):
+    headers = _auth_headers(client)
+    client.get("/tickets", headers=headers)  # warm the principal cache
+
+    # COUNT + page SELECT; auth is served from the cache
+    with assert_max_queries(2):
+        client.get("/tickets", headers=headers)
+
+    with assert_max_queries(1):
+        client.get("/tickets?include_total=false", headers=headers)
+
+
+def test_assert_max_queries_reports_statements(client):
+    headers = _auth_headers(client)
+    with pytest.raises(AssertionError, match="expected at most 0 queries"):
+        with assert_max_queries(0):
+            client.get("/tickets", headers=headers)
+
+
+def test_writes_cost_minimal_statements(client):
+    headers = _auth_headers(client)
+    client.get("/tickets", headers=headers)  # warm the principal cache
+
+    # INSERT ... RETURNING + stats rollup upsert; no refresh SELECT after COMMIT
+    with assert_max_queries(2):
+        r = client.post(
+            "/tickets",
+            headers=headers,
+            json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+        )
+    body = r.json()
+    assert r.status_code == 201
+    assert body["created_at"] is not None
+    assert body["updated_at"] is not None
+
+    # ticket lookup + INSERT + reply counters UPDATE
+    with assert_max_queries(3):
+        r = client.post(f"/tickets/{body['id']}/replies", headers=headers, json={"message": "hi"})
+    assert r.json()["created_at"] is not None
+
+
+def test_app_side_timestamps_without_returning(db_session, monkeypatch):
+    from app.crud.tickets import create_ticket
+    from app.crud.users import create_user
+
+    dialect = db_session.get_bind().dialect
+    monkeypatch.setattr(dialect, "insert_returning", False)
+
+    user = create_user(db_session, email="q2@example.com", password="password123")
+    # plain INSERT + stats rollup upsert
+    with assert_max_queries(2):
+        t = create_ticket(db_session, user.id, "S", "desc " * 5, "LOW")
+    assert t.created_at is not None
+    assert t.created_at == t.updated_at
@@ -0,0 +1,59 @@
+from sqlalchemy import create_engine, text
+
+from app.core import deps
+from app.db.base import Base
+from app.db.replicas import ReplicaRouter
+
+
+def _router(url):
+    return ReplicaRouter(
+        [url],
+        sticky_seconds=60,
+        health_check_seconds=60,
+        engine_kwargs_for=lambda _url: {},
+    )
+
+
+def test_reads_go_to_replica_until_the_user_writes(
+    client, seeded_users, auth_headers, tmp_path, monkeypatch
+):
+    replica_url = f"sqlite+pysqlite:///{tmp_path / 'replica.db'}"
+    replica_engine = create_engine(replica_url)
+    Base.metadata.create_all(bind=replica_engine)
+    with replica_engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO tickets (id, user_id, subject, description, status, priority) "
+                "VALUES (500, :uid, 'from replica', 'replica row', 'OPEN', 'LOW')"
+            ),
+            {"uid": seeded_users["u1"].id},
+        )
+
+    router = _router(replica_url)
+    monkeypatch.setattr(deps, "replica_router", router)
+    monkeypatch.setattr("app.db.replicas.replica_router", router)
+
+    headers = auth_headers("u1@example.com")
+
+    # the replica's copy is what GET sees
+    body = client.get("/tickets", headers=headers).json()
+    assert [t["subject"] for t in body["items"]] == ["from replica"]
+
+    # after a write the same user reads from the primary
+    client.post(
+        "/tickets",
+        headers=headers,
+        json={"subject": "on primary", "description": "desc " * 5, "priority": "LOW"},
+    )
+    body = client.get("/tickets", headers=headers).json()
+    assert [t["subject"] for t in body["items"]] == ["on primary"]
+    replica_engine.dispose()
+
+
+def test_unhealthy_replica_falls_back_to_primary(client, seeded_users, auth_headers, monkeypatch):
+    router = _router("sqlite+pysqlite:////nonexistent-dir/replica.db")
+    monkeypatch.setattr(deps, "replica_router", router)
+
+    r = client.get("/tickets", headers=auth_headers("u1@example.com"))
+    assert r.status_code == 200
+    assert router.pick() is None
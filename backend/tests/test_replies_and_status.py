@@ -39,8 +39,17 @@ def test_user_can_reply_to_own_ticket_and_list_thread(client):
     )
     assert r2.status_code == 200
     thread = r2.json()
-    assert len(thread) == 1
-    assert thread[0]["message"] == "Hello support"
+    assert thread["total"] == 1
+    assert len(thread["items"]) == 1
+    assert thread["items"][0]["message"] == "Hello support"
+
+    r3 = client.get(
+        f"/tickets/{ticket['id']}/replies?include_total=false",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert r3.status_code == 200
+    assert r3.json()["total"] is None
+    assert len(r3.json()["items"]) == 1
 
 
 def test_user_cannot_reply_to_others_ticket(client):
@@ -162,3 +171,66 @@ def test_non_admin_cannot_update_status(client):
         json={"status": "IN_PROGRESS"},
     )
     assert r.status_code == 403
+
+
+def test_admin_bulk_status_update_reports_per_id_results(client, db_session):
+    from app.core.security import hash_password
+    from app.db.query_stats import assert_max_queries
+    from app.models.user import User
+
+    db_session.add(
+        User(email="admin3@example.com", password_hash=hash_password("admin12345"), role="ADMIN")
+    )
+    db_session.commit()
+    admin_token = client.post(
+        "/auth/login", json={"email": "admin3@example.com", "password": "admin12345"}
+    ).json()["access_token"]
+    admin_headers = {"Authorization": f"Bearer {admin_token}"}
+
+    _signup(client, "u1@example.com")
+    user_token = _login(client, "u1@example.com")
+    open_ids = [_create_ticket(client, user_token, i)["id"] for i in range(3)]
+    in_progress_id = _create_ticket(client, user_token, 4)["id"]
+    client.put(
+        f"/admin/tickets/{in_progress_id}/status",
+        headers=admin_headers,
+        json={"status": "IN_PROGRESS"},
+    )
+    client.get("/tickets", headers=admin_headers)  # warm the principal cache
+
+    # one SELECT + one UPDATE per source status + one stats rollup upsert
+    with assert_max_queries(4):
+        r = client.post(
+            "/admin/tickets/status:bulk",
+            headers=admin_headers,
+            json={"ids": [*open_ids, in_progress_id, 999], "status": "CLOSED"},
+        )
+    assert r.status_code == 200
+    body = r.json()
+    assert body["succeeded"] == 4
+    by_id = {row["id"]: row for row in body["results"]}
+    assert all(by_id[i]["ok"] and by_id[i]["status"] == "CLOSED" for i in open_ids)
+    assert by_id[in_progress_id]["ok"]
+    assert by_id[999] == {"id": 999, "ok": False, "status": None, "error": "NOT_FOUND"}
+
+    # CLOSED is terminal
+    r = client.post(
+        "/admin/tickets/status:bulk",
+        headers=admin_headers,
+        json={"ids": open_ids[:1], "status": "OPEN"},
+    )
+    assert r.json()["results"][0]["error"] == "INVALID_TRANSITION"
+
+    r = client.get(f"/tickets/{open_ids[0]}", headers=admin_headers)
+    assert r.json()["status"] == "CLOSED"
+
+
+def test_non_admin_cannot_bulk_update_status(client):
+    _signup(client, "u1@example.com")
+    token = _login(client, "u1@example.com")
+    r = client.post(
+        "/admin/tickets/status:bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"ids": [1], "status": "CLOSED"},
+    )
+    assert r.status_code == 403
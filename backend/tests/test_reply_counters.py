@@ -0,0 +1,176 @@
+import threading
+from datetime import datetime
+
+from sqlalchemy import create_engine, desc, func, inspect, select, text, update
+from sqlalchemy.orm import sessionmaker
+
+from app.crud.replies import create_reply, reconcile_reply_counters
+from app.db.base import Base
+from app.db.migrations import upgrade
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.models.user import User
+
+
+def _ticket(client, headers):
+    return client.post(
+        "/tickets",
+        headers=headers,
+        json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+    ).json()
+
+
+def _expected(db, ticket_id):
+    newest = db.execute(
+        select(TicketReply.created_at, TicketReply.author_id)
+        .where(TicketReply.ticket_id == ticket_id)
+        .order_by(desc(TicketReply.created_at), desc(TicketReply.id))
+        .limit(1)
+    ).first()
+    count = db.scalar(select(func.count()).where(TicketReply.ticket_id == ticket_id))
+    return (count, *newest) if newest else (0, None, None)
+
+
+def _stored(db, ticket_id):
+    db.expire_all()
+    t = db.get(Ticket, ticket_id)
+    return t.reply_count, t.last_reply_at, t.last_reply_author_id
+
+
+def test_replies_update_ticket_counters(client, db_session, seeded_users, auth_headers):
+    user, admin = auth_headers("u1@example.com"), auth_headers("admin@example.com")
+    ticket = _ticket(client, user)
+    assert (ticket["reply_count"], ticket["last_reply_at"]) == (0, None)
+    etag = client.get(f"/tickets/{ticket['id']}", headers=user).headers["etag"]
+
+    client.post(f"/tickets/{ticket['id']}/replies", headers=user, json={"message": "hi"})
+    client.post(f"/tickets/{ticket['id']}/replies", headers=admin, json={"message": "on it"})
+
+    r = client.get(f"/tickets/{ticket['id']}", headers={**user, "If-None-Match": etag})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["reply_count"] == 2
+    assert body["last_reply_author_id"] == seeded_users["admin"].id
+    assert body["last_reply_at"] is not None
+    assert _stored(db_session, ticket["id"]) == _expected(db_session, ticket["id"])
+
+    listed = client.get("/tickets", headers=user).json()["items"][0]
+    assert (listed["reply_count"], listed["last_reply_author_id"]) == (
+        2,
+        seeded_users["admin"].id,
+    )
+
+
+def test_counters_stay_exact_under_concurrent_replies(tmp_path):
+    # a file DB so every thread has its own connection and transaction
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'replies.db'}",
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    with Session() as db:
+        authors = [User(email=f"c{i}@example.com", password_hash="x") for i in range(2)]
+        db.add_all(authors)
+        db.flush()
+        ticket = Ticket(user_id=authors[0].id, subject="S", description="desc " * 5, priority="LOW")
+        db.add(ticket)
+        db.commit()
+
+    threads, per_thread = 8, 25
+    start = threading.Barrier(threads)
+    errors = []
+
+    def worker(n: int) -> None:
+        author = authors[n % 2]
+        start.wait()
+        try:
+            for i in range(per_thread):
+                with Session() as db:
+                    create_reply(db, ticket.id, author.id, f"{n}-{i}", author.id)
+        except Exception as exc:  # noqa: BLE001  surfaced by the assert below
+            errors.append(exc)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    assert errors == []
+
+    with Session() as db:
+        assert _stored(db, ticket.id)[0] == threads * per_thread
+        assert _stored(db, ticket.id) == _expected(db, ticket.id)
+        assert reconcile_reply_counters(db) == 0
+    engine.dispose()
+
+
+def test_reconcile_repairs_drift(client, db_session, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+    busy, quiet = _ticket(client, user), _ticket(client, user)
+    for message in ("one", "two", "three"):
+        client.post(f"/tickets/{busy['id']}/replies", headers=user, json={"message": message})
+
+    db_session.execute(
+        update(Ticket).values(
+            reply_count=7,
+            last_reply_at=None,
+            last_reply_author_id=None,
+            updated_at=datetime(2020, 1, 1),
+        )
+    )
+    db_session.commit()
+
+    assert reconcile_reply_counters(db_session, batch_size=1) == 2
+    assert db_session.get(Ticket, busy["id"]).updated_at == datetime(2020, 1, 1)
+    assert _stored(db_session, busy["id"]) == _expected(db_session, busy["id"])
+    assert _stored(db_session, quiet["id"]) == (0, None, None)
+    assert reconcile_reply_counters(db_session) == 0
+
+
+def test_upgrade_adds_and_backfills_reply_columns():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(
+        bind=engine, tables=[t for t in Base.metadata.sorted_tables if t.name != "tickets"]
+    )
+    with engine.begin() as conn:
+        # tickets as deployed before the reply columns existed
+        conn.execute(
+            text(
+                "CREATE TABLE tickets (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "subject VARCHAR(200) NOT NULL, description TEXT NOT NULL, "
+                "status VARCHAR(20) NOT NULL, priority VARCHAR(20) NOT NULL, "
+                "created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL)"
+            )
+        )
+        conn.execute(
+            text("INSERT INTO users (id, email, password_hash, role) VALUES (1, 'a', 'x', 'USER')")
+        )
+        conn.execute(
+            text(
+                "INSERT INTO tickets VALUES "
+                "(1, 1, 'S', 'desc', 'OPEN', 'LOW', '2024-01-01 00:00:00', '2024-01-01 00:00:00'), "
+                "(2, 1, 'S', 'desc', 'OPEN', 'LOW', '2024-01-01 00:00:00', '2024-01-01 00:00:00')"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO ticket_replies (ticket_id, author_id, message, created_at) VALUES "
+                "(1, 1, 'a', '2024-01-02 00:00:00'), (1, 1, 'b', '2024-01-03 00:00:00')"
+            )
+        )
+
+    created = upgrade(engine)
+    assert {"tickets.reply_count", "tickets.last_reply_at", "tickets.last_reply_author_id"} <= set(
+        created
+    )
+    assert "ix_tickets_user_last_reply_id" in created
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("tickets")}
+    assert {"ix_tickets_last_reply_id", "ix_tickets_user_last_reply_id"} <= indexes
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT id, reply_count, last_reply_at FROM tickets ORDER BY id")
+        ).all()
+    assert [tuple(r) for r in rows] == [(1, 2, "2024-01-03 00:00:00"), (2, 0, None)]
+    engine.dispose()
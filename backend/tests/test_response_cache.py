@@ -0,0 +1,76 @@
+from app.core.response_cache import MemoryBackend, ResponseCache
+from app.db.query_stats import assert_max_queries
+
+
+def _headers(auth_headers):
+    return (
+        auth_headers("admin@example.com"),
+        auth_headers("u1@example.com"),
+        auth_headers("u2@example.com"),
+    )
+
+
+def _create(client, headers):
+    return client.post(
+        "/tickets",
+        headers=headers,
+        json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+    ).json()
+
+
+def test_repeated_list_is_served_without_queries(client, seeded_users, auth_headers):
+    admin, u1, _ = _headers(auth_headers)
+    _create(client, u1)
+
+    first = client.get("/tickets?status=OPEN", headers=admin)
+    with assert_max_queries(0):
+        second = client.get("/tickets?status=OPEN", headers=admin)
+    assert second.json() == first.json()
+
+    # different filters or pages are separate entries
+    with assert_max_queries(2):
+        client.get("/tickets?status=CLOSED", headers=admin)
+
+    stats = client.get("/admin/cache/stats", headers=admin).json()["ticket_list"]
+    assert stats["hits"] >= 1
+    assert 0 < stats["hit_ratio"] < 1
+
+
+def test_writes_invalidate_only_affected_scopes(client, seeded_users, auth_headers):
+    admin, u1, u2 = _headers(auth_headers)
+    ticket = _create(client, u1)
+
+    assert client.get("/tickets", headers=admin).json()["total"] == 1
+    assert client.get("/tickets", headers=u2).json()["total"] == 0
+
+    # u1's new ticket shows up for admins at once; u2's cached view is untouched
+    _create(client, u1)
+    assert client.get("/tickets", headers=admin).json()["total"] == 2
+    with assert_max_queries(0):
+        assert client.get("/tickets", headers=u2).json()["total"] == 0
+
+    listed = client.get("/tickets", headers=u1).json()
+    client.put(f"/admin/tickets/{ticket['id']}/status", headers=admin, json={"status": "CLOSED"})
+    statuses = {t["id"]: t["status"] for t in client.get("/tickets", headers=u1).json()["items"]}
+    assert statuses[ticket["id"]] == "CLOSED"
+    assert listed != client.get("/tickets", headers=u1).json()
+
+    open_ticket = _create(client, u1)
+    client.get("/tickets", headers=u1)
+    r = client.post(f"/tickets/{open_ticket['id']}/replies", headers=u1, json={"message": "x"})
+    assert r.status_code == 201
+    with assert_max_queries(2) as stats:
+        client.get("/tickets", headers=u1)
+    assert stats.count > 0
+
+
+def test_backend_failure_falls_back_to_database():
+    class BrokenBackend(MemoryBackend):
+        def get(self, key):
+            raise ConnectionError("cache down")
+
+    cache = ResponseCache("t", BrokenBackend(max_entries=10, ttl_seconds=10), ttl_seconds=10)
+    calls = []
+    assert cache.get_or_set("all", (1,), lambda: calls.append(1) or {"ok": True}) == {"ok": True}
+    assert cache.get_or_set("all", (1,), lambda: calls.append(1) or {"ok": True}) == {"ok": True}
+    assert len(calls) == 2
@@ -0,0 +1,76 @@
+from app.db.query_stats import assert_max_queries
+
+
+def _tickets(client, headers, n):
+    return [
+        client.post(
+            "/tickets",
+            headers=headers,
+            json={"subject": f"S{i}", "description": "desc " * 5, "priority": "LOW"},
+        ).json()["id"]
+        for i in range(n)
+    ]
+
+
+def test_batch_splits_found_forbidden_and_missing(client, seeded_users, auth_headers):
+    u1, u2 = auth_headers("u1@example.com"), auth_headers("u2@example.com")
+    own, other = _tickets(client, u1, 2), _tickets(client, u2, 1)
+    ids = [own[1], 9999, other[0], own[0], own[1]]
+
+    r = client.get(f"/tickets:batch?ids={','.join(map(str, ids))}", headers=u1)
+    assert r.status_code == 200
+    body = r.json()
+    assert [t["id"] for t in body["found"]] == [own[1], own[0]]
+    assert body["found"][0]["subject"] == "S1"
+    assert body["forbidden"] == [other[0]]
+    assert body["missing"] == [9999]
+
+    r = client.post("/tickets:batch", headers=u1, json={"ids": ids})
+    assert r.json() == body
+
+    r = client.get(
+        f"/tickets:batch?ids={other[0]},{own[0]}", headers=auth_headers("admin@example.com")
+    )
+    assert [t["id"] for t in r.json()["found"]] == [other[0], own[0]]
+    assert r.json()["forbidden"] == []
+
+
+def test_batch_is_one_select(client, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+    ids = _tickets(client, user, 20)
+    client.get("/tickets", headers=user)  # warm the principal cache
+
+    with assert_max_queries(1):
+        r = client.get(f"/tickets:batch?ids={','.join(map(str, ids))},12345", headers=user)
+    assert len(r.json()["found"]) == 20
+
+    with assert_max_queries(1):
+        client.post("/tickets:batch", headers=user, json={"ids": ids})
+
+
+def test_batch_rejects_bad_ids(client, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+    assert client.get("/tickets:batch?ids=1,x", headers=user).status_code == 400
+    assert client.get("/tickets:batch?ids=,", headers=user).status_code == 400
+    assert client.post("/tickets:batch", headers=user, json={"ids": []}).status_code == 400
+
+    too_many = ",".join(str(i) for i in range(1, 102))
+    r = client.get(f"/tickets:batch?ids={too_many}", headers=user)
+    assert r.status_code == 400
+    assert "At most 100" in r.json()["error"]["message"]
+    assert client.get("/tickets:batch", headers=user).status_code == 422
+
+
+def test_batch_rejects_ids_outside_the_integer_range(client, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+    for ids in ("99999999999999999999", "0", "-3", f"1,{2**63}"):
+        r = client.get(f"/tickets:batch?ids={ids}", headers=user)
+        assert r.status_code == 400, ids
+        assert "between 1 and" in r.json()["error"]["message"]
+    assert client.get(f"/tickets:batch?ids={2**63 - 1}", headers=user).json()["missing"] == [
+        2**63 - 1
+    ]
+
+    # body validation, like the rest of the JSON schemas
+    r = client.post("/tickets:batch", headers=user, json={"ids": [1, 99999999999999999999]})
+    assert r.status_code == 422
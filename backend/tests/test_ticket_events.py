@@ -0,0 +1,85 @@
+import asyncio
+import json
+import threading
+import time
+
+from app.core import events
+from app.core.config import settings
+
+
+def _setup(client, auth_headers):
+    user = auth_headers("u1@example.com")
+    ticket = client.post(
+        "/tickets",
+        headers=user,
+        json={"subject": "S", "description": "desc " * 5, "priority": "LOW"},
+    ).json()
+    return ticket, user, auth_headers("admin@example.com")
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    out = []
+    for frame in body.split("\n\n"):
+        fields = dict(
+            line.split(": ", 1) for line in frame.splitlines() if not line.startswith(":")
+        )
+        if "event" in fields:
+            out.append((fields["event"], json.loads(fields["data"])))
+    return out
+
+
+def test_local_broker_delivers_across_threads():
+    async def run():
+        broker = events.LocalBroker(max_queue=2)
+        sub = await broker.subscribe("ticket:1")
+        threading.Thread(target=broker.publish, args=("ticket:1", "hello")).start()
+        assert await sub.get(timeout=2) == "hello"
+        assert await sub.get(timeout=0.01) is None
+        await sub.close()
+        assert broker.subscriber_count("ticket:1") == 0
+
+    asyncio.run(run())
+
+
+def test_event_stream_pushes_reply_and_status_changes(
+    client, seeded_users, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(settings, "events_max_stream_seconds", 1.5)
+    ticket, user, admin = _setup(client, auth_headers)
+    channel = events.ticket_channel(ticket["id"])
+
+    responses = []
+    listener = threading.Thread(
+        target=lambda: responses.append(client.get(f"/tickets/{ticket['id']}/events", headers=user))
+    )
+    listener.start()
+    deadline = time.monotonic() + 5
+    while events.broker.subscriber_count(channel) == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    client.post(f"/tickets/{ticket['id']}/replies", headers=user, json={"message": "ping"})
+    client.put(
+        f"/admin/tickets/{ticket['id']}/status", headers=admin, json={"status": "IN_PROGRESS"}
+    )
+    listener.join(timeout=10)
+
+    r = responses[0]
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/event-stream")
+    received = _parse_sse(r.text)
+    assert [name for name, _ in received] == ["reply_created", "status_changed"]
+    assert received[0][1]["message"] == "ping"
+    assert received[1][1] == {
+        "ticket_id": ticket["id"],
+        "old_status": "OPEN",
+        "status": "IN_PROGRESS",
+    }
+    assert events.broker.subscriber_count(channel) == 0
+
+
+def test_event_stream_checks_access(client, seeded_users, auth_headers):
+    ticket, _, _ = _setup(client, auth_headers)
+    other = auth_headers("u2@example.com")
+
+    assert client.get(f"/tickets/{ticket['id']}/events", headers=other).status_code == 403
+    assert client.get("/tickets/999/events", headers=other).status_code == 404
@@ -0,0 +1,66 @@
+import csv
+import io
+import json
+
+from app.models.ticket import Ticket
+
+
+def _seed(db_session, seeded_users):
+    owner = seeded_users["u1"]
+    db_session.add_all(
+        Ticket(
+            user_id=owner.id,
+            subject=f"Sub {i}",
+            description='needs "quoting", and commas',
+            priority="HIGH" if i % 2 else "LOW",
+        )
+        for i in range(7)
+    )
+    db_session.commit()
+
+
+def test_export_ndjson_streams_filtered_rows(
+    client, db_session, seeded_users, auth_headers, monkeypatch
+):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "export_batch_size", 2)
+    _seed(db_session, seeded_users)
+    headers = auth_headers("admin@example.com")
+
+    r = client.get("/admin/tickets/export?format=ndjson&priority=HIGH", headers=headers)
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert len(rows) == 3
+    assert {row["priority"] for row in rows} == {"HIGH"}
+    assert [row["id"] for row in rows] == sorted((row["id"] for row in rows), reverse=True)
+
+
+def test_export_csv_has_header_and_round_trips(client, db_session, seeded_users, auth_headers):
+    _seed(db_session, seeded_users)
+    headers = auth_headers("admin@example.com")
+
+    r = client.get("/admin/tickets/export?format=csv", headers=headers)
+    assert r.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(r.text)))
+    assert len(rows) == 7
+    assert rows[0]["description"] == 'needs "quoting", and commas'
+
+    empty = client.get("/admin/tickets/export?format=csv&status=CLOSED", headers=headers)
+    assert empty.text.splitlines() == [
+        "id,user_id,subject,description,status,priority,created_at,updated_at"
+    ]
+
+
+def test_export_rejects_non_admin_and_bad_range(client, db_session, seeded_users, auth_headers):
+    _seed(db_session, seeded_users)
+    user_headers = auth_headers("u1@example.com")
+    assert client.get("/admin/tickets/export", headers=user_headers).status_code == 403
+
+    admin_headers = auth_headers("admin@example.com")
+    r = client.get(
+        "/admin/tickets/export?created_from=2024-02-01T00:00:00&created_to=2024-01-01T00:00:00",
+        headers=admin_headers,
+    )
+    assert r.status_code == 400
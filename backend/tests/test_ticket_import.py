@@ -0,0 +1,153 @@
+import json
+
+from sqlalchemy import func, select
+
+from app.core.security import hash_password
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+from app.models.user import User
+
+
+def _user(db_session, email, role="USER"):
+    user = User(email=email, password_hash=hash_password("password123"), role=role)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+def _token(client, email):
+    return client.post("/auth/login", json={"email": email, "password": "password123"}).json()[
+        "access_token"
+    ]
+
+
+def _ndjson(*records):
+    return "\n".join(r if isinstance(r, str) else json.dumps(r) for r in records) + "\n"
+
+
+def test_admin_imports_ndjson_with_replies_and_row_errors(client, db_session):
+    _user(db_session, "admin@example.com", role="ADMIN")
+    owner = _user(db_session, "legacy@example.com")
+    token = _token(client, "admin@example.com")
+
+    body = _ndjson(
+        {
+            "id": 500,
+            "user_id": owner.id,
+            "subject": "Printer on fire",
+            "description": "It is still burning, please help",
+            "priority": "HIGH",
+            "status": "CLOSED",
+            "created_at": "2021-03-04T10:00:00Z",
+        },
+        {"type": "reply", "ticket_id": 500, "author_id": owner.id, "message": "Fixed"},
+        {"user_id": owner.id, "subject": "x", "description": "short", "priority": "LOW"},
+        "{not json",
+        {"type": "attachment"},
+    )
+    r = client.post(
+        "/admin/tickets/import?format=ndjson&batch_size=2",
+        headers={"Authorization": f"Bearer {token}"},
+        content=body,
+    )
+    assert r.status_code == 200
+    report = r.json()
+    assert report["processed"] == 5
+    assert (report["tickets"], report["replies"], report["failed"]) == (1, 1, 3)
+    assert [e["line"] for e in report["errors"]] == [3, 4, 5]
+    assert "description" in report["errors"][0]["message"]
+
+    ticket = db_session.get(Ticket, 500)
+    assert ticket.status == "CLOSED"
+    assert ticket.created_at.isoformat() == "2021-03-04T10:00:00"
+    assert ticket.reply_count == 1 and ticket.last_reply_author_id == owner.id
+    assert db_session.scalar(select(func.count()).select_from(TicketReply)) == 1
+
+
+def test_import_csv_isolates_rows_rejected_by_database(client, db_session):
+    _user(db_session, "admin@example.com", role="ADMIN")
+    owner = _user(db_session, "legacy@example.com")
+    token = _token(client, "admin@example.com")
+
+    body = (
+        "id,user_id,subject,description,priority,status\n"
+        f"10,{owner.id},First,First legacy ticket,LOW,OPEN\n"
+        f"10,{owner.id},Dup,Duplicate legacy id,LOW,\n"
+        f",{owner.id},Third,Without a legacy id,MEDIUM,RESOLVED\n"
+    )
+    r = client.post(
+        "/admin/tickets/import?format=csv",
+        headers={"Authorization": f"Bearer {token}"},
+        content=body,
+    )
+    assert r.status_code == 200
+    report = r.json()
+    assert (report["tickets"], report["failed"]) == (2, 1)
+    assert report["errors"][0]["line"] == 3
+    assert db_session.scalar(select(func.count()).select_from(Ticket)) == 2
+
+
+def test_import_requires_admin(client, db_session):
+    _user(db_session, "u1@example.com")
+    token = _token(client, "u1@example.com")
+
+    r = client.post(
+        "/admin/tickets/import",
+        headers={"Authorization": f"Bearer {token}"},
+        content=_ndjson({"user_id": 1}),
+    )
+    assert r.status_code == 403
+
+
+def test_import_reports_rows_referencing_missing_users_or_tickets(client, db_session):
+    _user(db_session, "admin@example.com", role="ADMIN")
+    owner = _user(db_session, "legacy@example.com")
+    token = _token(client, "admin@example.com")
+
+    ticket = {"subject": "Legacy", "description": "Imported from the old desk", "priority": "LOW"}
+    body = _ndjson(
+        {"id": 700, "user_id": owner.id, **ticket},
+        {"user_id": 9999, **ticket},
+        {"type": "reply", "ticket_id": 700, "author_id": owner.id, "message": "Thanks"},
+        {"type": "reply", "ticket_id": 700, "author_id": 9999, "message": "Ghost"},
+        {"type": "reply", "ticket_id": 9999, "author_id": owner.id, "message": "Orphan"},
+    )
+    r = client.post(
+        "/admin/tickets/import?format=ndjson",
+        headers={"Authorization": f"Bearer {token}"},
+        content=body,
+    )
+    assert r.status_code == 200
+    report = r.json()
+    assert (report["tickets"], report["replies"], report["failed"]) == (1, 1, 3)
+    errors = {e["line"]: e["message"] for e in report["errors"]}
+    assert errors == {
+        2: "user_id: no such user 9999",
+        4: "author_id: no such author 9999",
+        5: "ticket_id: no such ticket 9999",
+    }
+    assert db_session.scalar(select(func.count()).select_from(Ticket)) == 1
+    assert db_session.scalar(select(func.count()).select_from(TicketReply)) == 1
+
+
+def test_import_rejects_non_utf8_file(client, db_session):
+    admin = _user(db_session, "admin@example.com", role="ADMIN")
+    headers = {"Authorization": f"Bearer {_token(client, 'admin@example.com')}"}
+    row = {"user_id": admin.id, "subject": "S", "description": "Imported row", "priority": "LOW"}
+    latin1 = f'{{"user_id": {admin.id}, "subject": "Caf\xe9", "description": "legacy row"}}\n'
+
+    for fmt, body in (
+        ("ndjson", latin1.encode("latin-1")),
+        ("csv", f"user_id,subject,description\n{admin.id},Caf\xe9,legacy row\n".encode("latin-1")),
+    ):
+        r = client.post(f"/admin/tickets/import?format={fmt}", headers=headers, content=body)
+        assert r.status_code == 400, fmt
+        assert r.json()["error"]["message"] == "file must be UTF-8"
+    assert db_session.scalar(select(func.count()).select_from(Ticket)) == 0
+
+    # invalid bytes past the first batches: those batches are already in
+    body = (_ndjson(row, row) + " " * 20_000 + "\n").encode() + latin1.encode("latin-1")
+    r = client.post("/admin/tickets/import?batch_size=1", headers=headers, content=body)
+    assert r.status_code == 400
+    message = r.json()["error"]["message"]
+    assert message == "file must be UTF-8 (2 rows before the invalid bytes were imported)"
@@ -0,0 +1,88 @@
+from sqlalchemy import text
+
+from app.models.reply import TicketReply
+from app.models.ticket import Ticket
+
+
+def _seed(db_session, seeded_users):
+    u1, u2 = seeded_users["u1"], seeded_users["u2"]
+
+    def ticket(user, subject, description):
+        t = Ticket(user_id=user.id, subject=subject, description=description, priority="LOW")
+        db_session.add(t)
+        db_session.commit()
+        return t
+
+    strong = ticket(u1, "Refund please", "I want a refund for my refund-eligible order")
+    weak = ticket(u1, "Billing question", "Maybe a refund, not sure yet")
+    via_reply = ticket(u1, "Order stuck", "The parcel has not moved in a week")
+    db_session.add(
+        TicketReply(ticket_id=via_reply.id, author_id=u1.id, message="Now I want a refund")
+    )
+    ticket(u1, "Login broken", "Cannot sign in since yesterday")
+    other = ticket(u2, "Refund", "Refund for someone else entirely")
+    db_session.commit()
+    return strong, weak, via_reply, other
+
+
+def test_search_ranks_and_scopes_to_own_tickets(client, db_session, seeded_users, auth_headers):
+    strong, weak, via_reply, other = _seed(db_session, seeded_users)
+    headers = auth_headers("u1@example.com")
+
+    r = client.get("/tickets/search?q=refund", headers=headers)
+    assert r.status_code == 200
+    body = r.json()
+    ids = [item["id"] for item in body["items"]]
+    assert body["total"] == 3
+    assert set(ids) == {strong.id, weak.id, via_reply.id}
+    assert ids[0] == strong.id
+    assert other.id not in ids
+    scores = [item["score"] for item in body["items"]]
+    assert scores == sorted(scores, reverse=True)
+
+    page2 = client.get("/tickets/search?q=refund&page=2&page_size=2", headers=headers).json()
+    assert [item["id"] for item in page2["items"]] == ids[2:]
+
+
+def test_admin_search_sees_all_and_follows_edits(client, db_session, seeded_users, auth_headers):
+    strong, weak, via_reply, other = _seed(db_session, seeded_users)
+    headers = auth_headers("admin@example.com")
+
+    body = client.get("/tickets/search?q=refund", headers=headers).json()
+    assert body["total"] == 4
+
+    # FTS triggers keep the index in step with updates and deletes
+    strong.subject = "Chargeback"
+    strong.description = "Card issuer disputes the payment"
+    db_session.delete(other)
+    db_session.commit()
+    ids = [i["id"] for i in client.get("/tickets/search?q=refund", headers=headers).json()["items"]]
+    assert sorted(ids) == sorted([weak.id, via_reply.id])
+    assert client.get("/tickets/search?q=chargeback", headers=headers).json()["total"] == 1
+
+
+def test_search_input_is_not_fts_syntax(client, db_session, seeded_users, auth_headers):
+    _seed(db_session, seeded_users)
+    headers = auth_headers("u1@example.com")
+
+    r = client.get('/tickets/search?q=refund" OR subject:*', headers=headers)
+    assert r.status_code == 200
+    assert r.json()["total"] == 3
+
+    assert client.get("/tickets/search?q=%22%29%28", headers=headers).status_code == 400
+
+
+def test_upgrade_creates_and_backfills_missing_fts_table(
+    client, db_session, seeded_users, auth_headers
+):
+    from app.db.migrations import upgrade
+    from tests.conftest import engine
+
+    strong, *_ = _seed(db_session, seeded_users)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE tickets_fts"))
+
+    assert "tickets_fts" in upgrade(engine)
+    headers = auth_headers("u1@example.com")
+    ids = [i["id"] for i in client.get("/tickets/search?q=refund", headers=headers).json()["items"]]
+    assert strong.id in ids
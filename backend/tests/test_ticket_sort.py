@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.crud.tickets import SORT_KEYS
+from app.db.migrations import upgrade
+from app.domain.enums import TicketSort
+from app.models.ticket import Ticket
+from app.utils.pagination import Cursor, encode_cursor
+from tests.conftest import engine
+
+T0 = datetime(2024, 1, 1)
+
+
+def _seed(db_session, users):
+    """
+    18 tickets with deliberate ties: created_at repeats every 3, updated_at
+    every 4, and a third never got a reply (last_reply_at NULL).
+    """
+    priorities = ("LOW", "MEDIUM", "HIGH")
+    for i in range(18):
+        owner = users["u1"] if i % 2 else users["u2"]
+        db_session.add(
+            Ticket(
+                user_id=owner.id,
+                subject=f"T{i}",
+                description="desc " * 5,
+                priority=priorities[i * 7 % 3],
+                status="OPEN" if i % 5 else "CLOSED",
+                created_at=T0 + timedelta(hours=i // 3),
+                updated_at=T0 + timedelta(days=1, hours=(17 - i) // 4),
+                last_reply_at=None if i % 3 == 0 else T0 + timedelta(days=2, hours=i % 4),
+            )
+        )
+    db_session.commit()
+    return db_session.query(Ticket).all()
+
+
+def _expected(tickets, sort, keep=lambda t: True):
+    keys, descending = SORT_KEYS[sort]
+
+    def key(t):
+        # NULL sorts lowest, as on SQLite and MySQL
+        values = [getattr(t, c.key) for c in keys]
+        return [(v is not None, v) for v in values] + [(True, t.id)]
+
+    ordered = sorted((t for t in tickets if keep(t)), key=key, reverse=descending)
+    return [t.id for t in ordered]
+
+
+def _walk(client, headers, query):
+    ids, cursor = [], None
+    while True:
+        url = f"/tickets?page_size=4&include_total=false&{query}"
+        r = client.get(url + (f"&cursor={cursor}" if cursor else ""), headers=headers)
+        assert r.status_code == 200, r.text
+        body = r.json()
+        ids += [item["id"] for item in body["items"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.parametrize("sort", list(TicketSort))
+def test_every_sort_pages_by_keyset_without_gaps(
+    client, db_session, seeded_users, auth_headers, sort
+):
+    tickets = _seed(db_session, seeded_users)
+    admin, user = auth_headers("admin@example.com"), auth_headers("u1@example.com")
+    u1 = seeded_users["u1"].id
+
+    assert _walk(client, admin, f"sort={sort}") == _expected(tickets, sort)
+    assert _walk(client, admin, f"sort={sort}&status=OPEN") == _expected(
+        tickets, sort, lambda t: t.status == "OPEN"
+    )
+    assert _walk(client, user, f"sort={sort}") == _expected(
+        tickets, sort, lambda t: t.user_id == u1
+    )
+
+    # offset pages agree with the keyset walk
+    r = client.get(f"/tickets?sort={sort}&page=2&page_size=4", headers=admin)
+    assert [i["id"] for i in r.json()["items"]] == _expected(tickets, sort)[4:8]
+
+
+def test_priority_sort_uses_numeric_rank(client, db_session, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+    for priority in ("MEDIUM", "HIGH", "LOW"):
+        client.post(
+            "/tickets",
+            headers=user,
+            json={"subject": "S", "description": "desc " * 5, "priority": priority},
+        )
+    r = client.get("/tickets?sort=priority", headers=user)
+    # string order would put MEDIUM before LOW and HIGH first
+    assert [i["priority"] for i in r.json()["items"]] == ["HIGH", "MEDIUM", "LOW"]
+    ranks = db_session.execute(text("SELECT priority, priority_rank FROM tickets")).all()
+    assert sorted(ranks) == [("HIGH", 3), ("LOW", 1), ("MEDIUM", 2)]
+
+
+def test_unknown_sort_and_foreign_cursor_are_rejected(client, seeded_users, auth_headers):
+    user = auth_headers("u1@example.com")
+
+    r = client.get("/tickets?sort=subject", headers=user)
+    assert r.status_code == 400
+    assert "Unknown sort" in r.json()["error"]["message"]
+
+    cursor = encode_cursor(Cursor(keys=(T0,), id=1, sort="updated"))
+    r = client.get(f"/tickets?sort=newest&cursor={cursor}", headers=user)
+    assert r.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "sort, keys",
+    [
+        ("newest", ()),  # too few keys
+        ("newest", (T0, T0)),  # too many
+        ("newest", (5,)),  # int where a timestamp belongs
+        ("newest", (None,)),  # created_at is never NULL
+        ("priority", (T0, T0)),  # timestamp where priority_rank belongs
+        ("priority", (True, T0)),
+    ],
+)
+def test_cursor_keys_must_fit_the_sort(client, seeded_users, auth_headers, sort, keys):
+    cursor = encode_cursor(Cursor(keys=keys, id=5, sort=sort))
+    r = client.get(f"/tickets?sort={sort}&cursor={cursor}", headers=auth_headers("u1@example.com"))
+    assert r.status_code == 400
+    assert r.json()["error"]["message"] == "Invalid cursor"
+
+
+def _plan(sql: str) -> str:
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+@pytest.mark.parametrize("sort", list(TicketSort))
+@pytest.mark.parametrize("scope", ["", "WHERE status = 'OPEN'", "WHERE user_id = 1"])
+def test_every_sort_reads_an_index_in_order(sort, scope):
+    keys, descending = SORT_KEYS[sort]
+    direction = "DESC" if descending else "ASC"
+    order = ", ".join(f"{c.key} {direction}" for c in (*keys, Ticket.id))
+    plan = _plan(f"SELECT * FROM tickets {scope} ORDER BY {order} LIMIT 10")
+    assert "USING INDEX ix_tickets_" in plan
+    assert "TEMP B-TREE" not in plan  # no filesort
+
+
+def test_upgrade_adds_and_backfills_priority_rank(db_session, seeded_users):
+    _seed(db_session, seeded_users)
+    db_session.close()
+    with engine.begin() as conn:
+        for ix in Ticket.__table__.indexes:
+            if "priority_rank" in ix.columns:
+                conn.execute(text(f"DROP INDEX {ix.name}"))
+        conn.execute(text("ALTER TABLE tickets DROP COLUMN priority_rank"))
+
+    created = upgrade(engine)
+    assert "tickets.priority_rank" in created
+    assert "ix_tickets_status_rank_created_id" in created
+    with engine.connect() as conn:
+        ranks = conn.execute(
+            text("SELECT DISTINCT priority, priority_rank FROM tickets ORDER BY priority_rank")
+        ).all()
+    assert [tuple(r) for r in ranks] == [("LOW", 1), ("MEDIUM", 2), ("HIGH", 3)]
@@ -31,7 +31,7 @@ def test_user_can_create_and_list_own_tickets(client):
     assert r.status_code == 200
     body = r.json()
 
-    assert set(body.keys()) == {"items", "page", "page_size", "total"}
+    assert set(body.keys()) == {"items", "page", "page_size", "total", "next_cursor"}
     assert body["total"] == 3
     assert len(body["items"]) == 3
 
@@ -79,3 +79,72 @@ def test_pagination_works(client):
     assert r2.status_code == 200
     body2 = r2.json()
     assert len(body2["items"]) == 5
+
+
+def test_cursor_pagination_walks_all_tickets(client):
+    _signup(client, "u1@example.com")
+    token = _login(client, "u1@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for i in range(7):
+        client.post(
+            "/tickets",
+            headers=headers,
+            json={"subject": f"S{i}", "description": "desc " * 5, "priority": "LOW"},
+        )
+
+    seen = []
+    r = client.get("/tickets?page_size=3", headers=headers)
+    body = r.json()
+    seen.extend(t["id"] for t in body["items"])
+
+    while body["next_cursor"]:
+        r = client.get(
+            "/tickets", params={"page_size": 3, "cursor": body["next_cursor"]}, headers=headers
+        )
+        assert r.status_code == 200
+        body = r.json()
+        seen.extend(t["id"] for t in body["items"])
+
+    # newest first, no gaps or duplicates across pages
+    assert seen == sorted(seen, reverse=True)
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_invalid_cursor_returns_400(client):
+    _signup(client, "u1@example.com")
+    token = _login(client, "u1@example.com")
+
+    r = client.get(
+        "/tickets?cursor=not-a-cursor", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert r.status_code == 400
+
+
+def test_include_total_modes(client):
+    _signup(client, "u1@example.com")
+    token = _login(client, "u1@example.com")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def create(i):
+        client.post(
+            "/tickets",
+            headers=headers,
+            json={"subject": f"S{i}", "description": "desc " * 5, "priority": "LOW"},
+        )
+
+    create(1)
+    create(2)
+
+    r = client.get("/tickets?include_total=false", headers=headers)
+    assert r.json()["total"] is None
+    assert len(r.json()["items"]) == 2
+
+    assert client.get("/tickets?include_total=estimate", headers=headers).json()["total"] == 2
+
+    # estimate is served from the short-TTL cache; exact always recounts
+    create(3)
+    assert client.get("/tickets?include_total=estimate", headers=headers).json()["total"] == 2
+    assert client.get("/tickets?include_total=exact", headers=headers).json()["total"] == 3
+
+    assert client.get("/tickets?include_total=bogus", headers=headers).status_code == 422
@@ -105,6 +105,7 @@ replies_page_size = rcols[1].selectbox(
     index=[10, 20, 50, 100].index(int(st.session_state["replies_page_size"])),
 )
 refresh = rcols[2].button("Refresh Replies")
+live = rcols[2].toggle("Live updates", key="ticket_live_updates")
 
 # persist
 st.session_state["replies_page"] = int(replies_page)
@@ -185,3 +186,15 @@ if st.button("Send Reply", type="primary", disabled=send_disabled):
         st.rerun()
     except ApiError as err:
         show_api_error(err)
+
+# ----------------------------
+# Live updates: wait on the ticket's event stream instead of polling
+# ----------------------------
+if live:
+    try:
+        # returns on the first event or after the timeout; rerun either way
+        api.wait_for_event(ticket_id=int(ticket_id))
+    except ApiError as err:
+        show_api_error(err)
+        st.stop()
+    st.rerun()
@@ -24,6 +24,19 @@ with st.sidebar:
     page = st.number_input("Page", min_value=1, value=1, step=1)
     page_size = st.selectbox("Page Size", [5, 10, 20, 50], index=1)
 
+with st.expander("Overview"):
+    try:
+        stats = api.ticket_stats()
+    except ApiError as err:
+        show_api_error(err)
+    else:
+        cols = st.columns(len(stats["by_status"]) + 1)
+        cols[0].metric("All tickets", stats["total"])
+        for col, (name, count) in zip(cols[1:], sorted(stats["by_status"].items())):
+            col.metric(name, count)
+        if stats["per_day"]:
+            st.bar_chart({d["day"]: d["count"] for d in stats["per_day"]})
+
 try:
     with st.spinner("Loading all tickets..."):
         data = api.list_tickets(
@@ -42,6 +55,26 @@ if not items:
     st.info("No tickets.")
     st.stop()
 
+with st.expander("Bulk status update"):
+    bulk_ids = st.multiselect(
+        "Tickets", [t["id"] for t in items], format_func=lambda i: f"#{i}"
+    )
+    bulk_status = st.selectbox(
+        "New status", ["IN_PROGRESS", "RESOLVED", "CLOSED"], key="bulk_status"
+    )
+    if st.button("Apply to selected", disabled=not bulk_ids):
+        try:
+            with st.spinner("Updating..."):
+                result = api.bulk_update_status(ticket_ids=bulk_ids, status=bulk_status)
+            failed = [r for r in result["results"] if not r["ok"]]
+            st.success(f"{result['succeeded']} ticket(s) updated.")
+            for r in failed:
+                st.warning(f"#{r['id']}: {r['error']}")
+            if not failed:
+                st.rerun()
+        except ApiError as err:
+            show_api_error(err)
+
 for t in items:
     with st.container(border=True):
         cols = st.columns([1, 2, 2, 3, 2])
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import json as jsonlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
 
@@ -22,6 +26,36 @@ class ApiError(Exception):
         super().__init__(self.message)
 
 
+class EtagCache:
+    """
+    GET responses that carried an ETag, keyed by (token, url, params). Shared
+    by every ApiClient in the process because pages build a new client on
+    each Streamlit rerun. Keying by token keeps users' copies apart.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> tuple[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, etag: str, data: Any) -> None:
+        with self._lock:
+            self._entries[key] = (etag, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+etag_cache = EtagCache()
+
+
 class ApiClient:
     def __init__(self, base_url: str, token: str | None = None, timeout: int = 20):
         self.base_url = base_url.rstrip("/")
@@ -46,15 +80,31 @@ class ApiClient:
         params: dict[str, Any] | None = None,
     ) -> Any:
         url = f"{self.base_url}{path}"
+        headers = self._headers()
+
+        cache_key = cached = None
+        if method == "GET":
+            cache_key = (self.token, url, tuple(sorted((params or {}).items())))
+            cached = etag_cache.get(cache_key)
+            if cached:
+                headers["If-None-Match"] = cached[0]
+
         resp = requests.request(
             method=method,
             url=url,
             json=json,
             params=params,
-            headers=self._headers(),
+            headers=headers,
             timeout=self.timeout,
         )
-        return self._handle(resp)
+        if resp.status_code == 304 and cached:
+            return cached[1]
+
+        data = self._handle(resp)
+        etag = resp.headers.get("ETag")
+        if cache_key and etag:
+            etag_cache.put(cache_key, etag, data)
+        return data
 
     def _handle(self, resp: requests.Response) -> Any:
         try:
@@ -112,7 +162,10 @@ class ApiClient:
         priority: str | None = None,
         created_from: str | None = None,
         created_to: str | None = None,
+        cursor: str | None = None,
+        include_total: str | None = None,
     ) -> dict[str, Any]:
+        # Pass the previous response's next_cursor to seek instead of paging by offset.
         params: dict[str, Any] = {"page": page, "page_size": page_size}
         if status:
             params["status"] = status
@@ -122,8 +175,18 @@ class ApiClient:
             params["created_from"] = created_from
         if created_to:
             params["created_to"] = created_to
+        if cursor:
+            params["cursor"] = cursor
+        if include_total:
+            # "exact" (server default), "estimate" or "false"
+            params["include_total"] = include_total
         return self.request("GET", "/tickets", params=params)
 
+    def search_tickets(self, q: str, page: int = 1, page_size: int = 10) -> dict[str, Any]:
+        return self.request(
+            "GET", "/tickets/search", params={"q": q, "page": page, "page_size": page_size}
+        )
+
     def get_ticket(self, ticket_id: int) -> dict[str, Any]:
         return self.request("GET", f"/tickets/{ticket_id}")
 
@@ -142,12 +205,57 @@ class ApiClient:
             "POST", f"/tickets/{ticket_id}/replies", json={"message": message}
         )
 
+    def wait_for_event(self, ticket_id: int, timeout: float = 25) -> dict[str, Any] | None:
+        """
+        Block until the ticket's SSE stream delivers an event
+        ({"event": ..., "data": {...}}) or timeout seconds pass (None).
+        """
+        deadline = time.monotonic() + timeout
+        with requests.get(
+            f"{self.base_url}/tickets/{ticket_id}/events",
+            headers=self._headers(),
+            stream=True,
+            # read timeout bounds each wait between heartbeats
+            timeout=(self.timeout, timeout),
+        ) as resp:
+            if resp.status_code >= 400:
+                self._handle(resp)
+            event = None
+            try:
+                for line in resp.iter_lines(decode_unicode=True):
+                    if line.startswith("event: "):
+                        event = line[len("event: ") :]
+                    elif line.startswith("data: ") and event:
+                        return {"event": event, "data": jsonlib.loads(line[len("data: ") :])}
+                    if time.monotonic() >= deadline:
+                        return None
+            except requests.exceptions.ReadTimeout:
+                return None
+        return None
+
     # -------- Admin --------
     def update_status(self, ticket_id: int, status: str) -> dict[str, Any]:
         return self.request(
             "PUT", f"/admin/tickets/{ticket_id}/status", json={"status": status}
         )
 
+    def ticket_stats(
+        self, created_from: str | None = None, created_to: str | None = None
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if created_from:
+            params["created_from"] = created_from
+        if created_to:
+            params["created_to"] = created_to
+        return self.request("GET", "/admin/stats", params=params)
+
+    def bulk_update_status(self, ticket_ids: list[int], status: str) -> dict[str, Any]:
+        return self.request(
+            "POST",
+            "/admin/tickets/status:bulk",
+            json={"ids": ticket_ids, "status": status},
+        )
+
 
 def get_api_base_url() -> str:
     return os.getenv("API_BASE_URL", "http://127.0.0.1:8000").rstrip("/")